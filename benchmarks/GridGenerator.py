@@ -0,0 +1,181 @@
+"""
+This module contains the GridGenerator class, which builds seeded grids for the benchmarks.
+"""
+
+import random
+from array import array
+
+from src.grid.GridModel import GridModel, EMPTY, OBSTACLE, START, END
+
+class GridGenerator:
+    """
+    Class that generates reproducible grid models.
+
+    The grids are built directly in the states array of a GridModel. Every generator
+    puts the start cell in the top left corner and the end cell in the bottom right
+    corner of the grid, so that searches have to cross the whole map.
+
+    Attributes:
+        seed (int): The seed of the random number generator.
+        rng (random.Random): The random number generator.
+    """
+
+    # Names of the kinds of grid which can be generated
+    kinds = ['random', 'maze', 'rooms']
+
+    def __init__(self, seed: int = 0) -> None:
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def generate(self, kind: str, size: int, density: float = 0.0) -> GridModel:
+        """
+        Generate a square grid of a given kind.
+
+        Args:
+            kind (str): one of 'random', 'maze' or 'rooms'.
+            size (int): the number of rows and columns of the grid.
+            density (float): the fraction of obstacles, used by random grids only.
+
+        Returns:
+            GridModel: the generated grid.
+        """
+        if kind == 'random':
+            return self.randomGrid(size, size, density)
+        if kind == 'maze':
+            return self.mazeGrid(size, size)
+        if kind == 'rooms':
+            return self.roomsGrid(size, size)
+        raise ValueError(f"Unknown kind of grid: {kind}")
+
+    def placeStartEnd(self, model: GridModel) -> None:
+        """
+        Put the start cell in the top left and the end cell in the bottom right corner.
+
+        Args:
+            model (GridModel): the grid to update.
+        """
+        model.states[0] = START
+        model.states[len(model.states) - 1] = END
+
+    def addTerrain(self, model: GridModel, maxCost: int, patchSize: int = 8) -> None:
+        """
+        Give the cells of a grid movement costs, in square patches of equal cost.
+
+        Args:
+            model (GridModel): the grid to update.
+            maxCost (int): the highest movement cost, costs are integers from 1 to maxCost.
+            patchSize (int): the number of rows and columns of a patch.
+        """
+        rows, cols = model.rows, model.cols
+        randint = self.rng.randint
+        costs = array('d')
+        for top in range(0, rows, patchSize):
+            patches = [float(randint(1, maxCost)) for _ in range(0, cols, patchSize)]
+            row = array('d', (patches[col // patchSize] for col in range(cols)))
+            for _ in range(min(patchSize, rows - top)):
+                costs.extend(row)
+        model.costs = costs
+
+    def randomGrid(self, rows: int, cols: int, density: float) -> GridModel:
+        """
+        Generate a grid with obstacles scattered uniformly at random.
+
+        Args:
+            rows (int): number of rows.
+            cols (int): number of columns.
+            density (float): the probability of a cell being an obstacle.
+
+        Returns:
+            GridModel: the generated grid.
+        """
+        model = GridModel(rows, cols)
+        rand = self.rng.random
+        model.states[:] = bytes(OBSTACLE if rand() < density else EMPTY for _ in range(rows * cols))
+        self.placeStartEnd(model)
+        return model
+
+    def mazeGrid(self, rows: int, cols: int) -> GridModel:
+        """
+        Generate a perfect maze with corridors one cell wide.
+
+        The maze is carved with an iterative depth-first backtracker over the
+        cells with even coordinates, so that there is exactly one path between
+        any two corridor cells.
+
+        Args:
+            rows (int): number of rows.
+            cols (int): number of columns.
+
+        Returns:
+            GridModel: the generated grid.
+        """
+        model = GridModel(rows, cols)
+        states = model.states
+        states[:] = bytes([OBSTACLE]) * (rows * cols)
+
+        states[0] = EMPTY
+        stack = [(0, 0)]
+        while stack:
+            row, col = stack[-1]
+            options = []
+            for dr, dc in [(-2, 0), (2, 0), (0, -2), (0, 2)]:
+                nr, nc = row + dr, col + dc
+                if 0 <= nr < rows and 0 <= nc < cols and states[nr * cols + nc] == OBSTACLE:
+                    options.append((nr, nc))
+            if not options:
+                stack.pop()
+                continue
+            nr, nc = self.rng.choice(options)
+            states[((row + nr) // 2) * cols + (col + nc) // 2] = EMPTY
+            states[nr * cols + nc] = EMPTY
+            stack.append((nr, nc))
+
+        # Connect the bottom right corner to the last maze cell when the size is even
+        row, col = rows - 1, cols - 1
+        last_row, last_col = row - row % 2, col - col % 2
+        while row > last_row:
+            states[row * cols + col] = EMPTY
+            row -= 1
+        while col > last_col:
+            states[row * cols + col] = EMPTY
+            col -= 1
+
+        self.placeStartEnd(model)
+        return model
+
+    def roomsGrid(self, rows: int, cols: int, roomSize: int = 16) -> GridModel:
+        """
+        Generate a grid of open rooms separated by walls with one door per wall.
+
+        Args:
+            rows (int): number of rows.
+            cols (int): number of columns.
+            roomSize (int): the distance between two parallel walls.
+
+        Returns:
+            GridModel: the generated grid.
+        """
+        model = GridModel(rows, cols)
+        states = model.states
+        randint = self.rng.randint
+
+        for wall in range(roomSize, rows, roomSize):
+            states[wall * cols:(wall + 1) * cols] = bytes([OBSTACLE]) * cols
+        for wall in range(roomSize, cols, roomSize):
+            for row in range(rows):
+                states[row * cols + wall] = OBSTACLE
+
+        # Open one door in every wall segment between two crossings
+        for wall in range(roomSize, rows, roomSize):
+            for left in range(0, cols, roomSize):
+                right = min(left + roomSize, cols)
+                if right - left > 1:
+                    states[wall * cols + randint(left + 1, right - 1)] = EMPTY
+        for wall in range(roomSize, cols, roomSize):
+            for top in range(0, rows, roomSize):
+                bottom = min(top + roomSize, rows)
+                if bottom - top > 1:
+                    states[randint(top + 1, bottom - 1) * cols + wall] = EMPTY
+
+        self.placeStartEnd(model)
+        return model
@@ -0,0 +1,292 @@
+"""
+Headless benchmark suite for the search engines.
+
+Generates seeded grids of several sizes and kinds, runs every search engine on
+them without any visual delays and reports preprocessing and wall time, expanded nodes, open list
+pushes and decrease-keys, peak frontier size and peak memory, as a table and optionally as JSON.
+
+Usage:
+    python benchmarks/benchmark.py --sizes 64 256 1024 --densities 0 0.2 0.4 --json results.json
+
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+# Add the repository root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from benchmarks.GridGenerator import GridGenerator
+
+from src.engine.BFSEngine import BFSEngine
+from src.engine.DFSEngine import DFSEngine
+from src.engine.DijkstraEngine import DijkstraEngine
+from src.engine.AStarEngine import AStarEngine
+from src.engine.GBFSEngine import GBFSEngine
+from src.engine.JPSEngine import JPSEngine
+from src.engine.JPSPlusEngine import JPSPlusEngine
+from src.engine.BidirectionalEngine import BidirectionalEngine
+from src.engine.BidirectionalAStarEngine import BidirectionalAStarEngine
+from src.engine.WavefrontEngine import WavefrontEngine
+from src.engine.FieldEngine import FieldEngine
+from src.engine.DStarLiteEngine import DStarLiteEngine
+from src.engine.HPAStarEngine import HPAStarEngine
+from src.engine.IDAStarEngine import IDAStarEngine
+from src.engine.FringeSearchEngine import FringeSearchEngine
+from src.engine.SMAStarEngine import SMAStarEngine
+from src.engine.BucketOpenList import BucketOpenList
+from src.engine.HeapOpenList import HeapOpenList
+from src.engine.IndexedHeap import IndexedHeap
+from src.engine.ComponentIndex import ComponentIndex
+from src.engine.LandmarkTable import LandmarkTable
+from src.engine.SearchResult import SearchResult
+
+# Dictionary mapping algorithm key to engine class, using the keys of the GUI
+algorithmToEngineMap = {
+    'bfs': BFSEngine,
+    'dfs': DFSEngine,
+    'dijkstra': DijkstraEngine,
+    'astar': AStarEngine,
+    'gbfs': GBFSEngine,
+    'jps': JPSEngine,
+    'jpsplus': JPSPlusEngine,
+    'bisearch': BidirectionalEngine,
+    'biastar': BidirectionalAStarEngine,
+    'field': FieldEngine,
+    'dstar': DStarLiteEngine,
+    'hpa': HPAStarEngine,
+    'ida': IDAStarEngine,
+    'fringe': FringeSearchEngine,
+    'sma': SMAStarEngine
+}
+
+# The wavefront engine needs numpy, which is optional
+if WavefrontEngine.available:
+    algorithmToEngineMap['wavefront'] = WavefrontEngine
+
+# IDA* starts over for every f_cost threshold, which takes minutes on the larger mazes,
+# so it only runs when it is asked for
+defaultAlgorithms = [name for name in algorithmToEngineMap if name != 'ida']
+
+# Engines which hold at most maxNodes cells or nodes in memory
+boundedEngines = [engineClass for engineClass in algorithmToEngineMap.values() if hasattr(engineClass, 'maxNodes')]
+
+# Dictionary mapping open list key to open list class, None keeps the default of each engine
+openListMap = {
+    'default': None,
+    'bucket': BucketOpenList,
+    'heap': HeapOpenList,
+    'indexed': IndexedHeap
+}
+
+# Dictionary mapping heuristic key to heuristic provider class, None keeps the Manhattan
+# distance, or the octile distance for the engines moving diagonally on 8-connected grids
+heuristicMap = {
+    'manhattan': None,
+    'alt': LandmarkTable
+}
+
+# Columns of the report table: (record key, header, alignment, width, number format)
+tableColumns = [
+    ('grid', 'grid', '<', 8, ''),
+    ('size', 'size', '>', 6, ''),
+    ('density', 'density', '>', 7, '.2f'),
+    ('algorithm', 'algorithm', '<', 10, ''),
+    ('found', 'found', '<', 5, ''),
+    ('cost', 'cost', '>', 8, '.8g'),
+    ('preprocess', 'prep (ms)', '>', 9, '.2f'),
+    ('time', 'time (ms)', '>', 10, '.2f'),
+    ('expanded', 'expanded', '>', 9, ''),
+    ('pushes', 'pushes', '>', 9, ''),
+    ('decreaseKeys', 'decreases', '>', 9, ''),
+    ('peakFrontier', 'frontier', '>', 8, ''),
+    ('peakMemory', 'memory (KiB)', '>', 12, ''),
+]
+
+def runEngine(engineClass, grid, repeat: int, measureMemory: bool, openListClass=None, heuristic=None) -> dict:
+    """
+    Run a search engine on a grid and measure it.
+
+    The data the engine precomputes for the grid, e.g. the jump table of JPS+,
+    is built first and timed on its own, so that the wall time is the best of
+    `repeat` queries on the prepared grid. Peak memory is measured in a
+    separate run, since tracing allocations slows the search down. The cells
+    it expands are only counted, so that the peak is the memory of the search
+    itself, rather than of the list of every cell expanded so far.
+
+    Args:
+        engineClass (type): The search engine class.
+        grid (GridModel): The grid to search on.
+        repeat (int): The number of timed runs.
+        measureMemory (bool): Whether to measure the peak memory.
+        openListClass (type): The open list of best-first engines, None for the default one.
+        heuristic (Callable): The heuristic of the engines, None for the Manhattan distance.
+
+    Returns:
+        dict: the measurements of the engine.
+    """
+    start, end = grid.findStartEnd()
+    began = time.perf_counter()
+    deque(engineClass(grid, openListClass=openListClass, heuristic=heuristic).prepare(), maxlen=0)
+    preprocess = time.perf_counter() - began
+    best = None
+    result = None
+    for _ in range(repeat):
+        engine = engineClass(grid, openListClass=openListClass, heuristic=heuristic)
+        began = time.perf_counter()
+        result = engine.search(start, end)
+        elapsed = time.perf_counter() - began
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak_memory = None
+    if measureMemory:
+        tracemalloc.start()
+        traced = SearchResult(start, end)
+        for _ in engineClass(grid, openListClass=openListClass, heuristic=heuristic).steps(traced):
+            traced.expanded.clear()
+        peak_memory = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+
+    return {
+        'found': result.found,
+        'cost': result.cost,
+        'preprocess': preprocess * 1000,
+        'time': best * 1000,
+        'expanded': result.nodesExpanded,
+        'pushes': result.heapPushes,
+        'decreaseKeys': result.decreaseKeys,
+        'peakFrontier': result.peakFrontier,
+        'peakMemory': peak_memory,
+    }
+
+def runBenchmarks(args) -> list:
+    """
+    Run every selected engine on every generated grid.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        list: one record per (grid, engine) pair.
+    """
+    records = []
+    for kind in args.grids:
+        densities = args.densities if kind == 'random' else [0.0]
+        for size in args.sizes:
+            for density in densities:
+                generator = GridGenerator(args.seed)
+                grid = generator.generate(kind, size, density)
+                if args.terrain:
+                    generator.addTerrain(grid, args.terrain)
+                grid.setConnectivity(args.connectivity, 'one' if args.cut_corners else 'never')
+                # The GUI keeps its component index up to date, so it is not part of the timings
+                ComponentIndex.forGrid(grid)
+                # The move masks are kept up to date by the grid as well
+                grid.neighborMasks()
+                # Landmarks are preprocessed once per grid, and shared by every engine
+                heuristicClass = heuristicMap[args.heuristic]
+                heuristic = heuristicClass.forGrid(grid).heuristic if heuristicClass else None
+                for name in args.algorithms:
+                    record = {'grid': kind, 'size': size, 'density': density, 'algorithm': name}
+                    record.update(runEngine(algorithmToEngineMap[name], grid, args.repeat, not args.skip_memory,
+                                            openListMap[args.open_list], heuristic))
+                    records.append(record)
+                    if not args.quiet:
+                        printRow(record)
+    return records
+
+def printHeader() -> None:
+    """
+    Print the header of the report table.
+    """
+    print(' '.join(f"{header:{align}{width}}" for _, header, align, width, _ in tableColumns))
+
+def printRow(record: dict) -> None:
+    """
+    Print one row of the report table.
+
+    Args:
+        record (dict): the measurements of an engine on a grid.
+    """
+    cells = []
+    for key, _, align, width, number in tableColumns:
+        value = record[key]
+        text = format(value, number) if number and value is not None else str(value)
+        cells.append(f"{text:{align}{width}}")
+    print(' '.join(cells), flush=True)
+
+def parseArgs(argv=None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Args:
+        argv (list): The command line arguments, defaults to sys.argv.
+
+    Returns:
+        argparse.Namespace: the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the path finding engines on generated grids.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[64, 128, 256],
+                        help="sizes (rows and columns) of the square grids")
+    parser.add_argument('--densities', type=float, nargs='+', default=[0.0, 0.2, 0.4],
+                        help="obstacle densities of the random grids")
+    parser.add_argument('--grids', nargs='+', default=GridGenerator.kinds, choices=GridGenerator.kinds,
+                        help="kinds of grids to generate")
+    parser.add_argument('--algorithms', nargs='+', default=defaultAlgorithms,
+                        choices=list(algorithmToEngineMap), help="algorithms to run, all but ida by default")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the grid generator")
+    parser.add_argument('--repeat', type=int, default=1, help="number of timed runs, the best is reported")
+    parser.add_argument('--open-list', default='default', choices=list(openListMap),
+                        help="open list used by Dijkstra, A*, GBFS and JPS(+)")
+    parser.add_argument('--heuristic', default='manhattan', choices=list(heuristicMap),
+                        help="heuristic of the best-first engines, 'alt' for landmarks")
+    parser.add_argument('--terrain', type=int, metavar='MAXCOST',
+                        help="give the cells movement costs from 1 to MAXCOST, in patches")
+    parser.add_argument('--connectivity', type=int, default=4, choices=[4, 8],
+                        help="number of directions the engines which support diagonal moves move in")
+    parser.add_argument('--cut-corners', action='store_true',
+                        help="allow diagonal moves past one obstacle on 8-connected grids")
+    parser.add_argument('--node-budget', type=int, metavar='NODES',
+                        help=f"most cells held by IDA* ({IDAStarEngine.maxNodes} by default) "
+                             f"and nodes held by SMA* ({SMAStarEngine.maxNodes} by default)")
+    parser.add_argument('--skip-memory', action='store_true', help="do not measure the peak memory")
+    parser.add_argument('--json', metavar='PATH', help="write the results as JSON to PATH ('-' for stdout)")
+    parser.add_argument('--quiet', action='store_true', help="do not print the table")
+    args = parser.parse_args(argv)
+    if args.terrain and args.open_list == 'bucket':
+        parser.error("the bucket open list needs integer priorities, which terrain costs are not")
+    if args.connectivity == 8 and args.open_list == 'bucket':
+        parser.error("the bucket open list needs integer priorities, which octile distances are not")
+    if args.node_budget is not None and args.node_budget < 2:
+        parser.error("the node budget must hold at least the start and end cells")
+    return args
+
+def main(argv=None) -> None:
+    """
+    Entry point of the benchmark suite.
+
+    Args:
+        argv (list): The command line arguments, defaults to sys.argv.
+    """
+    args = parseArgs(argv)
+    if args.node_budget:
+        for engineClass in boundedEngines:
+            engineClass.maxNodes = args.node_budget
+    if not args.quiet:
+        printHeader()
+    records = runBenchmarks(args)
+
+    if args.json == '-':
+        json.dump(records, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w') as file:
+            json.dump(records, file, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Headless benchmark of incremental replanning.
+
+Plans once with D* Lite on a generated grid, then repeatedly blocks a few cells
+of the current path, frees a few obstacles, and replans. For every round, the
+cells expanded and the time taken by the D* Lite repair are compared with a
+fresh A* search on the same grid.
+
+Usage:
+    python benchmarks/replan.py --sizes 128 256 --edits 4 --rounds 20
+
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the repository root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from benchmarks.GridGenerator import GridGenerator
+
+from src.engine.AStarEngine import AStarEngine
+from src.engine.DStarLiteEngine import DStarLiteEngine
+from src.grid.GridModel import OBSTACLE
+
+def editGrid(grid, path: list, edits: int, rand: random.Random) -> None:
+    """
+    Block cells of the path and free obstacles, at random.
+
+    Args:
+        grid (GridModel): The grid to edit.
+        path (list): The indices of the cells of the current path.
+        edits (int): The number of cells to block, and of obstacles to free.
+        rand (random.Random): The random number generator.
+    """
+    inner = path[1:-1]
+    for index in rand.sample(inner, min(edits, len(inner))):
+        grid.setState(*grid.cell(index), 'obstacle')
+    obstacles = [index for index in range(len(grid.states)) if grid.states[index] == OBSTACLE]
+    for index in rand.sample(obstacles, min(edits, len(obstacles))):
+        grid.setState(*grid.cell(index), 'empty')
+
+def runReplanning(kind: str, size: int, density: float, args) -> dict:
+    """
+    Replan on one generated grid and measure both planners.
+
+    Args:
+        kind (str): The kind of grid.
+        size (int): The number of rows and columns.
+        density (float): The obstacle density of random grids.
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        dict: the averages of the measurements over the rounds.
+    """
+    grid = GridGenerator(args.seed).generate(kind, size, density)
+    rand = random.Random(args.seed)
+    start, end = grid.findStartEnd()
+    changed = []
+    grid.addListener(changed.extend)
+
+    planner = DStarLiteEngine(grid)
+    # Every edit gives the grid a new version, and the planners are compared on the search alone
+    planner.checkReachability = False
+    result = planner.search(start, end)
+    totals = {'dstar': 0, 'astar': 0, 'dstarTime': 0.0, 'astarTime': 0.0}
+    rounds = 0
+    while rounds < args.rounds and result.found:
+        editGrid(grid, result.path, args.edits, rand)
+        began = time.perf_counter()
+        planner.updateGrid(grid, changed)
+        result = planner.search(start, end)
+        totals['dstarTime'] += time.perf_counter() - began
+        changed.clear()
+
+        engine = AStarEngine(grid)
+        engine.checkReachability = False
+        began = time.perf_counter()
+        fresh = engine.search(start, end)
+        totals['astarTime'] += time.perf_counter() - began
+        assert fresh.cost == result.cost, "D* Lite and A* disagree on the cost of the path"
+
+        totals['dstar'] += result.nodesExpanded
+        totals['astar'] += fresh.nodesExpanded
+        rounds += 1
+
+    rounds = max(rounds, 1)
+    return {
+        'grid': kind, 'size': size, 'rounds': rounds,
+        'dstar': totals['dstar'] / rounds, 'astar': totals['astar'] / rounds,
+        'dstarTime': totals['dstarTime'] * 1000 / rounds, 'astarTime': totals['astarTime'] * 1000 / rounds,
+    }
+
+def main(argv=None) -> None:
+    """
+    Entry point of the replanning benchmark.
+
+    Args:
+        argv (list): The command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Compare D* Lite replanning with A* searches from scratch.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[64, 128, 256],
+                        help="sizes (rows and columns) of the square grids")
+    parser.add_argument('--grids', nargs='+', default=['random', 'rooms'], choices=GridGenerator.kinds,
+                        help="kinds of grids to generate")
+    parser.add_argument('--density', type=float, default=0.2, help="obstacle density of the random grids")
+    parser.add_argument('--edits', type=int, default=2, help="cells blocked and freed before every replan")
+    parser.add_argument('--rounds', type=int, default=10, help="number of replans per grid")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the grid generator and of the edits")
+    args = parser.parse_args(argv)
+
+    print(f"{'grid':<8} {'size':>6} {'rounds':>6} {'D* expanded':>12} {'A* expanded':>12} "
+          f"{'ratio':>6} {'D* (ms)':>9} {'A* (ms)':>9}")
+    for kind in args.grids:
+        for size in args.sizes:
+            record = runReplanning(kind, size, args.density, args)
+            ratio = record['dstar'] / record['astar'] if record['astar'] else 0.0
+            print(f"{record['grid']:<8} {record['size']:>6} {record['rounds']:>6} {record['dstar']:>12.1f} "
+                  f"{record['astar']:>12.1f} {ratio:>6.2f} {record['dstarTime']:>9.2f} {record['astarTime']:>9.2f}",
+                  flush=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+Headless runner of the Moving AI grid benchmark scenarios.
+
+Streams one or more .scen files through a search engine, one scenario at a time,
+loading every map once. The cost of every path is checked against a reference,
+and the timings are reported per bucket, as a table and optionally as JSON.
+
+The reference can be the optimal length given in the scenario file, which is
+the one of octile (8-connected) movement without corner cutting, or the cost
+found by A* on the grid, with the same movement as the engine. Run with
+--connectivity 8 to compare the engines against the scenario files.
+
+Usage:
+    python benchmarks/scenarios.py arena.map.scen --maps-dir maps --algorithm jps --reference astar
+    python benchmarks/scenarios.py arena.map.scen --algorithm jps --connectivity 8 --reference scen
+
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+# Add the repository root to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from benchmarks.benchmark import algorithmToEngineMap, openListMap, heuristicMap
+
+from src.engine.AStarEngine import AStarEngine
+from src.engine.ComponentIndex import ComponentIndex
+from src.grid.MovingAIMap import MovingAIMap
+from src.grid.ScenarioFile import ScenarioFile
+
+# Largest difference between the cost of a path and the reference for them to match
+tolerance = 1e-4
+
+# Columns of the report table: (record key, header, alignment, width, number format)
+tableColumns = [
+    ('bucket', 'bucket', '>', 6, ''),
+    ('queries', 'queries', '>', 7, ''),
+    ('solved', 'solved', '>', 7, ''),
+    ('mismatches', 'mismatch', '>', 8, ''),
+    ('meanTime', 'mean (ms)', '>', 10, '.3f'),
+    ('maxTime', 'max (ms)', '>', 10, '.3f'),
+    ('totalTime', 'total (ms)', '>', 11, '.1f'),
+    ('meanExpanded', 'expanded', '>', 10, '.1f'),
+]
+
+def findMap(scenarioPath: str, mapName: str, mapsDir: str = None) -> str:
+    """
+    Find the map file of a scenario.
+
+    Args:
+        scenarioPath (str): The path of the scenario file.
+        mapName (str): The map named by the scenario, possibly with directories.
+        mapsDir (str): The directory of the maps, the one of the scenario file if None.
+
+    Returns:
+        str: the path of the map file.
+    """
+    directory = mapsDir if mapsDir is not None else os.path.dirname(scenarioPath)
+    path = os.path.join(directory, mapName)
+    if not os.path.exists(path):
+        path = os.path.join(directory, os.path.basename(mapName))
+    return path
+
+def runScenarios(args) -> dict:
+    """
+    Run the engine on every scenario, keeping only the statistics of each bucket.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        dict: a dictionary mapping each bucket to its statistics.
+    """
+    engineClass = algorithmToEngineMap[args.algorithm]
+    openListClass = openListMap[args.open_list]
+    buckets = {}
+    for scenarioPath in args.scenarios:
+        mapPath = grid = heuristic = None
+        for scenario in islice(ScenarioFile(scenarioPath), args.limit):
+            path = findMap(scenarioPath, scenario.map, args.maps_dir)
+            if path != mapPath:
+                mapPath = path
+                grid = MovingAIMap(path).read()
+                grid.setConnectivity(args.connectivity, 'one' if args.cut_corners else 'never')
+                # Preprocessing is done once per map, outside of the timings
+                ComponentIndex.forGrid(grid)
+                grid.neighborMasks()
+                heuristicClass = heuristicMap[args.heuristic]
+                heuristic = heuristicClass.forGrid(grid).heuristic if heuristicClass else None
+            if (grid.rows, grid.cols) != (scenario.rows, scenario.cols):
+                raise ValueError(f"{mapPath} does not have the size given by {scenarioPath}")
+
+            engine = engineClass(grid, openListClass=openListClass, heuristic=heuristic)
+            began = time.perf_counter()
+            result = engine.search(scenario.start, scenario.end)
+            elapsed = (time.perf_counter() - began) * 1000
+
+            if args.reference == 'scen':
+                expected = scenario.optimalLength
+            elif args.reference == 'astar':
+                expected = AStarEngine(grid).search(scenario.start, scenario.end).cost
+            else:
+                expected = result.cost
+
+            stats = buckets.setdefault(scenario.bucket, {
+                'bucket': scenario.bucket, 'queries': 0, 'solved': 0, 'mismatches': 0,
+                'totalTime': 0.0, 'maxTime': 0.0, 'expanded': 0,
+            })
+            stats['queries'] += 1
+            stats['solved'] += result.found
+            if (result.cost is None) != (expected is None) or (
+                    expected is not None and abs(result.cost - expected) > tolerance):
+                stats['mismatches'] += 1
+            stats['totalTime'] += elapsed
+            stats['maxTime'] = max(stats['maxTime'], elapsed)
+            stats['expanded'] += result.nodesExpanded
+
+    for stats in buckets.values():
+        stats['meanTime'] = stats['totalTime'] / stats['queries']
+        stats['meanExpanded'] = stats['expanded'] / stats['queries']
+    return dict(sorted(buckets.items()))
+
+def printTable(buckets: dict) -> None:
+    """
+    Print the statistics of every bucket, followed by the totals.
+
+    Args:
+        buckets (dict): a dictionary mapping each bucket to its statistics.
+    """
+    print(' '.join(f"{header:{align}{width}}" for _, header, align, width, _ in tableColumns))
+    rows = list(buckets.values())
+    if rows:
+        queries = sum(stats['queries'] for stats in rows)
+        rows.append({
+            'bucket': 'all', 'queries': queries,
+            'solved': sum(stats['solved'] for stats in rows),
+            'mismatches': sum(stats['mismatches'] for stats in rows),
+            'meanTime': sum(stats['totalTime'] for stats in rows) / queries,
+            'maxTime': max(stats['maxTime'] for stats in rows),
+            'totalTime': sum(stats['totalTime'] for stats in rows),
+            'meanExpanded': sum(stats['expanded'] for stats in rows) / queries,
+        })
+    for stats in rows:
+        cells = []
+        for key, _, align, width, number in tableColumns:
+            value = stats[key]
+            text = format(value, number) if number else str(value)
+            cells.append(f"{text:{align}{width}}")
+        print(' '.join(cells), flush=True)
+
+def parseArgs(argv=None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Args:
+        argv (list): The command line arguments, defaults to sys.argv.
+
+    Returns:
+        argparse.Namespace: the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run the Moving AI benchmark scenarios through a search engine.")
+    parser.add_argument('scenarios', nargs='+', help="paths of the .scen files")
+    parser.add_argument('--maps-dir', help="directory of the .map files, defaults to the one of each .scen file")
+    parser.add_argument('--algorithm', default='astar', choices=list(algorithmToEngineMap), help="algorithm to run")
+    parser.add_argument('--open-list', default='default', choices=list(openListMap),
+                        help="open list used by Dijkstra, A*, GBFS and JPS(+)")
+    parser.add_argument('--heuristic', default='manhattan', choices=list(heuristicMap),
+                        help="heuristic of the best-first engines, 'alt' for landmarks")
+    parser.add_argument('--connectivity', type=int, default=4, choices=[4, 8],
+                        help="number of directions the engines which support diagonal moves move in")
+    parser.add_argument('--cut-corners', action='store_true',
+                        help="allow diagonal moves past one obstacle on 8-connected grids")
+    parser.add_argument('--reference', default='astar', choices=['astar', 'scen', 'none'],
+                        help="reference of the path costs: A* on the grid, the optimal length "
+                             "of the scenario file (octile movement without corner cutting), or none")
+    parser.add_argument('--limit', type=int, help="number of scenarios read from each file")
+    parser.add_argument('--json', metavar='PATH', help="write the bucket statistics as JSON to PATH ('-' for stdout)")
+    parser.add_argument('--quiet', action='store_true', help="do not print the table")
+    args = parser.parse_args(argv)
+    if args.connectivity == 8 and args.open_list == 'bucket':
+        parser.error("the bucket open list needs integer priorities, which octile distances are not")
+    return args
+
+def main(argv=None) -> None:
+    """
+    Entry point of the scenario runner.
+
+    Args:
+        argv (list): The command line arguments, defaults to sys.argv.
+    """
+    args = parseArgs(argv)
+    buckets = runScenarios(args)
+    if not args.quiet:
+        printTable(buckets)
+    if args.json:
+        records = list(buckets.values())
+        if args.json == '-':
+            json.dump(records, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, 'w') as file:
+                json.dump(records, file, indent=2)
+
+if __name__ == '__main__':
+    main()
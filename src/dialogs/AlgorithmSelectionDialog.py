@@ -21,6 +21,14 @@ class AlgorithmSelectionDialog(QDialog):
         - Greedy Best-First Search
         - Jump Point Search
         - Bidirectional Search
+        - Distance Field Search
+        - D* Lite
+        - Hierarchical A* (HPA*)
+        - A* with landmarks (ALT)
+        - Bidirectional A*
+        - IDA*
+        - Fringe Search
+        - SMA*
 
     Args:
         QDialog: The QDialog class is the base class of dialog windows.
@@ -30,7 +38,7 @@ class AlgorithmSelectionDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Select Path Finding Algorithm")
         self.setWindowModality(Qt.ApplicationModal)
-        self.setFixedSize(500, 350)
+        self.setFixedSize(500, 750)
 
         self.algorithms = {
             'bfs': 'Breadth-First Search',
@@ -39,7 +47,15 @@ class AlgorithmSelectionDialog(QDialog):
             'astar': 'A* algorithm',
             'gbfs': 'Greedy Best-First Search',
             'jps': 'Jump Point Search',
-            'bisearch': 'Bidirectional Search'
+            'bisearch': 'Bidirectional Search',
+            'field': 'Distance Field Search',
+            'dstar': 'D* Lite',
+            'hpa': 'Hierarchical A* (HPA*)',
+            'alt': 'A* with landmarks (ALT)',
+            'biastar': 'Bidirectional A*',
+            'ida': 'IDA*',
+            'fringe': 'Fringe Search',
+            'sma': 'SMA* (memory-bounded)'
         }
         
         # Join path of algorithmInfo.txt
@@ -13,6 +13,7 @@ class ResetDialog(QDialog):
         - Reset All Cells
         - Reset Checked/Path Cells
         - Reset Obstacle Cells
+        - Reset Terrain Costs
 
     Args:
         QDialog: The QDialog class is the base class of dialog windows.
@@ -21,7 +22,7 @@ class ResetDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Reset Options")
         self.setWindowModality(Qt.ApplicationModal)
-        self.setFixedSize(300, 200)
+        self.setFixedSize(300, 240)
 
         layout = QVBoxLayout()
 
@@ -41,6 +42,10 @@ class ResetDialog(QDialog):
         self.obstacleButton.clicked.connect(lambda: self.selectOption('obstacle'))
         layout.addWidget(self.obstacleButton)
 
+        self.terrainButton = QPushButton("Reset Terrain Costs")
+        self.terrainButton.clicked.connect(lambda: self.selectOption('terrain'))
+        layout.addWidget(self.terrainButton)
+
         self.setLayout(layout)
 
     def selectOption(self, option: str):
@@ -0,0 +1,106 @@
+"""
+This module contains the headless implementation of the A* search algorithm.
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.BucketOpenList import BucketOpenList
+
+class AStarEngine(BaseEngine):
+    """
+    A* search engine.
+
+    The A* search algorithm is an extension of Dijkstra's algorithm.
+    It achieves better performance by using heuristics to guide its search.
+    On grids with movement costs, it finds the cheapest path, with the heuristic
+    scaled by the lowest cost of the grid. On 8-connected grids, it moves
+    diagonally too, guided by the octile distance.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    # f_costs are small integers, so a bucket queue is used by default
+    openListClass = BucketOpenList
+
+    usesCosts = True
+
+    connectivities = (4, 8)
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements the A* algorithm to find the shortest path from
+        the source node to the destination node.
+
+        Algorithm:
+            1. Initialize the open set with the source node and initialize
+                the g_cost of the source node to 0.
+            2. While the open set is not empty:
+                2.1. Select the node with the lowest f_cost from the open set.
+                2.2. If the node has already been visited, continue to the
+                next iteration.
+                2.3. Record the node as expanded.
+                2.4. If the node is the end node, build the path and return.
+                2.5. For each neighbor of the node:
+                    2.5.1. Calculate the g_cost of the neighbor.
+                    2.5.2. If the g_cost of the neighbor is less than the current
+                    g_cost, update the g_cost and the parent of the neighbor.
+                    2.5.3. Push the neighbor to the open set with its f_cost.
+
+        Notes:
+            - The g_cost is the cost of reaching a node from the starting node,
+            the sum of the movement costs of the cells entered on grids with costs,
+            diagonal moves costing diagonalCost times more on 8-connected grids
+            - The f_cost stands for the total cost of reaching a node from the starting
+            node and then reaching the goal node. The f_cost is the sum of the g_cost
+            and the heuristic cost of the current node to the goal node.
+        """
+        open_set = self.openListClass()
+        push, pop = open_set.push, open_set.pop
+        push(self.heuristic(start, end), start)
+        state = self.state
+        costs = self.costs
+        parents = state.parents
+        g_costs = state.useWeightedCosts() if self.fractionalCosts else state.costs
+        reached, closed, generation = state.reached, state.closed, state.generation
+        parents[start] = -1
+        g_costs[start] = 0
+        reached[start] = generation
+        expanded = result.expanded
+        masks, moves = self.masks, self.moves
+        heuristic = self.heuristic
+        peak = 1
+
+        while open_set and not self.isStopped():
+            _, current = pop()
+
+            if closed[current] == generation:
+                continue
+
+            closed[current] = generation
+            expanded.append(current)
+            yield current
+
+            # if end node is reached, build path and return
+            if current == end:
+                self.finish(result, parents, end)
+                break
+
+            g_cost = g_costs[current]
+            for offset, length in moves[masks[current]]:
+                neighbor = current + offset
+                tentative_g_cost = g_cost + (length if costs is None else length * costs[neighbor])
+                if reached[neighbor] != generation or tentative_g_cost < g_costs[neighbor]:
+                    reached[neighbor] = generation
+                    g_costs[neighbor] = tentative_g_cost
+                    f_cost = tentative_g_cost + heuristic(neighbor, end)
+                    parents[neighbor] = current
+                    if push(f_cost, neighbor):
+                        result.heapPushes += 1
+                    else:
+                        result.decreaseKeys += 1
+            if len(open_set) > peak:
+                peak = len(open_set)
+
+        result.peakFrontier = peak
@@ -0,0 +1,72 @@
+"""
+This module contains the headless implementation of the BFS search algorithm.
+"""
+
+from collections import deque
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+
+class BFSEngine(BaseEngine):
+    """
+    BFS search engine.
+
+    The BFS search algorithm is a tree traversal algorithm. It starts at
+    the root of the tree and explores all of the nodes at the present depth
+    prior to moving onto the nodes at the next depth level. On 8-connected
+    grids, the path found has the fewest moves, not the lowest octile cost.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    connectivities = (4, 8)
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements the BFS algorithm to find the shortest path from
+        the source node to the destination node.
+
+        Algorithm:
+            1. Initialize the queue with the source node and mark it as seen.
+            2. While the queue is not empty:
+                2.1. Remove the first node from the queue and record it
+                as expanded.
+                2.2. If the node is the end node, build the path and return.
+                2.3. For each neighbor of the node which has not been seen,
+                mark it as seen, set its parent and push it into the queue.
+
+        Notes:
+            - Nodes are marked as seen when they are pushed rather than when
+            they are popped, so every node enters the queue at most once and
+            keeps the parent from the shallowest layer.
+        """
+        queue = deque([start])
+        state = self.state
+        parents, reached, generation = state.parents, state.reached, state.generation
+        parents[start] = -1
+        reached[start] = generation
+        expanded = result.expanded
+        masks, offsets = self.masks, self.offsets
+        peak = 1
+
+        while queue and not self.isStopped():
+            current = queue.popleft()
+            expanded.append(current)
+            yield current
+
+            if current == end:
+                self.finish(result, parents, end)
+                break
+
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if reached[neighbor] != generation:
+                    reached[neighbor] = generation
+                    parents[neighbor] = current
+                    queue.append(neighbor)
+                    result.heapPushes += 1
+            if len(queue) > peak:
+                peak = len(queue)
+
+        result.peakFrontier = peak
@@ -0,0 +1,320 @@
+"""
+This module contains the BaseEngine class which is the base class for all headless search engines.
+"""
+
+from collections import deque
+from typing import Iterator
+
+from src.engine.SearchResult import SearchResult
+from src.engine.SearchState import SearchState
+from src.engine.IndexedHeap import IndexedHeap
+from src.engine.ComponentIndex import ComponentIndex
+
+class BaseEngine:
+    """
+    Base class for all search engines.
+
+    A search engine runs a path finding algorithm on a GridModel at full speed,
+    without any Qt objects involved, and returns a SearchResult describing the
+    path, its cost, the order in which cells were expanded and a few counters.
+    The solvers in src.solvers step through the search with steps(), and show
+    the cells expanded so far on the grid widget after every few steps.
+
+    Internally, the engines identify cells by their flat index (row * cols + col)
+    in the states array of the grid model, and keep their per-cell bookkeeping in
+    a SearchState, which can be passed in to be reused across searches.
+
+    Attributes:
+        grid (GridModel): The grid model to search on.
+        rows (int): The number of rows in the grid.
+        cols (int): The number of columns in the grid.
+        states (bytearray): The states array of the grid model.
+        stopEvent (threading.Event): Optional event which aborts the search once set.
+        openListClass (type): The priority queue used as open list by best-first engines.
+        state (SearchState): The parents, costs and flags of the cells.
+        heuristic (Callable): The heuristic distance between two cells, the Manhattan
+            or octile distance unless another one is given, e.g. LandmarkTable.heuristic.
+        checkReachability (bool): Whether to reject unreachable end cells with the component index.
+        costs (array): The movement costs of the cells, None on grids without costs
+            and for engines which ignore them.
+        connectivity (int): The number of directions the engine moves in on this grid, 4 or 8.
+        diagonalCost (float): The cost of a diagonal move relative to a straight one.
+        fractionalCosts (bool): Whether moves can cost a fraction, so that costs and
+            priorities must be doubles, and the default open list is an IndexedHeap.
+        masks (bytearray): The move mask of every cell, see GridModel.neighborMasks.
+        offsets (list): The flat index offsets of the moves of every mask.
+        moves (list): The (offset, length) pairs of the moves of every mask, the
+            length of diagonal moves being diagonalCost.
+    """
+
+    # Open list used by best-first engines, unless another one is given
+    openListClass = IndexedHeap
+
+    # Before running, the start and end cells are looked up in the component index of the grid,
+    # so that an unreachable end cell does not exhaust the region of the start cell. Callers which
+    # already checked reachability, e.g. against a live index, turn this off
+    checkReachability = True
+
+    # Engines which find the cheapest path on grids with movement costs turn this on. They read
+    # the cost of every move from the costs of the grid, and their heuristic is scaled by the
+    # lowest cost (see scaledHeuristic); the others treat every move as costing 1. Either way,
+    # the cost of the path in the result is the cost of its cells on the grid
+    usesCosts = False
+
+    # Connectivities of the grid the engine follows, it moves in 4 directions on the others.
+    # On 8-connected grids, the default heuristic becomes the octile distance, and engines which
+    # use costs move diagonally at diagonalCost times the cost of the cell entered
+    connectivities = (4,)
+
+    # Engines which keep their bookkeeping elsewhere, e.g. within a node budget, turn this off
+    # so that no SearchState is allocated for them
+    usesState = True
+
+    def __init__(self, grid, stopEvent=None, openListClass=None, state=None, heuristic=None) -> None:
+        self.grid = grid
+        self.rows = grid.rows
+        self.cols = grid.cols
+        self.states = grid.states
+        self.stopEvent = stopEvent
+        if openListClass is not None:
+            self.openListClass = openListClass
+        self.state = state
+        self.connectivity = grid.connectivity if grid.connectivity in self.connectivities else 4
+        self.diagonalCost = grid.diagonalCost
+        self.masks = grid.neighborMasks()
+        self.offsets = grid.neighborOffsets(self.connectivity)
+        self.moves = grid.neighborOffsets(self.connectivity, lengths=True)
+        if self.connectivity == 8:
+            self.heuristic = self.chebyshev if self.diagonalCost == 1 else self.octile
+        if heuristic is not None:
+            self.heuristic = heuristic
+        self.costs = grid.costs if self.usesCosts else None
+        self.fractionalCosts = self.costs is not None or (self.connectivity == 8 and isinstance(self.diagonalCost, float))
+        # Heuristics of 8-connected grids, e.g. landmark ones, count fractional diagonal moves
+        if openListClass is None and (self.costs is not None
+                                      or (grid.connectivity == 8 and isinstance(grid.diagonalCost, float))):
+            # Priorities become doubles, which a bucket queue cannot hold
+            self.openListClass = IndexedHeap
+        if self.costs is not None:
+            minCost = grid.minCost()
+            if minCost != 1:
+                self.heuristic = self.scaledHeuristic(self.heuristic, minCost)
+
+    def search(self, start: tuple, end: tuple) -> SearchResult:
+        """
+        Search for a path from the start cell to the end cell.
+
+        Args:
+            start (tuple): Coordinates of the start cell (row, col).
+            end (tuple): Coordinates of the end cell (row, col).
+
+        Returns:
+            SearchResult: the outcome of the search.
+        """
+        result = SearchResult(start, end)
+        # Exhaust the steps of the search without keeping them
+        deque(self.steps(result), maxlen=0)
+        return result
+
+    def steps(self, result: SearchResult) -> Iterator[int]:
+        """
+        Run the search one step at a time.
+
+        The search goes from the start cell to the end cell of the result, and
+        fills it in as it goes. The generator is suspended after every step, so
+        that a caller, e.g. a QTimer in the GUI thread, can decide how many steps
+        to run at a time, pause the search, or stop it by dropping the generator.
+        The steps of prepare come first, and expand no cells.
+
+        Args:
+            result (SearchResult): The result to fill in, holding the start and end cells.
+
+        Yields:
+            int: the index of the cell expanded or processed by the step.
+        """
+        start, end = result.start, result.end
+        if start is None or end is None:
+            return
+        if self.usesState and (self.state is None or self.state.size != self.rows * self.cols):
+            self.state = SearchState(self.rows * self.cols)
+        start_index, end_index = self.grid.index(*start), self.grid.index(*end)
+        if self.checkReachability and not ComponentIndex.forGrid(self.grid).connected(start_index, end_index):
+            return
+        for cell in self.prepare():
+            yield cell
+            if self.isStopped():
+                result.stopped = True
+                return
+        if self.usesState:
+            self.state.reset()
+        yield from self.run(start_index, end_index, result)
+        if not result.found and self.isStopped():
+            result.stopped = True
+
+    def prepare(self) -> Iterator[int]:
+        """
+        Build the data which the engine precomputes for its grid, e.g. a JumpTable,
+        one step at a time, before the search runs. The data is cached by the
+        version of the grid, so that the next searches on the grid skip this.
+
+        Nothing is precomputed by default.
+
+        Yields:
+            int: the index of the last cell processed by the step.
+        """
+        return iter(())
+
+    def run(self, start: int, end: int, result: SearchResult) -> Iterator[int]:
+        """
+        Run the search algorithm, filling in the given result.
+
+        Engines implement this method as a generator, which yields after every
+        expansion. Engines which compute their result in bulk, e.g. one BFS layer
+        at a time, yield once per bulk step.
+
+        Args:
+            start (int): Index of the start cell.
+            end (int): Index of the end cell.
+            result (SearchResult): The result to fill in.
+
+        Yields:
+            int: the index of the cell expanded by the step.
+        """
+        raise NotImplementedError
+
+    def isStopped(self) -> bool:
+        """
+        Check whether the search has been asked to stop.
+
+        Returns:
+            bool: True if the stop event is set, otherwise False.
+        """
+        return self.stopEvent is not None and self.stopEvent.is_set()
+
+    def neighbors(self, index: int) -> list:
+        """
+        Get the traversable neighbors of a cell, in the order up, down, left, right,
+        followed on 8-connected grids by the diagonal ones allowed by the corner-cutting
+        policy of the grid.
+
+        The hot loops of the engines inline this, going through offsets[masks[index]],
+        or moves[masks[index]] for the lengths of the moves, so that finding a
+        neighbor is an integer addition, without testing the borders of the grid.
+
+        Args:
+            index (int): Index of the cell.
+
+        Returns:
+            list: the indices of the neighbors the cell can move to.
+        """
+        return [index + offset for offset in self.offsets[self.masks[index]]]
+
+    def heuristic(self, a: int, b: int) -> int:
+        """
+        Calculate the heuristic distance between two cells.
+
+        A heuristic distance is a metric that estimates the distance
+        from a given node to the goal node. In this case, the heuristic
+        distance is the Manhattan distance between the two cells.
+
+        Args:
+            a (int): The index of the first point.
+            b (int): The index of the second point.
+
+        Returns:
+            int: The heuristic distance between the two points.
+        """
+        a_row, a_col = divmod(a, self.cols)
+        b_row, b_col = divmod(b, self.cols)
+        return abs(a_row - b_row) + abs(a_col - b_col)
+
+    # The exact distance between two cells on a free straight line, whichever heuristic is used
+    manhattan = heuristic
+
+    def octile(self, a: int, b: int) -> float:
+        """
+        Calculate the octile distance between two cells, the length of the
+        shortest 8-connected path between them on a free grid: diagonal moves
+        as long as both coordinates differ, then straight moves. It is the default
+        heuristic of 8-connected grids, unless diagonal moves cost 1.
+
+        Args:
+            a (int): The index of the first point.
+            b (int): The index of the second point.
+
+        Returns:
+            float: The octile distance between the two points.
+        """
+        a_row, a_col = divmod(a, self.cols)
+        b_row, b_col = divmod(b, self.cols)
+        d_row, d_col = abs(a_row - b_row), abs(a_col - b_col)
+        if d_row < d_col:
+            return d_col + (self.diagonalCost - 1) * d_row
+        return d_row + (self.diagonalCost - 1) * d_col
+
+    def chebyshev(self, a: int, b: int) -> int:
+        """
+        Calculate the Chebyshev distance between two cells, the octile distance
+        when diagonal moves cost as much as straight ones.
+
+        Args:
+            a (int): The index of the first point.
+            b (int): The index of the second point.
+
+        Returns:
+            int: The Chebyshev distance between the two points.
+        """
+        a_row, a_col = divmod(a, self.cols)
+        b_row, b_col = divmod(b, self.cols)
+        return max(abs(a_row - b_row), abs(a_col - b_col))
+
+    @staticmethod
+    def scaledHeuristic(heuristic, factor: float):
+        """
+        Scale a heuristic which counts moves by the lowest movement cost of a grid.
+
+        No path of n moves costs less than n times the lowest cost, so the scaled
+        heuristic is admissible (and consistent) whenever the original one is.
+
+        Args:
+            heuristic (Callable): The heuristic distance between two cells, in moves.
+            factor (float): The lowest movement cost of the grid.
+
+        Returns:
+            Callable: the scaled heuristic.
+        """
+        def scaled(a: int, b: int) -> float:
+            return heuristic(a, b) * factor
+        return scaled
+
+    def buildPath(self, parents, end: int) -> list:
+        """
+        Reconstruct the path from the start cell to the end cell.
+
+        Args:
+            parents (array): The index of the predecessor of every cell
+                       in the path, the start cell having -1.
+            end (int): Index of the end cell.
+
+        Returns:
+            list: the cells of the path, from the start cell to the end cell.
+        """
+        path = []
+        current = end
+        while current != -1:
+            path.append(current)
+            current = parents[current]
+        path.reverse()
+        return path
+
+    def finish(self, result: SearchResult, parents, end: int) -> None:
+        """
+        Store the path ending in the end cell and its cost in the result.
+
+        Args:
+            result (SearchResult): The result to fill in.
+            parents (array): The index of the predecessor of every cell.
+            end (int): Index of the end cell.
+        """
+        result.path = self.buildPath(parents, end)
+        result.cost = self.grid.pathCost(result.path)
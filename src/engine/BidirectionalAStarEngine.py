@@ -0,0 +1,29 @@
+"""
+This module contains the headless implementation of the bidirectional A* search algorithm.
+"""
+
+from src.engine.BidirectionalEngine import BidirectionalEngine
+
+class BidirectionalAStarEngine(BidirectionalEngine):
+    """
+    Bidirectional A* search engine.
+
+    Both searches of the bidirectional search are guided by the heuristic, the
+    one from the start towards the end and the one from the end towards the start,
+    through the average potential of BidirectionalEngine.runBestFirst, and the
+    searches stop as soon as no cheaper path can be found.
+
+    The average potential is a weaker guide than the full heuristic, which A*
+    follows: a cell off the straight line between the source and the destination
+    costs half as much more. It pays off on grids with movement costs, where
+    the heuristic, scaled by the lowest cost, is weak anyway, and the two
+    searches together expand about half as many cells as A* on the random and
+    rooms grids of the benchmark. Without movement costs it does not beat A*:
+    it expands about as many cells on 8-connected grids, 5 to 15% more on
+    mazes, and up to several times as many on 4-connected rooms grids, where
+    both searches flood the rooms before they meet.
+
+    Args:
+        BidirectionalEngine: The bidirectional search engine.
+    """
+    useHeuristic = True
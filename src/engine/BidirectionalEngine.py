@@ -0,0 +1,222 @@
+"""
+This module contains the headless implementation of the Bidirectional Search algorithm.
+"""
+
+from collections import deque
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.IndexedHeap import IndexedHeap
+
+class BidirectionalEngine(BaseEngine):
+    """
+    Bidirectional search engine.
+
+    Bidirectional Search is a graph search algorithm which finds the shortest
+    path between a specified source node and a specified destination node (in a directed graph).
+    It runs two simultaenous searches, one forward from the source node, and one backward from
+    the destination node. Each step advances the search whose frontier is smaller,
+    so that a search which is boxed in, e.g. at the end of a corridor, does not
+    flood the grid while the other one is waiting. On uniform 4-connected grids the
+    two searches are breadth-first ones; on grids with movement costs and on
+    8-connected grids, they are Dijkstra searches (see runBestFirst).
+
+    Args:
+        BaseEngine: Base class for all search engines.
+    """
+
+    usesCosts = True
+
+    connectivities = (4, 8)
+
+    # Whether the two searches are guided by the heuristic towards each other's source (bidirectional A*)
+    useHeuristic = False
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements the Bidirectional Search algorithm to find a path
+        from the source node to the destination node.
+
+        The searches expand whole layers: when a layer of one search reaches a
+        cell reached by the other, every cell of the other search up to its depth
+        is known, so the first such cell is on a shortest path.
+
+        Algorithm:
+            1. Initialize two queues - one starting from the source node
+            and one starting from the destination node.
+            2. While both queues are not empty:
+                2.1. Pick the queue holding fewer nodes.
+                2.2. Remove every node of its current layer from the queue
+                and record it as expanded.
+                2.3. For each neighbor of the node which has not been reached
+                from the same side, set its parent and push it into the queue.
+                If the neighbor has already been reached from the other side,
+                join the two halves of the path and return.
+        """
+        if self.costs is not None or self.connectivity == 8 or self.useHeuristic:
+            yield from self.runBestFirst(start, end, result)
+            return
+
+        queue_start = deque([start])
+        queue_end = deque([end])
+        forward = self.state
+        backward = forward.reverseState()
+        forward.parents[start] = -1
+        forward.reached[start] = forward.generation
+        backward.parents[end] = -1
+        backward.reached[end] = backward.generation
+        expanded = result.expanded
+        masks, offsets = self.masks, self.offsets
+        peak = 2
+
+        if start == end:
+            result.path = [start]
+            result.cost = 0
+            return
+
+        while queue_start and queue_end and not self.isStopped():
+            if len(queue_start) <= len(queue_end):
+                queue, state, other = queue_start, forward, backward
+            else:
+                queue, state, other = queue_end, backward, forward
+            parents, reached, generation = state.parents, state.reached, state.generation
+            other_reached, other_generation = other.reached, other.generation
+
+            for _ in range(len(queue)):
+                current = queue.popleft()
+                expanded.append(current)
+                yield current
+
+                for offset in offsets[masks[current]]:
+                    neighbor = current + offset
+                    if reached[neighbor] == generation:
+                        continue
+                    reached[neighbor] = generation
+                    parents[neighbor] = current
+                    queue.append(neighbor)
+                    result.heapPushes += 1
+                    if other_reached[neighbor] == other_generation:
+                        self.join(result, forward.parents, backward.parents, neighbor)
+                        result.peakFrontier = max(peak, len(queue_start) + len(queue_end))
+                        return
+            if len(queue_start) + len(queue_end) > peak:
+                peak = len(queue_start) + len(queue_end)
+
+        result.peakFrontier = peak
+
+    def runBestFirst(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements a bidirectional Dijkstra search, for grids with movement costs
+        or diagonal moves, or a bidirectional A* search if useHeuristic is set.
+
+        The first cell reached by both searches is not always on the cheapest
+        path, so the searches go on until the lowest keys of their two open lists
+        add up to at least the cost of the cheapest path found so far through a
+        cell reached by both; no path found later can be cheaper.
+
+        Bidirectional A* keys the cells with the average potential
+        p(v) = (h(v, end) - h(v, start)) / 2: g + p from the start, and g - p from
+        the end. Both searches then see the same, non-negative, reduced move costs
+        as long as the heuristic is consistent, the potentials cancel out in the
+        sum of the two keys of a cell, and the stopping test above stays exact.
+
+        Algorithm:
+            1. Initialize two priority queues - one with the source node and
+            one with the destination node.
+            2. While both queues are not empty and the sum of their lowest
+            keys is lower than the cost of the best path:
+                2.1. Remove the node with the lowest key from the queue holding
+                fewer nodes, and record it as expanded.
+                2.2. For each neighbor of the node, calculate its distance: the
+                search from the start moves into the neighbor, the search from
+                the end moves from the neighbor into the node. If it is lower
+                than the current distance of the neighbor, update its distance
+                and parent and push it into the queue, keyed by its distance
+                plus or minus its potential.
+                2.3. If the neighbor has been reached by the other search too,
+                keep it as the meeting point if the path through it is cheaper
+                than the best path.
+            3. Join the two halves of the best path at its meeting point.
+        """
+        costs = self.costs
+        heuristic = self.heuristic if self.useHeuristic else None
+        forward = self.state
+        backward = forward.reverseState()
+        # Keys are doubles and the lowest ones are compared, so an indexed heap is used
+        queue_start, queue_end = IndexedHeap(), IndexedHeap()
+        for queue, state, source in ((queue_start, forward, start), (queue_end, backward, end)):
+            state.parents[source] = -1
+            state.useWeightedCosts()[source] = 0
+            state.reached[source] = state.generation
+        if heuristic is None:
+            queue_start.push(0, start)
+            queue_end.push(0, end)
+        else:
+            # p(start) = h(start, end) / 2 and p(end) = -h(end, start) / 2
+            queue_start.push(heuristic(start, end) / 2, start)
+            queue_end.push(heuristic(end, start) / 2, end)
+        expanded = result.expanded
+        masks, moves = self.masks, self.moves
+        # A single cell is a path of cost 0, so a search from the end cell to itself stops at once
+        best, meeting = (0, start) if start == end else (float('inf'), -1)
+        peak = 2
+
+        while queue_start and queue_end and not self.isStopped():
+            if queue_start.peek()[0] + queue_end.peek()[0] >= best:
+                break
+            if len(queue_start) <= len(queue_end):
+                queue, state, other, is_forward = queue_start, forward, backward, True
+            else:
+                queue, state, other, is_forward = queue_end, backward, forward, False
+            parents, distances = state.parents, state.weightedCosts
+            reached, closed, generation = state.reached, state.closed, state.generation
+            other_distances, other_reached, other_generation = other.weightedCosts, other.reached, other.generation
+
+            current = queue.pop()[1]
+            distance = distances[current]
+            closed[current] = generation
+            expanded.append(current)
+            yield current
+
+            for offset, length in moves[masks[current]]:
+                neighbor = current + offset
+                new_distance = distance + (length if costs is None else
+                                           length * (costs[neighbor] if is_forward else costs[current]))
+                if reached[neighbor] != generation or new_distance < distances[neighbor]:
+                    reached[neighbor] = generation
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = current
+                    if heuristic is None:
+                        key = new_distance
+                    elif is_forward:
+                        key = new_distance + (heuristic(neighbor, end) - heuristic(neighbor, start)) / 2
+                    else:
+                        key = new_distance + (heuristic(neighbor, start) - heuristic(neighbor, end)) / 2
+                    if queue.push(key, neighbor):
+                        result.heapPushes += 1
+                    else:
+                        result.decreaseKeys += 1
+                    if other_reached[neighbor] == other_generation and new_distance + other_distances[neighbor] < best:
+                        best, meeting = new_distance + other_distances[neighbor], neighbor
+            if len(queue_start) + len(queue_end) > peak:
+                peak = len(queue_start) + len(queue_end)
+
+        # A search stopped early may not have proven its best path to be the cheapest
+        if meeting >= 0 and not self.isStopped():
+            self.join(result, forward.parents, backward.parents, meeting)
+        result.peakFrontier = peak
+
+    def join(self, result, parent_start, parent_end, meeting_point: int) -> None:
+        """
+        Join the two halves of the path at the meeting point.
+
+        Args:
+            result (SearchResult): The result to fill in.
+            parent_start (array): Parents of the cells reached from the start.
+            parent_end (array): Parents of the cells reached from the end.
+            meeting_point (int): The index of the cell reached by both searches.
+        """
+        path_start = self.buildPath(parent_start, meeting_point)
+        path_end = self.buildPath(parent_end, meeting_point)
+        result.path = path_start + path_end[::-1][1:]
+        result.cost = self.grid.pathCost(result.path)
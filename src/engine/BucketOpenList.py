@@ -0,0 +1,108 @@
+"""
+This module contains the BucketOpenList class, a bucket (Dial) priority queue for integer priorities.
+"""
+
+class BucketOpenList:
+    """
+    Bucket priority queue for small non-negative integer priorities.
+
+    The queue keeps one list (bucket) of items per priority, and a pointer to the
+    lowest bucket which may be non-empty. Pushing appends to a bucket and popping
+    takes from the lowest non-empty one, so both are O(1) amortized when priorities
+    grow monotonically, as they do in Dijkstra's algorithm and in A* with a consistent
+    heuristic, and no tuples are built or compared. Items of equal priority are
+    popped last-in first-out, which makes A* prefer the most recently reached cells.
+
+    Every item is queued at most once: pushing a queued item with a lower priority
+    moves it to the lower bucket (decrease-key), by swapping it with the last item
+    of its bucket, so the size of the queue is bounded by the number of open nodes.
+
+    Attributes:
+        buckets (list): The list of items for every priority.
+        current (int): The lowest priority whose bucket may be non-empty.
+        size (int): The number of items in the queue.
+        priorities (dict): A dictionary mapping each queued item to its priority.
+        positions (dict): A dictionary mapping each queued item to its position in its bucket.
+    """
+    def __init__(self) -> None:
+        self.buckets = []
+        self.current = 0
+        self.size = 0
+        self.priorities = {}
+        self.positions = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, item) -> bool:
+        return item in self.priorities
+
+    def push(self, priority: int, item) -> bool:
+        """
+        Push an item onto the queue, or lower its priority if it is already queued.
+
+        Args:
+            priority (int): The priority of the item, a non-negative integer.
+            item: The item to push.
+
+        Returns:
+            bool: True if the item was added, False if it was already queued.
+        """
+        if item in self.priorities:
+            self.decreaseKey(item, priority)
+            return False
+        self._insert(priority, item)
+        self.size += 1
+        return True
+
+    def decreaseKey(self, item, priority: int) -> None:
+        """
+        Lower the priority of a queued item. Higher priorities are ignored.
+
+        Args:
+            item: The queued item.
+            priority (int): The new priority of the item.
+        """
+        old_priority = self.priorities[item]
+        if priority >= old_priority:
+            return
+        # Swap the item with the last one of its bucket and remove it
+        bucket = self.buckets[old_priority]
+        position = self.positions[item]
+        last = bucket.pop()
+        if last != item:
+            bucket[position] = last
+            self.positions[last] = position
+        self._insert(priority, item)
+
+    def _insert(self, priority: int, item) -> None:
+        """
+        Append an item to the bucket of a priority.
+        """
+        buckets = self.buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        bucket = buckets[priority]
+        self.priorities[item] = priority
+        self.positions[item] = len(bucket)
+        bucket.append(item)
+        if priority < self.current:
+            self.current = priority
+
+    def pop(self) -> tuple:
+        """
+        Pop an item with the lowest priority from the queue.
+
+        Returns:
+            tuple: the priority and the item.
+        """
+        buckets = self.buckets
+        priority = self.current
+        while not buckets[priority]:
+            priority += 1
+        self.current = priority
+        self.size -= 1
+        item = buckets[priority].pop()
+        del self.priorities[item]
+        del self.positions[item]
+        return priority, item
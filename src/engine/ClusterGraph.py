@@ -0,0 +1,406 @@
+"""
+This module contains the ClusterGraph class, the abstract graph of hierarchical path finding (HPA*).
+"""
+
+from collections import deque
+from typing import Generator, Iterator
+
+from src.grid.GridModel import GridModel, OBSTACLE
+
+class ClusterGraph:
+    """
+    Abstract graph of a grid partitioned into square clusters, as used by HPA*.
+
+    The grid is cut into clusters of clusterSize x clusterSize cells. Along the
+    border between two adjacent clusters, every maximal run of cell pairs which
+    are free on both sides is an entrance. Short entrances get one transition, in
+    their middle, and long ones get two, at their ends. The two cells of a
+    transition are nodes of the abstract graph, joined by an inter-cluster edge
+    of cost 1. The nodes inside one cluster are joined by intra-cluster edges,
+    whose costs are their distances within the cluster.
+
+    Entrances are found for the whole grid when the graph is built, by scanning
+    the borders of the clusters, one row of clusters per step (see steps). Intra-cluster edges need one BFS per node of a
+    cluster, so they are computed the first time a search reaches the cluster,
+    and kept until the obstacles of the cluster change. This keeps the abstract
+    graph of very large grids affordable, since a search only visits the clusters
+    around its path.
+
+    When obstacles change, update() rebuilds the entrances on the borders of the
+    clusters containing the changed cells and drops the intra-cluster edges of
+    the clusters whose nodes or obstacles changed, leaving the rest of the graph
+    untouched.
+
+    Attributes:
+        grid (GridModel): The grid the graph is built for.
+        version (int): The version of the grid the graph matches.
+        clusterSize (int): The number of rows and columns of a cluster.
+        clusterRows (int): The number of rows of clusters.
+        clusterCols (int): The number of columns of clusters.
+        transitions (dict): A dictionary mapping (cluster, side) to the transitions
+            (pair of cells) on the right (side 0) or bottom (side 1) border of the cluster.
+        inter (dict): A dictionary mapping each node to the nodes across a border from it.
+        nodes (list): The set of nodes of every cluster.
+        intra (dict): A dictionary mapping each cluster whose intra-cluster edges are known
+            to a dictionary mapping each of its nodes to a list of (node, distance) pairs.
+        complete (bool): False until the borders of every cluster have been scanned.
+    """
+
+    # Default number of rows and columns of a cluster
+    defaultClusterSize = 16
+
+    # Entrances at least this wide get a transition at both ends instead of one in the middle
+    wideEntrance = 6
+
+    # Dictionary mapping (grid version, cluster size) to its graph, holding at most maxCached graphs
+    cache = {}
+    maxCached = 4
+
+    def __init__(self, grid: GridModel, clusterSize: int = None, build: bool = True) -> None:
+        self.grid = grid
+        self.version = grid.version
+        self.clusterSize = clusterSize or self.defaultClusterSize
+        self.clusterRows = -(-grid.rows // self.clusterSize)
+        self.clusterCols = -(-grid.cols // self.clusterSize)
+        self.transitions = {}
+        self.inter = {}
+        self.nodes = [set() for _ in range(self.clusterRows * self.clusterCols)]
+        self.intra = {}
+        self.complete = False
+        if build:
+            for _ in self.steps():
+                pass
+
+    @classmethod
+    def forGrid(cls, grid: GridModel, clusterSize: int = None) -> 'ClusterGraph':
+        """
+        Returns the abstract graph of a grid, building it if it is not cached.
+
+        Args:
+            grid (GridModel): The grid to get the graph for.
+            clusterSize (int): The number of rows and columns of a cluster.
+
+        Returns:
+            ClusterGraph: the abstract graph matching the obstacles of the grid.
+        """
+        steps = cls.stepsForGrid(grid, clusterSize)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    @classmethod
+    def stepsForGrid(cls, grid: GridModel, clusterSize: int = None) -> Generator:
+        """
+        Get the abstract graph of a grid, building it one step at a time if it
+        is not cached. The graph is only cached once it is complete.
+
+        Args:
+            grid (GridModel): The grid to get the graph for.
+            clusterSize (int): The number of rows and columns of a cluster.
+
+        Yields:
+            int: the index of the first cell of the row of clusters scanned by
+                every step of the build, nothing if the graph was found in the cache.
+
+        Returns:
+            ClusterGraph: the abstract graph matching the obstacles of the grid.
+        """
+        key = (grid.version, clusterSize or cls.defaultClusterSize)
+        graph = cls.cache.get(key)
+        if graph is not None and graph.grid.rows == grid.rows and graph.grid.cols == grid.cols:
+            return graph
+        graph = cls(grid, clusterSize, build=False)
+        yield from graph.steps()
+        if len(cls.cache) >= cls.maxCached:
+            del cls.cache[next(iter(cls.cache))]
+        cls.cache[key] = graph
+        return graph
+
+    def steps(self) -> Iterator[int]:
+        """
+        Find the entrances of every cluster, one row of clusters per step, then
+        gather the nodes of every cluster, one row of clusters per step as well.
+
+        Yields:
+            int: the index of the first cell of the row of clusters handled by the step.
+        """
+        clusterCols = self.clusterCols
+        for gather in (False, True):
+            for cluster_row in range(self.clusterRows):
+                first = cluster_row * clusterCols
+                for cluster in range(first, first + clusterCols):
+                    if gather:
+                        self.collectNodes(cluster)
+                    else:
+                        self.buildBorder(cluster, 0)
+                        self.buildBorder(cluster, 1)
+                yield cluster_row * self.clusterSize * self.grid.cols
+        self.complete = True
+
+    def clusterOf(self, index: int) -> int:
+        """
+        Get the cluster containing a cell.
+
+        Args:
+            index (int): Index of the cell.
+
+        Returns:
+            int: the index of the cluster, row-major among the clusters.
+        """
+        row, col = divmod(index, self.grid.cols)
+        return (row // self.clusterSize) * self.clusterCols + col // self.clusterSize
+
+    def bounds(self, cluster: int) -> tuple:
+        """
+        Get the cells covered by a cluster.
+
+        Args:
+            cluster (int): Index of the cluster.
+
+        Returns:
+            tuple: the first row, the row after the last, the first column and the column after the last.
+        """
+        size = self.clusterSize
+        cluster_row, cluster_col = divmod(cluster, self.clusterCols)
+        first_row, first_col = cluster_row * size, cluster_col * size
+        return first_row, min(first_row + size, self.grid.rows), first_col, min(first_col + size, self.grid.cols)
+
+    def buildBorder(self, cluster: int, side: int) -> None:
+        """
+        Find the transitions on the right or bottom border of a cluster, replacing the previous ones.
+
+        Args:
+            cluster (int): Index of the cluster.
+            side (int): 0 for the right border, 1 for the bottom border.
+        """
+        inter = self.inter
+        for a, b in self.transitions.pop((cluster, side), ()):
+            inter[a].discard(b)
+            inter[b].discard(a)
+            if not inter[a]:
+                del inter[a]
+            if not inter[b]:
+                del inter[b]
+
+        first_row, last_row, first_col, last_col = self.bounds(cluster)
+        cols = self.grid.cols
+        states = self.grid.states
+        if side == 0:
+            if last_col >= cols:
+                return
+            # Pairs (cell on the last column, cell to its right), top to bottom
+            cells = [row * cols + last_col - 1 for row in range(first_row, last_row)]
+            step = 1
+        else:
+            if last_row >= self.grid.rows:
+                return
+            # Pairs (cell on the last row, cell below it), left to right
+            cells = [(last_row - 1) * cols + col for col in range(first_col, last_col)]
+            step = cols
+
+        transitions = []
+        run = []
+        for cell in cells + [None]:
+            if cell is not None and states[cell] != OBSTACLE and states[cell + step] != OBSTACLE:
+                run.append(cell)
+                continue
+            if run:
+                if len(run) >= self.wideEntrance:
+                    transitions.append((run[0], run[0] + step))
+                    transitions.append((run[-1], run[-1] + step))
+                else:
+                    middle = run[len(run) // 2]
+                    transitions.append((middle, middle + step))
+                run = []
+
+        for a, b in transitions:
+            inter.setdefault(a, set()).add(b)
+            inter.setdefault(b, set()).add(a)
+        if transitions:
+            self.transitions[(cluster, side)] = transitions
+
+    def neighborClusters(self, cluster: int) -> list:
+        """
+        Get the clusters next to a cluster, with the border shared with each of them.
+
+        Args:
+            cluster (int): Index of the cluster.
+
+        Returns:
+            list: (neighbor cluster, owner of the border, side of the border) triples.
+        """
+        cluster_row, cluster_col = divmod(cluster, self.clusterCols)
+        clusters = []
+        if cluster_col < self.clusterCols - 1:
+            clusters.append((cluster + 1, cluster, 0))
+        if cluster_row < self.clusterRows - 1:
+            clusters.append((cluster + self.clusterCols, cluster, 1))
+        if cluster_col > 0:
+            clusters.append((cluster - 1, cluster - 1, 0))
+        if cluster_row > 0:
+            clusters.append((cluster - self.clusterCols, cluster - self.clusterCols, 1))
+        return clusters
+
+    def collectNodes(self, cluster: int) -> None:
+        """
+        Gather the nodes of a cluster from the transitions on its four borders.
+
+        Args:
+            cluster (int): Index of the cluster.
+        """
+        nodes = set()
+        for _, owner, side in self.neighborClusters(cluster):
+            for a, b in self.transitions.get((owner, side), ()):
+                nodes.add(a if owner == cluster else b)
+        self.nodes[cluster] = nodes
+
+    def update(self, grid: GridModel, changed) -> None:
+        """
+        Switch to a new version of the grid, rebuilding the clusters around the changed cells.
+
+        Args:
+            grid (GridModel): The new grid, of the same size.
+            changed: The flat indices of the cells which became or stopped being obstacles.
+        """
+        self.grid = grid
+        self.version = grid.version
+        dirty = {self.clusterOf(index) for index in changed}
+        stale = set(dirty)
+        for cluster in dirty:
+            for neighbor, owner, side in self.neighborClusters(cluster):
+                self.buildBorder(owner, side)
+                stale.add(neighbor)
+        for cluster in stale:
+            self.collectNodes(cluster)
+            self.intra.pop(cluster, None)
+
+    def searchCluster(self, source: int, cluster: int, goal: int = None, expanded: list = None) -> tuple:
+        """
+        Run a BFS from a cell, restricted to the cells of a cluster.
+
+        Args:
+            source (int): Index of the cell to start from.
+            cluster (int): Index of the cluster.
+            goal (int): Optional index of a cell at which to stop.
+            expanded (list): Optional list to record the expanded cells in.
+
+        Returns:
+            tuple: a dictionary mapping each reached cell to its distance from the source,
+                and a dictionary mapping each reached cell to its predecessor.
+        """
+        first_row, last_row, first_col, last_col = self.bounds(cluster)
+        cols = self.grid.cols
+        states = self.grid.states
+        distances = {source: 0}
+        parents = {source: -1}
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            if expanded is not None:
+                expanded.append(current)
+            if current == goal:
+                break
+            row, col = divmod(current, cols)
+            distance = distances[current] + 1
+            for neighbor, inside in ((current - cols, row > first_row), (current + cols, row < last_row - 1),
+                                     (current - 1, col > first_col), (current + 1, col < last_col - 1)):
+                if inside and neighbor not in distances and states[neighbor] != OBSTACLE:
+                    distances[neighbor] = distance
+                    parents[neighbor] = current
+                    queue.append(neighbor)
+        return distances, parents
+
+    def linksFrom(self, source: int, cluster: int, expanded: list = None) -> list:
+        """
+        Get the distances from a cell to the nodes of its cluster.
+
+        Args:
+            source (int): Index of the cell.
+            cluster (int): Index of the cluster containing the cell.
+            expanded (list): Optional list to record the expanded cells in.
+
+        Returns:
+            list: (node, distance) pairs for the nodes reachable within the cluster.
+        """
+        distances, _ = self.searchCluster(source, cluster, expanded=expanded)
+        return [(node, distances[node]) for node in self.nodes[cluster]
+                if node != source and node in distances]
+
+    def buildIntra(self, cluster: int) -> dict:
+        """
+        Compute the intra-cluster edges of a cluster.
+
+        The cells of the cluster are numbered locally and their free neighbors
+        listed once, then a BFS is run from every node but the last, stopping as
+        soon as the distances to the remaining nodes are known. Distances are
+        symmetric, so each BFS gives the edges of both ends.
+
+        Args:
+            cluster (int): Index of the cluster.
+
+        Returns:
+            dict: a dictionary mapping each node of the cluster to a list of (node, distance) pairs.
+        """
+        first_row, last_row, first_col, last_col = self.bounds(cluster)
+        width, height = last_col - first_col, last_row - first_row
+        cols = self.grid.cols
+        states = self.grid.states
+        free = [states[(first_row + local // width) * cols + first_col + local % width] != OBSTACLE
+                for local in range(width * height)]
+        adjacent = [[] for _ in range(width * height)]
+        for local in range(width * height):
+            if not free[local]:
+                continue
+            row, col = divmod(local, width)
+            if row > 0 and free[local - width]:
+                adjacent[local].append(local - width)
+                adjacent[local - width].append(local)
+            if col > 0 and free[local - 1]:
+                adjacent[local].append(local - 1)
+                adjacent[local - 1].append(local)
+
+        nodes = list(self.nodes[cluster])
+        locals_ = [((node // cols) - first_row) * width + node % cols - first_col for node in nodes]
+        edges = {node: [] for node in nodes}
+        for i in range(len(nodes) - 1):
+            targets = {locals_[j]: j for j in range(i + 1, len(nodes))}
+            distances = [-1] * (width * height)
+            distances[locals_[i]] = 0
+            frontier = [locals_[i]]
+            remaining = len(targets)
+            distance = 0
+            while frontier and remaining:
+                distance += 1
+                next_frontier = []
+                for current in frontier:
+                    for neighbor in adjacent[current]:
+                        if distances[neighbor] < 0:
+                            distances[neighbor] = distance
+                            next_frontier.append(neighbor)
+                            j = targets.get(neighbor)
+                            if j is not None:
+                                edges[nodes[i]].append((nodes[j], distance))
+                                edges[nodes[j]].append((nodes[i], distance))
+                                remaining -= 1
+                frontier = next_frontier
+        return edges
+
+    def neighbors(self, node: int) -> list:
+        """
+        Get the edges of a node of the abstract graph, computing the intra-cluster edges if needed.
+
+        Args:
+            node (int): Index of the cell of the node.
+
+        Returns:
+            list: (node, cost) pairs.
+        """
+        cluster = self.clusterOf(node)
+        edges = self.intra.get(cluster)
+        if edges is None:
+            edges = self.intra[cluster] = self.buildIntra(cluster)
+        links = list(edges.get(node, ()))
+        links.extend((other, 1) for other in self.inter.get(node, ()))
+        return links
@@ -0,0 +1,289 @@
+"""
+This module contains the ComponentIndex class, which labels the connected components of the free cells of a grid.
+"""
+
+from array import array
+from typing import Generator, Iterator
+
+from src.grid.GridModel import GridModel, OBSTACLE
+
+class ComponentIndex:
+    """
+    Connected components of the free cells of a grid, for O(1) reachability queries.
+
+    The components are labelled by a sweep over the horizontal runs of free cells:
+    each run is joined, with a union-find, to the runs of the row above which it
+    overlaps, and every cell then receives the label of its run. Runs are found
+    with find, so the Python cost is proportional to the number of runs
+    rather than the number of cells.
+
+    The labels are themselves nodes of a union-find, which makes opening a cell
+    cheap: it gets a new label, joined with the labels of its free neighbors.
+    Closing a cell may split a component, which a union-find cannot undo, so it
+    is only handled in place when the free neighbors of the cell stay connected
+    through the ring of its eight surrounding cells. Otherwise the index is
+    marked dirty and labelled again on the next query.
+
+    An index can follow a live grid model by being registered as its listener
+    (see GridModel.addListener). Indices of grid snapshots are cached by the
+    version of the grid with forGrid, or stepsForGrid which labels them over
+    many steps, and must not be updated.
+
+    Attributes:
+        grid (GridModel): The grid whose components are labelled.
+        version (int): The version of the grid the labels match.
+        labels (array): The label of every cell, -1 for obstacles.
+        parents (list): The parent of every label in the union-find of the labels.
+        dirty (bool): Whether the labels must be computed again before the next query.
+    """
+
+    # Offsets (row, col) of the eight cells around a cell, in clockwise order, starting above it
+    ring = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+    # Dictionary mapping grid version to its index, holding at most maxCached indices
+    cache = {}
+    maxCached = 4
+
+    def __init__(self, grid: GridModel, build: bool = True) -> None:
+        self.grid = grid
+        self.version = grid.version
+        self.labels = None
+        self.parents = []
+        self.dirty = True
+        if build:
+            self.build()
+
+    @classmethod
+    def forGrid(cls, grid: GridModel) -> 'ComponentIndex':
+        """
+        Returns the component index of a grid, building it if it is not cached.
+
+        Args:
+            grid (GridModel): The grid to get the index for.
+
+        Returns:
+            ComponentIndex: the index matching the obstacles of the grid.
+        """
+        steps = cls.stepsForGrid(grid)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    @classmethod
+    def stepsForGrid(cls, grid: GridModel) -> Generator:
+        """
+        Get the component index of a grid, labelling it one step at a time if it
+        is not cached. The index is only cached once it is labelled.
+
+        Args:
+            grid (GridModel): The grid to get the index for.
+
+        Yields:
+            int: the index of the first cell of the row or run handled by every
+                step, nothing if the index was found in the cache.
+
+        Returns:
+            ComponentIndex: the index matching the obstacles of the grid.
+        """
+        index = cls.cache.get(grid.version)
+        if index is None or len(index.labels) != grid.rows * grid.cols:
+            index = cls(grid, build=False)
+            yield from index.steps()
+            if len(cls.cache) >= cls.maxCached:
+                del cls.cache[next(iter(cls.cache))]
+            cls.cache[grid.version] = index
+        return index
+
+    def build(self) -> None:
+        """
+        Label the components of the grid from scratch, all at once.
+        """
+        for _ in self.steps():
+            pass
+
+    def steps(self) -> Iterator[int]:
+        """
+        Label the components of the grid from scratch, one row per step, then
+        as many runs per step as the grid has columns.
+
+        Algorithm:
+            1. For each row, find the runs of free cells between obstacles.
+            2. Join every run with the runs of the previous row it overlaps.
+            3. Give each set of joined runs a label, and write it into the cells of its runs.
+
+        The labels are only stored once every run is labelled, so that queries
+        made in between see the previous labels.
+
+        Yields:
+            int: the index of the first cell of the row or run handled by the step.
+        """
+        grid = self.grid
+        rows, cols = grid.rows, grid.cols
+        states = grid.searchableStates()
+        runs = []
+        run_parents = []
+
+        def find(run):
+            while run_parents[run] != run:
+                run_parents[run] = run_parents[run_parents[run]]
+                run = run_parents[run]
+            return run
+
+        wall_code = bytes((OBSTACLE,))
+        previous = []
+        for row in range(rows):
+            base = row * cols
+            row_end = base + cols
+            current = []
+            j = 0
+            position = base
+            while position < row_end:
+                wall = states.find(wall_code, position, row_end)
+                stop = row_end if wall < 0 else wall
+                if stop > position:
+                    run = len(runs)
+                    runs.append((position, stop))
+                    run_parents.append(run)
+                    first, last = position - base, stop - base
+                    # Skip the runs of the previous row which end before this one starts
+                    while j < len(previous) and previous[j][1] <= first:
+                        j += 1
+                    k = j
+                    while k < len(previous) and previous[k][0] < last:
+                        a, b = find(run), find(previous[k][2])
+                        if a != b:
+                            run_parents[a] = b
+                        k += 1
+                    current.append((first, last, run))
+                position = stop + 1
+            previous = current
+            yield base
+
+        labels = array('i', [-1]) * (rows * cols)
+        roots = {}
+        for run, (first, last) in enumerate(runs):
+            label = roots.setdefault(find(run), len(roots))
+            labels[first:last] = array('i', [label]) * (last - first)
+            if run % cols == cols - 1:
+                yield first
+        self.labels = labels
+        self.parents = list(range(len(roots)))
+        self.version = grid.version
+        self.dirty = False
+
+    def find(self, label: int) -> int:
+        """
+        Find the representative label of the component of a label.
+
+        Args:
+            label (int): The label.
+
+        Returns:
+            int: the representative label.
+        """
+        parents = self.parents
+        while parents[label] != label:
+            parents[label] = parents[parents[label]]
+            label = parents[label]
+        return label
+
+    def update(self, indices) -> None:
+        """
+        Update the labels after cells became or stopped being obstacles.
+
+        Args:
+            indices: flat indices of the cells which became or stopped being obstacles.
+        """
+        self.version = self.grid.version
+        if self.dirty:
+            return
+        states = self.grid.states
+        labels, parents = self.labels, self.parents
+        cols = self.grid.cols
+        for index in indices:
+            if states[index] == OBSTACLE:
+                if labels[index] >= 0:
+                    labels[index] = -1
+                    if self.splits(index):
+                        self.dirty = True
+                        return
+            elif labels[index] < 0:
+                label = len(parents)
+                parents.append(label)
+                labels[index] = label
+                row, col = divmod(index, cols)
+                for d_row, d_col in self.ring[::2]:
+                    if self.isFree(row + d_row, col + d_col):
+                        neighbor = labels[index + d_row * cols + d_col]
+                        if neighbor >= 0:
+                            root = self.find(neighbor)
+                            if root != label:
+                                parents[root] = label
+
+    def isFree(self, row: int, col: int) -> bool:
+        """
+        Check whether a cell lies inside the grid and is not an obstacle.
+        """
+        return self.grid.isPassable(row, col)
+
+    def splits(self, index: int) -> bool:
+        """
+        Check whether closing a cell may split its component.
+
+        The component cannot split if the free neighbors of the cell are all part
+        of the same arc of free cells around it.
+
+        Args:
+            index (int): Index of the closed cell.
+
+        Returns:
+            bool: True if the component may have been split.
+        """
+        row, col = divmod(index, self.grid.cols)
+        free = [self.isFree(row + d_row, col + d_col) for d_row, d_col in self.ring]
+        if all(free):
+            return False
+        arcs = 0
+        for i in range(8):
+            if free[i] and not free[i - 1]:
+                # Walk the arc starting here, checking whether it holds a neighbor of the cell
+                j = i
+                touches = False
+                while free[j % 8]:
+                    touches = touches or j % 2 == 0
+                    j += 1
+                arcs += touches
+        return arcs > 1
+
+    def connected(self, a: int, b: int) -> bool:
+        """
+        Check whether a path exists between two cells.
+
+        Args:
+            a (int): Index of the first cell.
+            b (int): Index of the second cell.
+
+        Returns:
+            bool: True if both cells are free and in the same component.
+        """
+        if self.dirty:
+            self.build()
+        label_a, label_b = self.labels[a], self.labels[b]
+        return label_a >= 0 and label_b >= 0 and self.find(label_a) == self.find(label_b)
+
+    def componentOf(self, index: int) -> int:
+        """
+        Get the component of a cell.
+
+        Args:
+            index (int): Index of the cell.
+
+        Returns:
+            int: the representative label of the component, -1 for obstacles.
+        """
+        if self.dirty:
+            self.build()
+        label = self.labels[index]
+        return self.find(label) if label >= 0 else -1
@@ -0,0 +1,70 @@
+"""
+Depth First Search engine implementation.
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+
+class DFSEngine(BaseEngine):
+    """
+    Depth First Search engine.
+
+    The Depth First Search algorithm is a tree traversal algorithm. It starts
+    at the root of the tree and explores as far as possible along each branch
+    before backtracking.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    connectivities = (4, 8)
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements the DFS algorithm to find a path from
+        the source node to the destination node.
+
+        Algorithm:
+            1. Initialize the stack with the source node.
+            2. While the stack is not empty:
+                2.1. Remove the last node from the stack.
+                2.2. If the node has already been visited, continue to the
+                next iteration.
+                2.3. Record the node as expanded.
+                2.4. If the node is the end node, build the path and return.
+                2.5. For each neighbor of the node which has not been visited,
+                set its parent and push it into the stack.
+        """
+        stack = [start]
+        state = self.state
+        parents, closed, generation = state.parents, state.closed, state.generation
+        parents[start] = -1
+        expanded = result.expanded
+        masks, offsets = self.masks, self.offsets
+        peak = 1
+
+        while stack and not self.isStopped():
+            current = stack.pop()
+
+            if closed[current] == generation:
+                continue
+
+            closed[current] = generation
+            expanded.append(current)
+            yield current
+
+            if current == end:
+                self.finish(result, parents, end)
+                break
+
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if closed[neighbor] != generation:
+                    stack.append(neighbor)
+                    parents[neighbor] = current
+                    result.heapPushes += 1
+            if len(stack) > peak:
+                peak = len(stack)
+
+        result.peakFrontier = peak
@@ -0,0 +1,235 @@
+"""
+This module contains the headless implementation of the D* Lite incremental search algorithm.
+"""
+
+from array import array
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.IndexedHeap import IndexedHeap
+from src.grid.GridModel import GridModel, OBSTACLE
+
+class DStarLiteEngine(BaseEngine):
+    """
+    D* Lite search engine.
+
+    D* Lite searches backward, from the end cell to the start cell, and keeps
+    two estimates of the distance of every cell to the end cell: g, the value
+    computed by the last expansion, and rhs, the one-step lookahead from the
+    g values of the neighbors. A cell is consistent when both are equal. When
+    obstacles change, only the cells around the changed ones are updated and
+    the search repairs the inconsistent cells, instead of starting from scratch.
+
+    Unlike the other engines, a D* Lite engine is meant to be kept alive between
+    searches: updateGrid() gives it the new grid along with the changed cells,
+    and the next search reuses everything computed before. The start cell may
+    move between searches; the end cell may not, otherwise the engine restarts.
+
+    Attributes:
+        goal (int): The index of the end cell of the search tree, None before the first search.
+        last (int): The index of the start cell of the last search.
+        km (int): The key modifier, accumulating the heuristic distance moved by the start cell.
+        g (array): The distance of every cell to the end cell, as computed by the last expansion.
+        rhs (array): The one-step lookahead distance of every cell to the end cell.
+        open (IndexedHeap): The inconsistent cells, keyed by their (k1, k2) key.
+        pushes (int): The number of cells queued since the engine was created.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    # Distance of the cells which cannot reach the end cell
+    infinity = 1 << 30
+
+    # The g and rhs values are kept in the arrays of the engine, across searches
+    usesState = False
+
+    def __init__(self, grid: GridModel, stopEvent=None, openListClass=None, state=None, heuristic=None) -> None:
+        # Keys are (k1, k2) tuples and cells must be removable, so the open list is always an IndexedHeap
+        super().__init__(grid, stopEvent, IndexedHeap, state, heuristic)
+        self.goal = None
+        self.last = None
+        self.km = 0
+        self.g = None
+        self.rhs = None
+        self.open = None
+        self.pushes = 0
+
+    def initialize(self, start: int, goal: int) -> None:
+        """
+        Forget the search tree and start a new one, rooted at the goal cell.
+
+        Args:
+            start (int): The index of the start cell.
+            goal (int): The index of the goal cell.
+        """
+        size = self.rows * self.cols
+        self.goal = goal
+        self.last = start
+        self.km = 0
+        self.g = array('i', [self.infinity]) * size
+        self.rhs = array('i', [self.infinity]) * size
+        self.rhs[goal] = 0
+        self.open = self.openListClass()
+        self.open.push(self.calculateKey(goal, start), goal)
+
+    def updateGrid(self, grid: GridModel, changed) -> None:
+        """
+        Switch to a new version of the grid, in which some cells became or stopped being obstacles.
+
+        The cells whose distance may have changed, i.e. the changed cells and their
+        neighbors, are updated and queued, to be repaired by the next search.
+
+        Args:
+            grid (GridModel): The new grid, of the same size.
+            changed: The flat indices of the cells which became or stopped being obstacles.
+        """
+        self.grid = grid
+        self.states = grid.states
+        self.masks = grid.neighborMasks()
+        if self.open is None:
+            return
+        for index in changed:
+            self.updateVertex(index)
+            for neighbor in self.adjacent(index):
+                self.updateVertex(neighbor)
+
+    def adjacent(self, index: int) -> list:
+        """
+        Get the cells next to a cell, obstacles included.
+
+        Args:
+            index (int): Index of the cell.
+
+        Returns:
+            list: the indices of the neighbors which are inside the grid.
+        """
+        cols = self.cols
+        row, col = divmod(index, cols)
+        cells = []
+        if row > 0:
+            cells.append(index - cols)
+        if row < self.rows - 1:
+            cells.append(index + cols)
+        if col > 0:
+            cells.append(index - 1)
+        if col < cols - 1:
+            cells.append(index + 1)
+        return cells
+
+    def calculateKey(self, index: int, start: int) -> tuple:
+        """
+        Calculate the key of a cell in the open list.
+
+        Args:
+            index (int): Index of the cell.
+            start (int): Index of the start cell.
+
+        Returns:
+            tuple: the key (k1, k2) of the cell, compared lexicographically.
+        """
+        distance = min(self.g[index], self.rhs[index])
+        return (distance + self.heuristic(start, index) + self.km, distance)
+
+    def updateVertex(self, index: int) -> None:
+        """
+        Recompute the rhs value of a cell, and queue it if it is inconsistent.
+
+        Args:
+            index (int): Index of the cell.
+        """
+        g, rhs = self.g, self.rhs
+        if index != self.goal:
+            best = self.infinity
+            if self.states[index] != OBSTACLE:
+                for neighbor in self.neighbors(index):
+                    if g[neighbor] + 1 < best:
+                        best = g[neighbor] + 1
+            rhs[index] = min(best, self.infinity)
+        if index in self.open:
+            self.open.remove(index)
+        if g[index] != rhs[index]:
+            self.open.push(self.calculateKey(index, self.last), index)
+            self.pushes += 1
+
+    def computeShortestPath(self, start: int, result) -> Iterator[int]:
+        """
+        Expand inconsistent cells until the start cell is consistent and no cell
+        in the open list can lower its distance.
+
+        The generator is only suspended between two expansions, when the open
+        list holds every inconsistent cell, so a search dropped halfway leaves
+        the engine in a state from which the next search can carry on.
+
+        Algorithm:
+            1. While the open list has a key lower than the key of the start cell,
+            or the start cell is inconsistent:
+                1.1. Pop the cell with the lowest key and record it as expanded.
+                1.2. If its key is out of date, queue it again with the new key.
+                1.3. If it is overconsistent (g > rhs), set g to rhs and update
+                its neighbors.
+                1.4. Otherwise it is underconsistent: set g to infinity and
+                update the cell and its neighbors.
+
+        Args:
+            start (int): Index of the start cell.
+            result (SearchResult): The result to record the expanded cells in.
+
+        Yields:
+            int: the index of every expanded cell, once its neighbors are updated.
+        """
+        g, rhs = self.g, self.rhs
+        open_set = self.open
+        expanded = result.expanded
+        peak = len(open_set)
+
+        while open_set and not self.isStopped():
+            top_key, current = open_set.peek()
+            if top_key >= self.calculateKey(start, start) and rhs[start] == g[start]:
+                break
+            open_set.pop()
+            expanded.append(current)
+
+            new_key = self.calculateKey(current, start)
+            if top_key < new_key:
+                open_set.push(new_key, current)
+            elif g[current] > rhs[current]:
+                g[current] = rhs[current]
+                for neighbor in self.neighbors(current):
+                    self.updateVertex(neighbor)
+            else:
+                g[current] = self.infinity
+                self.updateVertex(current)
+                for neighbor in self.neighbors(current):
+                    self.updateVertex(neighbor)
+            if len(open_set) > peak:
+                peak = len(open_set)
+            yield current
+
+        result.peakFrontier = peak
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Plan a path from the start cell to the end cell, reusing the previous search tree.
+        """
+        if self.open is None or end != self.goal:
+            self.initialize(start, end)
+        elif start != self.last:
+            self.km += self.heuristic(self.last, start)
+            self.last = start
+
+        pushes = self.pushes
+        yield from self.computeShortestPath(start, result)
+        result.heapPushes = self.pushes - pushes
+        if self.isStopped() or self.g[start] >= self.infinity:
+            return
+
+        # Walk down the g values from the start cell to the end cell
+        g = self.g
+        path = [start]
+        current = start
+        while current != end:
+            current = min(self.neighbors(current), key=g.__getitem__)
+            path.append(current)
+        result.path = path
+        result.cost = self.grid.pathCost(path)
@@ -0,0 +1,93 @@
+"""
+This module contains the headless implementation of the Dijkstra search algorithm.
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.BucketOpenList import BucketOpenList
+
+class DijkstraEngine(BaseEngine):
+    """
+    Dijkstra search engine.
+    The Dijkstra search algorithm is an extension of the BFS search algorithm
+    for weighted graphs. On grids with movement costs, the weight of a move is
+    the cost of the cell it enters, times diagonalCost for diagonal moves on
+    8-connected grids.
+
+    Args:
+        BaseEngine: Base class for all search engines.
+    """
+
+    # Distances are small integers, so a bucket queue is used by default
+    openListClass = BucketOpenList
+
+    usesCosts = True
+
+    connectivities = (4, 8)
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements the Dijkstra algorithm to find the shortest path from
+        the source node to the destination node.
+
+        Algorithm:
+            1. Initialize the priority queue with the source node and
+                initialize the distance of the source node to 0.
+            2. While the priority queue is not empty:
+                2.1. Remove the node with the lowest distance from the
+                priority queue.
+                2.2. If the node has already been visited, continue to the
+                next iteration.
+                2.3. Record the node as expanded.
+                2.4. If the node is the end node, build the path and return.
+                2.5. For each neighbor of the node:
+                    2.5.1. Calculate the distance of the neighbor.
+                    2.5.2. If the distance of the neighbor is less than the
+                    current distance, update the distance, update the parent
+                    and push the neighbor to the priority queue.
+        """
+        priority_queue = self.openListClass()
+        push, pop = priority_queue.push, priority_queue.pop
+        push(0, start)
+        state = self.state
+        costs = self.costs
+        parents = state.parents
+        distances = state.useWeightedCosts() if self.fractionalCosts else state.costs
+        reached, closed, generation = state.reached, state.closed, state.generation
+        parents[start] = -1
+        distances[start] = 0
+        reached[start] = generation
+        expanded = result.expanded
+        masks, moves = self.masks, self.moves
+        peak = 1
+
+        while priority_queue and not self.isStopped():
+            current_distance, current = pop()
+
+            if closed[current] == generation:
+                continue
+
+            closed[current] = generation
+            expanded.append(current)
+            yield current
+
+            if current == end:
+                self.finish(result, parents, end)
+                break
+
+            for offset, length in moves[masks[current]]:
+                neighbor = current + offset
+                new_distance = current_distance + (length if costs is None else length * costs[neighbor])
+                if reached[neighbor] != generation or new_distance < distances[neighbor]:
+                    reached[neighbor] = generation
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = current
+                    if push(new_distance, neighbor):
+                        result.heapPushes += 1
+                    else:
+                        result.decreaseKeys += 1
+            if len(priority_queue) > peak:
+                peak = len(priority_queue)
+
+        result.peakFrontier = peak
@@ -0,0 +1,136 @@
+"""
+This module contains the DistanceField class, which holds the distance of every cell to a goal cell.
+"""
+
+from array import array
+from collections import deque
+from typing import Iterator
+
+from src.grid.GridModel import GridModel
+
+class DistanceField:
+    """
+    Class that holds the distance from every cell of a grid to a goal cell.
+
+    The field is computed by a reverse BFS from the goal, which is the same as a
+    reverse Dijkstra on a uniform-cost grid. Once computed, the shortest path from
+    any start cell to the goal is found by gradient descent: from the start, step
+    to a neighbor one closer to the goal until the goal is reached, in O(path
+    length) and without any search. On 8-connected grids, the distances count
+    moves, diagonal ones included, so the paths have the fewest moves.
+
+    Attributes:
+        rows (int): The number of rows in the grid.
+        cols (int): The number of columns in the grid.
+        goal (int): The index of the goal cell.
+        version (int): The version of the grid the field was computed for.
+        connectivity (int): The number of neighbors of a cell, 4 or 8.
+        distances (array): The distance of every cell to the goal, -1 if it cannot reach the goal.
+        order (array): The cells reached by the reverse search, in the order they were expanded.
+        complete (bool): False if the computation was stopped before it finished.
+    """
+
+    # Number of cells expanded by every step of the reverse search, see steps
+    cellsPerStep = 64
+
+    def __init__(self, grid: GridModel, goal: int, stopEvent=None, connectivity: int = 4,
+                 build: bool = True) -> None:
+        self.rows = grid.rows
+        self.cols = grid.cols
+        self.goal = goal
+        self.version = grid.version
+        self.connectivity = connectivity
+        self.distances = array('i', [-1]) * (self.rows * self.cols)
+        self.order = array('i')
+        self.complete = False
+        if build:
+            self.build(grid, stopEvent)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the memory used by the arrays of the field, in bytes.
+        """
+        return (len(self.distances) * self.distances.itemsize
+                + len(self.order) * self.order.itemsize)
+
+    def build(self, grid: GridModel, stopEvent=None) -> None:
+        """
+        Compute the distances with a BFS from the goal cell, all at once.
+
+        Args:
+            grid (GridModel): The grid to compute the field on.
+            stopEvent (threading.Event): Optional event which aborts the computation once set.
+        """
+        for _ in self.steps(grid, stopEvent):
+            pass
+
+    def steps(self, grid: GridModel, stopEvent=None) -> Iterator[int]:
+        """
+        Compute the distances with a BFS from the goal cell, one step at a time.
+
+        Every step expands cellsPerStep cells, so that a caller stepping the
+        computation from the GUI thread can draw frames and stop it in between.
+
+        Args:
+            grid (GridModel): The grid to compute the field on.
+            stopEvent (threading.Event): Optional event which aborts the computation once set.
+
+        Yields:
+            int: the index of the last cell expanded by the step.
+        """
+        masks, offsets = grid.neighborMasks(), grid.neighborOffsets(self.connectivity)
+        distances = self.distances
+        order = self.order
+        cellsPerStep = self.cellsPerStep
+        distances[self.goal] = 0
+        queue = deque([self.goal])
+        count = 0
+        current = self.goal
+        # Moves can be taken both ways, so the moves into a cell are the moves out of it
+        while queue:
+            if stopEvent is not None and stopEvent.is_set():
+                return
+            current = queue.popleft()
+            order.append(current)
+            distance = distances[current] + 1
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if distances[neighbor] < 0:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+            count += 1
+            if count == cellsPerStep:
+                count = 0
+                yield current
+        self.complete = True
+        if count:
+            yield current
+
+    def pathFrom(self, start: int, grid: GridModel) -> list:
+        """
+        Follow the distances down from a start cell to the goal cell.
+
+        Args:
+            start (int): The index of the start cell.
+            grid (GridModel): The grid the field was computed for, whose moves
+                the field is descended along.
+
+        Returns:
+            list: the cells of a shortest path from the start cell to the goal,
+                empty if the start cell cannot reach the goal.
+        """
+        distances = self.distances
+        if distances[start] < 0:
+            return []
+        masks, offsets = grid.neighborMasks(), grid.neighborOffsets(self.connectivity)
+        path = [start]
+        current = start
+        while current != self.goal:
+            closer = distances[current] - 1
+            for offset in offsets[masks[current]]:
+                if distances[current + offset] == closer:
+                    current += offset
+                    break
+            path.append(current)
+        return path
@@ -0,0 +1,129 @@
+"""
+This module contains the DistanceFieldCache class, an LRU cache of distance fields bounded by memory.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Generator
+
+from src.engine.DistanceField import DistanceField
+from src.grid.GridModel import GridModel
+
+class DistanceFieldCache:
+    """
+    Least recently used cache of distance fields.
+
+    Fields are keyed by (grid version, goal, connectivity). The version of a grid
+    changes whenever its obstacles change, so a field computed before an obstacle
+    edit is never served afterwards; it simply stops being used and is evicted.
+    Once the fields take more than the memory budget, the least recently used
+    ones are evicted first. The cache can be shared between threads.
+
+    Attributes:
+        maxBytes (int): The memory budget of the cached fields, in bytes.
+        fields (OrderedDict): The cached fields, the most recently used last.
+        usedBytes (int): The memory used by the cached fields, in bytes.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups which computed a new field.
+    """
+
+    # Default memory budget, in bytes
+    defaultMaxBytes = 64 * 1024 * 1024
+
+    def __init__(self, maxBytes: int = None) -> None:
+        self.maxBytes = maxBytes if maxBytes is not None else self.defaultMaxBytes
+        self.fields = OrderedDict()
+        self.usedBytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def get(self, grid: GridModel, goal: int, connectivity: int = 4, stopEvent=None) -> tuple:
+        """
+        Returns the distance field of a goal cell, computing it if it is not cached.
+
+        Fields whose computation was stopped are returned but not cached.
+
+        Args:
+            grid (GridModel): The grid to get the field for.
+            goal (int): The index of the goal cell.
+            connectivity (int): The number of neighbors of a cell.
+            stopEvent (threading.Event): Optional event which aborts the computation once set.
+
+        Returns:
+            tuple: the distance field and True if it was found in the cache.
+        """
+        steps = self.steps(grid, goal, connectivity, stopEvent)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    def steps(self, grid: GridModel, goal: int, connectivity: int = 4, stopEvent=None,
+              expanded: list = None) -> Generator:
+        """
+        Get the distance field of a goal cell, computing it one step at a time
+        if it is not cached (see DistanceField.steps).
+
+        A field is only cached once its computation completes, so dropping the
+        generator or stopping the computation leaves the cache as it was.
+
+        Args:
+            grid (GridModel): The grid to get the field for.
+            goal (int): The index of the goal cell.
+            connectivity (int): The number of neighbors of a cell.
+            stopEvent (threading.Event): Optional event which aborts the computation once set.
+            expanded (list): Optional list to record the cells expanded by every step in,
+                before the step yields.
+
+        Yields:
+            int: the index of the last cell expanded by every step of the computation,
+                nothing if the field was found in the cache.
+
+        Returns:
+            tuple: the distance field and True if it was found in the cache.
+        """
+        key = (grid.version, goal, connectivity)
+        with self._lock:
+            field = self.fields.get(key)
+            if field is not None:
+                self.fields.move_to_end(key)
+                self.hits += 1
+                return field, True
+        field = DistanceField(grid, goal, connectivity=connectivity, build=False)
+        order = field.order
+        recorded = 0
+        for cell in field.steps(grid, stopEvent):
+            if expanded is not None:
+                expanded.extend(order[recorded:])
+                recorded = len(order)
+            yield cell
+        with self._lock:
+            self.misses += 1
+            if field.complete and key not in self.fields:
+                self.fields[key] = field
+                self.usedBytes += field.nbytes
+                self.evict()
+        return field, False
+
+    def evict(self) -> None:
+        """
+        Evict the least recently used fields until the cache fits its memory budget.
+
+        The most recently added field is kept even if it alone exceeds the budget.
+        """
+        while self.usedBytes > self.maxBytes and len(self.fields) > 1:
+            _, field = self.fields.popitem(last=False)
+            self.usedBytes -= field.nbytes
+
+    def clear(self) -> None:
+        """
+        Remove every field from the cache.
+        """
+        with self._lock:
+            self.fields.clear()
+            self.usedBytes = 0
@@ -0,0 +1,51 @@
+"""
+This module contains the headless implementation of the distance field search.
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.DistanceFieldCache import DistanceFieldCache
+
+class FieldEngine(BaseEngine):
+    """
+    Distance field search engine.
+
+    The engine looks up the distance field of the end cell in a cache shared by
+    all instances, computing it with a reverse BFS from the end cell on a miss,
+    DistanceField.cellsPerStep cells per step, and then descends the field from
+    the start cell. Repeated queries toward the same end cell on an unchanged
+    grid therefore only cost O(path length). The expanded cells are those of the
+    reverse search when the field was computed, recorded step by step, and none
+    when it came from the cache. On 8-connected grids, the path has the
+    fewest moves, diagonal ones included.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    # Cache of distance fields, shared by all field engines
+    cache = DistanceFieldCache()
+
+    # The connectivity of the grid is part of the key of the cached fields
+    connectivities = (4, 8)
+
+    # The distances are kept in the cached fields
+    usesState = False
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Find a shortest path by descending the distance field of the end cell.
+
+        The field is computed over as many steps as it takes, and the path is then read from it.
+        """
+        field, cached = yield from self.cache.steps(self.grid, end, self.connectivity, self.stopEvent,
+                                                    result.expanded)
+        if not cached:
+            result.heapPushes = max(len(field.order) - 1, 0)
+        if not field.complete:
+            return
+        path = field.pathFrom(start, self.grid)
+        if path:
+            result.path = path
+            result.cost = self.grid.pathCost(path)
@@ -0,0 +1,115 @@
+"""
+This module contains the headless implementation of the Fringe Search algorithm.
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+
+class FringeSearchEngine(BaseEngine):
+    """
+    Fringe Search engine.
+
+    Fringe Search sits between A* and IDA*: like IDA*, it expands the cells
+    whose f_cost (g_cost plus heuristic) does not exceed a threshold, raising
+    the threshold to the lowest f_cost which exceeded it once none are left,
+    but it keeps the fringe of the search between two iterations instead of
+    starting over from the start cell. The fringe is held in two plain lists:
+    now, expanded depth-first, and later, the cells whose f_cost exceeded the
+    threshold, which become the next now. Nothing is ever sorted, so there is
+    no priority queue to maintain, and the g_costs and parents are kept in the
+    SearchState as with A*. On grids with movement costs, it finds the
+    cheapest path, with the heuristic scaled by the lowest cost of the grid.
+
+    Unlike IDA*, it is not memory-bounded: the SearchState holds every cell,
+    and a cell is pushed again whenever its g_cost drops, rather than moved,
+    so the lists may hold stale entries, skipped once the cell has been expanded.
+    Their peak length is reported as the peak frontier.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    usesCosts = True
+
+    connectivities = (4, 8)
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements Fringe Search to find the shortest path from
+        the source node to the destination node.
+
+        Algorithm:
+            1. Initialize the now list with the source node, the later list
+            empty, and the threshold with the heuristic cost of the source node.
+            2. While either list is not empty:
+                2.1. If the now list is empty, the later list becomes the now
+                list and the lowest f_cost deferred to it becomes the threshold.
+                2.2. Pop the last node of the now list. Skip it if it has been
+                expanded since it was pushed.
+                2.3. If its f_cost exceeds the threshold, append it to the later
+                list and keep its f_cost if it is the lowest one deferred so far.
+                2.4. Otherwise, record the node as expanded. If it is the end
+                node, build the path and return.
+                2.5. For each neighbor of the node, calculate its g_cost. If it
+                is lower than the current g_cost of the neighbor, update its
+                g_cost and parent and push it onto the now list, to be expanded
+                again if it was already.
+        """
+        state = self.state
+        costs = self.costs
+        parents = state.parents
+        g_costs = state.useWeightedCosts() if self.fractionalCosts else state.costs
+        reached, closed, generation = state.reached, state.closed, state.generation
+        parents[start] = -1
+        g_costs[start] = 0
+        reached[start] = generation
+        expanded = result.expanded
+        masks, moves = self.masks, self.moves
+        heuristic = self.heuristic
+        threshold = heuristic(start, end)
+        lowest_deferred = float('inf')
+        now, later = [start], []
+        peak = 1
+
+        while (now or later) and not self.isStopped():
+            if not now:
+                # Cells are popped from the end of now, so the oldest deferred ones come first
+                later.reverse()
+                now, later = later, now
+                threshold, lowest_deferred = lowest_deferred, float('inf')
+
+            current = now.pop()
+            if closed[current] == generation:
+                continue
+            g_cost = g_costs[current]
+            f_cost = g_cost + heuristic(current, end)
+            if f_cost > threshold:
+                later.append(current)
+                if f_cost < lowest_deferred:
+                    lowest_deferred = f_cost
+                continue
+
+            closed[current] = generation
+            expanded.append(current)
+            yield current
+
+            if current == end:
+                self.finish(result, parents, end)
+                break
+
+            for offset, length in moves[masks[current]]:
+                neighbor = current + offset
+                tentative_g_cost = g_cost + (length if costs is None else length * costs[neighbor])
+                if reached[neighbor] != generation or tentative_g_cost < g_costs[neighbor]:
+                    reached[neighbor] = generation
+                    # A cheaper path reopens an expanded cell
+                    closed[neighbor] = 0
+                    g_costs[neighbor] = tentative_g_cost
+                    parents[neighbor] = current
+                    now.append(neighbor)
+                    result.heapPushes += 1
+            if len(now) + len(later) > peak:
+                peak = len(now) + len(later)
+
+        result.peakFrontier = peak
@@ -0,0 +1,80 @@
+"""
+This module contains the headless implementation of the Greedy Best First Search algorithm.
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.BucketOpenList import BucketOpenList
+
+class GBFSEngine(BaseEngine):
+    """
+    Greedy Best First Search engine.
+
+    The Greedy Best First Search algorithm is search algorithm that
+    attempts to find the most promising path from a given starting point
+    to a goal. It prioritizes paths that appear to be the most promising,
+    regardless of whether or not they are actually the shortest path.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    # Heuristic costs are small integers, so a bucket queue is used by default
+    openListClass = BucketOpenList
+
+    connectivities = (4, 8)
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements the Greedy Best First Search algorithm to find a
+        path from the source node to the destination node.
+
+        Algorithm:
+            1. Initialize the open set with the source node.
+            2. While the open set is not empty:
+                2.1. Remove the node with the lowest heuristic cost from
+                the open set.
+                2.2. Record the node as expanded.
+                2.3. If the node is the end node, build the path and return.
+                2.4. For each neighbor of the node which has not been reached
+                yet, push it to the open set with its heuristic cost and set
+                its parent.
+
+        Notes:
+            - The heuristic cost of a node does not depend on how it was reached,
+            so every node is pushed at most once.
+        """
+        open_set = self.openListClass()
+        push, pop = open_set.push, open_set.pop
+        push(0, start)
+        state = self.state
+        parents, reached, generation = state.parents, state.reached, state.generation
+        parents[start] = -1
+        reached[start] = generation
+        expanded = result.expanded
+        masks, offsets = self.masks, self.offsets
+        heuristic = self.heuristic
+        peak = 1
+
+        while open_set and not self.isStopped():
+            _, current = pop()
+
+            expanded.append(current)
+            yield current
+
+            if current == end:
+                self.finish(result, parents, end)
+                break
+
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if reached[neighbor] != generation:
+                    reached[neighbor] = generation
+                    push(heuristic(neighbor, end), neighbor)
+                    parents[neighbor] = current
+                    result.heapPushes += 1
+            if len(open_set) > peak:
+                peak = len(open_set)
+
+        result.peakFrontier = peak
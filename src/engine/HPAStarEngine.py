@@ -0,0 +1,182 @@
+"""
+This module contains the headless implementation of hierarchical path finding (HPA*).
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.ClusterGraph import ClusterGraph
+from src.grid.GridModel import GridModel
+
+class HPAStarEngine(BaseEngine):
+    """
+    Hierarchical A* (HPA*) search engine.
+
+    Instead of searching the grid cell by cell, HPA* searches the abstract graph
+    of a ClusterGraph, whose nodes are the entrances between clusters of cells,
+    and only then refines the abstract path into cells, one cluster at a time.
+    The start and end cells are linked to the nodes of their clusters for the
+    duration of the search. The paths found are near-optimal: they may be a few
+    steps longer than the shortest ones, since entrances only cross the borders
+    at a few places.
+
+    The abstract nodes expanded are recorded in result.abstractExpanded, and the
+    cells expanded while linking the start and end cells and refining the path
+    in result.expanded.
+
+    Attributes:
+        graph (ClusterGraph): The abstract graph to search, the cached graph of the grid if None.
+            prepare looks it up, or builds the graph given or the cached one if it is not complete.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    # The abstract search and the searches inside the clusters keep their own dictionaries
+    usesState = False
+
+    def __init__(self, grid: GridModel, stopEvent=None, openListClass=None, state=None, heuristic=None,
+                 graph=None) -> None:
+        super().__init__(grid, stopEvent, openListClass, state, heuristic)
+        self.graph = graph
+
+    def prepare(self) -> Iterator[int]:
+        """
+        Build the abstract graph one row of clusters per step, unless it is
+        complete already (see ClusterGraph.steps).
+        """
+        if self.graph is None:
+            self.graph = yield from ClusterGraph.stepsForGrid(self.grid)
+        elif not self.graph.complete:
+            yield from self.graph.steps()
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements HPA* to find a path from the source node to the destination node.
+
+        Algorithm:
+            1. Link the start and end cells to the nodes of their clusters, and link
+            them to each other if they share a cluster.
+            2. Run A* on the abstract graph, from the start cell to the end cell,
+            with the heuristic of the engine.
+            3. Refine every intra-cluster edge of the abstract path with a BFS
+            restricted to its cluster; inter-cluster edges are single steps.
+
+        Every abstract node expanded is a step, and so is every refined edge.
+        """
+        graph = self.graph
+        if start == end:
+            result.path = [start]
+            result.cost = 0
+            return
+
+        start_cluster, end_cluster = graph.clusterOf(start), graph.clusterOf(end)
+        start_links = graph.linksFrom(start, start_cluster, result.expanded)
+        end_links = dict(graph.linksFrom(end, end_cluster, result.expanded))
+        if start_cluster == end_cluster:
+            distances, _ = graph.searchCluster(start, start_cluster, end)
+            if end in distances:
+                start_links.append((end, distances[end]))
+
+        abstract = yield from self.searchAbstract(graph, start, end, start_links, end_links, result)
+        if abstract and not self.isStopped():
+            yield from self.refine(graph, abstract, result)
+
+    def searchAbstract(self, graph: ClusterGraph, start: int, end: int, start_links: list,
+                       end_links: dict, result) -> Iterator[int]:
+        """
+        Run A* on the abstract graph extended with the start and end cells.
+
+        Args:
+            graph (ClusterGraph): The abstract graph.
+            start (int): Index of the start cell.
+            end (int): Index of the end cell.
+            start_links (list): (node, distance) pairs linking the start cell to the graph.
+            end_links (dict): A dictionary mapping nodes to their distance to the end cell.
+            result (SearchResult): The result to record the expanded nodes in.
+
+        Yields:
+            int: the cell of every expanded node.
+
+        Returns:
+            list: the cells of the abstract path, empty if the end cell cannot be reached.
+        """
+        open_set = self.openListClass()
+        push, pop = open_set.push, open_set.pop
+        push(self.heuristic(start, end), start)
+        g_costs = {start: 0}
+        parents = {start: -1}
+        closed = set()
+        expanded = result.abstractExpanded
+        peak = 1
+
+        while open_set and not self.isStopped():
+            _, current = pop()
+            if current in closed:
+                continue
+            closed.add(current)
+            expanded.append(current)
+            yield current
+
+            if current == end:
+                path = []
+                while current != -1:
+                    path.append(current)
+                    current = parents[current]
+                path.reverse()
+                result.peakFrontier = peak
+                return path
+
+            if current == start:
+                # The start cell may itself be a node, with edges across a border
+                links = start_links + [(other, 1) for other in graph.inter.get(start, ())]
+            else:
+                links = graph.neighbors(current)
+            if current in end_links:
+                links = links + [(end, end_links[current])]
+            for neighbor, cost in links:
+                tentative_g_cost = g_costs[current] + cost
+                if tentative_g_cost < g_costs.get(neighbor, tentative_g_cost + 1):
+                    g_costs[neighbor] = tentative_g_cost
+                    parents[neighbor] = current
+                    if push(tentative_g_cost + self.heuristic(neighbor, end), neighbor):
+                        result.heapPushes += 1
+                    else:
+                        result.decreaseKeys += 1
+            if len(open_set) > peak:
+                peak = len(open_set)
+
+        result.peakFrontier = peak
+        return []
+
+    def refine(self, graph: ClusterGraph, abstract: list, result) -> Iterator[int]:
+        """
+        Turn an abstract path into a path of adjacent cells.
+
+        Args:
+            graph (ClusterGraph): The abstract graph.
+            abstract (list): The cells of the abstract path.
+            result (SearchResult): The result to store the path in.
+
+        Yields:
+            int: the cell ending every refined intra-cluster edge.
+        """
+        path = [abstract[0]]
+        for a, b in zip(abstract, abstract[1:]):
+            cluster = graph.clusterOf(a)
+            if cluster != graph.clusterOf(b):
+                # Inter-cluster edges join two adjacent cells
+                path.append(b)
+                continue
+            _, parents = graph.searchCluster(a, cluster, b, result.expanded)
+            segment = []
+            current = b
+            while current != a:
+                segment.append(current)
+                current = parents[current]
+            path.extend(reversed(segment))
+            if self.isStopped():
+                return
+            yield b
+        result.path = path
+        result.cost = self.grid.pathCost(path)
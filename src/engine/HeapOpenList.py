@@ -0,0 +1,45 @@
+"""
+This module contains the HeapOpenList class, a binary heap priority queue for arbitrary priorities.
+"""
+
+import heapq
+
+class HeapOpenList:
+    """
+    Binary heap priority queue, based on heapq.
+
+    Unlike IndexedHeap, pushing an item which is already queued adds a second
+    entry, and the engines skip the stale ones when they are popped. The heap may
+    therefore grow beyond the number of open nodes. Push and pop are O(log n).
+
+    Attributes:
+        heap (list): The (priority, item) pairs, ordered as a binary heap.
+    """
+    def __init__(self) -> None:
+        self.heap = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, priority, item) -> bool:
+        """
+        Push an item onto the queue.
+
+        Args:
+            priority: The priority of the item.
+            item: The item to push.
+
+        Returns:
+            bool: Always True, since a new entry is added.
+        """
+        heapq.heappush(self.heap, (priority, item))
+        return True
+
+    def pop(self) -> tuple:
+        """
+        Pop an item with the lowest priority from the queue.
+
+        Returns:
+            tuple: the priority and the item.
+        """
+        return heapq.heappop(self.heap)
@@ -0,0 +1,122 @@
+"""
+This module contains the headless implementation of the IDA* (Iterative Deepening A*) search algorithm.
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+
+class IDAStarEngine(BaseEngine):
+    """
+    IDA* (Iterative Deepening A*) search engine.
+
+    IDA* runs a series of depth-first searches from the start cell, each of
+    which only follows the cells whose f_cost (g_cost plus heuristic) does not
+    exceed a threshold. The first threshold is the heuristic of the start cell,
+    and every next one is the lowest f_cost which exceeded the previous one, so
+    the first path found is the cheapest, as with A*. Instead of open and closed
+    lists covering the searched area, a search only keeps the cells of its
+    current path, and a transposition table of the lowest g_cost at which the
+    current iteration reached a cell, which prunes the many paths to the same
+    cell of a grid. The table holds at most maxNodes cells, and is emptied when
+    it is full, keeping the cells reached since, which are the ones the search
+    is the most likely to reach again; a table much smaller than the area
+    within the threshold lets the paths multiply again. Cells are expanded again
+    in every iteration, which makes IDA* much slower than A* on mazes, where
+    the threshold has to grow many times, but its memory does not depend on
+    the size of the grid.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    usesCosts = True
+
+    connectivities = (4, 8)
+
+    usesState = False
+
+    # Largest number of cells held by the transposition table
+    maxNodes = 1 << 14
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements the IDA* algorithm to find the shortest path from
+        the source node to the destination node.
+
+        Algorithm:
+            1. Set the threshold to the heuristic cost of the source node.
+            2. Until a path is found:
+                2.1. Start a depth-first search from the source node, with
+                an empty transposition table and no lowest exceeding f_cost.
+                2.2. Take the next neighbor of the node on top of the stack.
+                If the node has none left, pop it.
+                2.3. Skip the neighbor if it is on the current path, if its
+                f_cost exceeds the threshold, keeping the lowest such f_cost,
+                or if the table holds a g_cost no higher than its own.
+                2.4. Otherwise, record its g_cost in the table, emptying it
+                first if it is full, record the neighbor as expanded and push it onto the stack.
+                If the neighbor is the end node, the stack holds the path.
+                2.5. If no f_cost exceeded the threshold, there is no path;
+                otherwise the lowest one becomes the next threshold.
+        """
+        costs = self.costs
+        masks, moves = self.masks, self.moves
+        heuristic = self.heuristic
+        expanded = result.expanded
+        maxNodes = self.maxNodes
+        threshold = heuristic(start, end)
+        peak = 1
+
+        while not self.isStopped():
+            expanded.append(start)
+            yield start
+            if start == end:
+                result.path = [start]
+                result.cost = 0
+                break
+
+            # The stack holds (cell, g_cost, iterator over its moves) frames, the current path
+            stack = [(start, 0, iter(moves[masks[start]]))]
+            on_path = {start}
+            table = {start: 0}
+            next_threshold = float('inf')
+            while stack and not self.isStopped():
+                current, g_cost, current_moves = stack[-1]
+                for offset, length in current_moves:
+                    neighbor = current + offset
+                    if neighbor in on_path:
+                        continue
+                    tentative_g_cost = g_cost + (length if costs is None else length * costs[neighbor])
+                    f_cost = tentative_g_cost + heuristic(neighbor, end)
+                    if f_cost > threshold:
+                        if f_cost < next_threshold:
+                            next_threshold = f_cost
+                        continue
+                    known = table.get(neighbor)
+                    if known is not None and known <= tentative_g_cost:
+                        continue
+                    if known is None and len(table) >= maxNodes:
+                        table.clear()
+                    table[neighbor] = tentative_g_cost
+                    expanded.append(neighbor)
+                    yield neighbor
+                    stack.append((neighbor, tentative_g_cost, iter(moves[masks[neighbor]])))
+                    on_path.add(neighbor)
+                    break
+                else:
+                    stack.pop()
+                    on_path.discard(current)
+                    continue
+                if len(stack) > peak:
+                    peak = len(stack)
+                if stack[-1][0] == end:
+                    result.path = [frame[0] for frame in stack]
+                    result.cost = self.grid.pathCost(result.path)
+                    break
+
+            if result.path or next_threshold == float('inf'):
+                break
+            threshold = next_threshold
+
+        result.peakFrontier = peak
@@ -0,0 +1,142 @@
+"""
+This module contains the IndexedHeap class, a binary heap priority queue with decrease-key.
+"""
+
+class IndexedHeap:
+    """
+    Binary heap priority queue which holds every item at most once.
+
+    The heap keeps the position of every queued item, so that pushing an item
+    which is already queued lowers its priority in place (decrease-key) instead
+    of adding a second entry. The size of the heap is therefore bounded by the
+    number of open nodes, and no stale entries have to be skipped when popping.
+    Push, pop, remove and decrease-key are O(log n), and priorities can be any
+    comparable values, e.g. float costs or the (k1, k2) keys of D* Lite.
+
+    Attributes:
+        priorities (list): The priorities of the entries, ordered as a binary heap.
+        items (list): The items of the entries, in the same order as priorities.
+        positions (dict): A dictionary mapping each queued item to its position in the heap.
+    """
+    def __init__(self) -> None:
+        self.priorities = []
+        self.items = []
+        self.positions = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item) -> bool:
+        return item in self.positions
+
+    def push(self, priority, item) -> bool:
+        """
+        Push an item onto the queue, or lower its priority if it is already queued.
+
+        Args:
+            priority: The priority of the item.
+            item: The item to push.
+
+        Returns:
+            bool: True if the item was added, False if it was already queued.
+        """
+        position = self.positions.get(item)
+        if position is not None:
+            self.decreaseKey(item, priority)
+            return False
+        self.priorities.append(priority)
+        self.items.append(item)
+        self._siftUp(len(self.items) - 1, priority, item)
+        return True
+
+    def decreaseKey(self, item, priority) -> None:
+        """
+        Lower the priority of a queued item. Higher priorities are ignored.
+
+        Args:
+            item: The queued item.
+            priority: The new priority of the item.
+        """
+        position = self.positions[item]
+        if priority < self.priorities[position]:
+            self._siftUp(position, priority, item)
+
+    def peek(self) -> tuple:
+        """
+        Returns an item with the lowest priority without removing it.
+
+        Returns:
+            tuple: the priority and the item.
+        """
+        return self.priorities[0], self.items[0]
+
+    def remove(self, item) -> None:
+        """
+        Remove a queued item from the queue.
+
+        Args:
+            item: The queued item.
+        """
+        position = self.positions.pop(item)
+        priorities, items = self.priorities, self.items
+        last_priority, last_item = priorities.pop(), items.pop()
+        if position == len(items):
+            return
+        # Put the last entry in the hole, and move it up or down to its place
+        if position > 0 and last_priority < priorities[(position - 1) >> 1]:
+            self._siftUp(position, last_priority, last_item)
+        else:
+            self._siftDown(position, last_priority, last_item)
+
+    def pop(self) -> tuple:
+        """
+        Pop an item with the lowest priority from the queue.
+
+        Returns:
+            tuple: the priority and the item.
+        """
+        priorities, items = self.priorities, self.items
+        priority, item = priorities[0], items[0]
+        del self.positions[item]
+        last_priority, last_item = priorities.pop(), items.pop()
+        if items:
+            self._siftDown(0, last_priority, last_item)
+        return priority, item
+
+    def _siftUp(self, position: int, priority, item) -> None:
+        """
+        Move an entry up from a position until its parent has a lower or equal priority.
+        """
+        priorities, items, positions = self.priorities, self.items, self.positions
+        while position > 0:
+            parent = (position - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+            priorities[position] = priorities[parent]
+            items[position] = items[parent]
+            positions[items[position]] = position
+            position = parent
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+    def _siftDown(self, position: int, priority, item) -> None:
+        """
+        Move an entry down from a position until its children have higher or equal priorities.
+        """
+        priorities, items, positions = self.priorities, self.items, self.positions
+        size = len(items)
+        child = 2 * position + 1
+        while child < size:
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priority <= priorities[child]:
+                break
+            priorities[position] = priorities[child]
+            items[position] = items[child]
+            positions[items[position]] = position
+            position = child
+            child = 2 * position + 1
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
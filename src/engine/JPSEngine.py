@@ -0,0 +1,390 @@
+"""
+This module contains the headless implementation of the Jump Point Search algorithm.
+"""
+
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.BucketOpenList import BucketOpenList
+from src.engine.JumpTable import JumpTable
+
+class JPSEngine(BaseEngine):
+    """
+    Jump Point Search engine.
+
+    This class implements the Jump Point Search algorithm for solving the
+    pathfinding problem on a uniform-cost, 4-connected grid. A jump moves in
+    a straight line until it reaches the goal, a wall, or a jump point: a cell
+    with a forced neighbor or, when moving vertically, a cell from which a
+    horizontal jump reaches a jump point. Jumps are loops instead of recursion,
+    and a vertical jump only nests the horizontal ones, so long corridors cost
+    no stack depth.
+
+    On 8-connected grids, the engine runs the original, diagonal Jump Point
+    Search instead (see jumpOctile): straight jumps stop at forced neighbors,
+    and a diagonal jump stops at a cell from which one of the two straight jumps
+    along its components reaches a jump point. The pruning and forced neighbor
+    rules depend on the corner-cutting policy of the grid. The cost between two
+    jump points is their octile distance.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    # f_costs are small integers, so a bucket queue is used by default
+    openListClass = BucketOpenList
+
+    # Whether jumps are looked up in a precomputed JumpTable (JPS+) instead of scanned
+    useJumpTable = False
+
+    # The jump table of the grid, looked up or built by prepare
+    jumpTable = None
+
+    connectivities = (4, 8)
+
+    def isOpen(self, row: int, col: int) -> bool:
+        """
+        Check whether a cell is inside the grid and is not an obstacle.
+
+        The cell is looked up in the padded passability array of the grid, so
+        the cells just outside the grid, which jumps look at, need no bounds checks.
+
+        Args:
+            row (int): row of cell, from -1 to rows.
+            col (int): col of cell, from -1 to cols.
+
+        Returns:
+            bool: True if the cell can be traversed.
+        """
+        return self.padded[(row + 1) * self.width + col + 1]
+
+    def jump(self, row: int, col: int, direction: tuple, end: tuple) -> int:
+        """
+        Jump from a cell in a given direction.
+
+        Args:
+            row (int): row of the first cell of the jump.
+            col (int): col of the first cell of the jump.
+            direction (tuple): The direction to jump in, as a (row, col) offset.
+            end (tuple): The end cell coordinates.
+
+        Returns:
+            int or None: The index of the jump point if the jump is valid, None otherwise.
+        """
+        isOpen = self.isOpen
+        dr, dc = direction
+        while isOpen(row, col):
+            if (row, col) == end:
+                return self.grid.index(row, col)
+            if dc != 0:
+                if ((isOpen(row - 1, col) and not isOpen(row - 1, col - dc))
+                        or (isOpen(row + 1, col) and not isOpen(row + 1, col - dc))):
+                    return self.grid.index(row, col)
+            else:
+                if ((isOpen(row, col - 1) and not isOpen(row - dr, col - 1))
+                        or (isOpen(row, col + 1) and not isOpen(row - dr, col + 1))):
+                    return self.grid.index(row, col)
+                # When moving vertically, look for horizontal jump points
+                if (self.jump(row, col + 1, (0, 1), end) is not None
+                        or self.jump(row, col - 1, (0, -1), end) is not None):
+                    return self.grid.index(row, col)
+            row += dr
+            col += dc
+        return None
+
+    def jumpOctile(self, row: int, col: int, direction: tuple, end: tuple) -> int:
+        """
+        Jump from a cell in a given direction on an 8-connected grid.
+
+        Every step first checks that the move is allowed, which for diagonal moves
+        depends on the cells beside them, so a jump can start from any cell.
+
+        Args:
+            row (int): row of the cell to jump from.
+            col (int): col of the cell to jump from.
+            direction (tuple): The direction to jump in, as a (row, col) offset.
+            end (tuple): The end cell coordinates.
+
+        Returns:
+            int or None: The index of the jump point if the jump is valid, None otherwise.
+        """
+        isOpen = self.isOpen
+        never = self.grid.cornerCutting == 'never'
+        dr, dc = direction
+        while True:
+            if dr and dc:
+                vertical, horizontal = isOpen(row + dr, col), isOpen(row, col + dc)
+                if not ((vertical and horizontal) if never else (vertical or horizontal)):
+                    return None
+            row += dr
+            col += dc
+            if not isOpen(row, col):
+                return None
+            if (row, col) == end:
+                return self.grid.index(row, col)
+            if dr and dc:
+                if not never and ((isOpen(row + dr, col - dc) and not isOpen(row, col - dc))
+                                  or (isOpen(row - dr, col + dc) and not isOpen(row - dr, col))):
+                    return self.grid.index(row, col)
+                # When moving diagonally, look for straight jump points
+                if (self.jumpOctile(row, col, (0, dc), end) is not None
+                        or self.jumpOctile(row, col, (dr, 0), end) is not None):
+                    return self.grid.index(row, col)
+            elif dc:
+                if never:
+                    forced = ((isOpen(row - 1, col) and not isOpen(row - 1, col - dc))
+                              or (isOpen(row + 1, col) and not isOpen(row + 1, col - dc)))
+                else:
+                    forced = ((isOpen(row + 1, col + dc) and not isOpen(row + 1, col))
+                              or (isOpen(row - 1, col + dc) and not isOpen(row - 1, col)))
+                if forced:
+                    return self.grid.index(row, col)
+            else:
+                if never:
+                    forced = ((isOpen(row, col - 1) and not isOpen(row - dr, col - 1))
+                              or (isOpen(row, col + 1) and not isOpen(row - dr, col + 1)))
+                else:
+                    forced = ((isOpen(row + dr, col + 1) and not isOpen(row, col + 1))
+                              or (isOpen(row + dr, col - 1) and not isOpen(row, col - 1)))
+                if forced:
+                    return self.grid.index(row, col)
+
+    def lookupJump(self, current: int, direction: tuple, end: int):
+        """
+        Jump from a cell in a given direction, using the jump table.
+
+        The table gives the jump point or wall in the direction, and the goal
+        is checked separately: a jump stops at the goal if it lies ahead in the
+        same line, and a vertical jump stops in the row of the goal if the goal
+        can be reached horizontally from there.
+
+        Args:
+            current (int): The index of the cell to jump from.
+            direction (tuple): The direction to jump in, as a (row, col) offset.
+            end (int): The index of the end cell.
+
+        Returns:
+            int or None: The index of the jump point if the jump is valid, None otherwise.
+        """
+        cols = self.cols
+        distances = self.jumpTable.distances
+        dr, dc = direction
+        row, col = divmod(current, cols)
+        end_row, end_col = divmod(end, cols)
+        distance = distances[JumpTable.directions.index(direction)][current]
+        reach = abs(distance)
+
+        if dr == 0:
+            if end_row == row and 0 < (end_col - col) * dc <= reach:
+                return end
+            return current + distance * dc if distance > 0 else None
+
+        steps = (end_row - row) * dr
+        if 0 < steps <= reach:
+            goal_row = current + steps * dr * cols
+            if end_col == col:
+                return end
+            side = (0, 1) if end_col > col else (0, -1)
+            if abs(end_col - col) <= abs(distances[JumpTable.directions.index(side)][goal_row]):
+                return goal_row
+        return current + distance * dr * cols if distance > 0 else None
+
+    def pruneDirections(self, current: int, previous) -> list:
+        """
+        Get the directions worth jumping in from a cell.
+
+        When the cell was reached moving horizontally, the search only continues
+        forward, up and down; when it was reached moving vertically, forward,
+        left and right. The start cell is expanded in all four directions.
+
+        Args:
+            current (int): The index of the current cell.
+            previous (int): The index of the jump point the cell was reached from, None for the start.
+
+        Returns:
+            list: the directions, as (row, col) offsets.
+        """
+        if previous is None:
+            return [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        row, col = divmod(current, self.cols)
+        prev_row, prev_col = divmod(previous, self.cols)
+        dr = (row > prev_row) - (row < prev_row)
+        dc = (col > prev_col) - (col < prev_col)
+        if dc != 0:
+            return [(-1, 0), (1, 0), (0, dc)]
+        return [(0, -1), (0, 1), (dr, 0)]
+
+    def pruneOctileDirections(self, current: int, previous) -> list:
+        """
+        Get the directions worth jumping in from a cell on an 8-connected grid.
+
+        The search continues in the direction the cell was reached in, and in
+        its straight components when it was reached diagonally, plus the
+        directions of the forced neighbors of the cell. Without corner cutting,
+        the cells beside a straight move are forced neighbors as soon as they
+        are free; with it, the diagonal cells past an obstacle beside the move
+        are. The start cell is expanded in all eight directions.
+
+        Args:
+            current (int): The index of the current cell.
+            previous (int): The index of the jump point the cell was reached from, None for the start.
+
+        Returns:
+            list: the directions, as (row, col) offsets.
+        """
+        if previous is None:
+            return list(self.grid.moveOffsets[8])
+        isOpen = self.isOpen
+        row, col = divmod(current, self.cols)
+        prev_row, prev_col = divmod(previous, self.cols)
+        dr = (row > prev_row) - (row < prev_row)
+        dc = (col > prev_col) - (col < prev_col)
+        never = self.grid.cornerCutting == 'never'
+        if dr and dc:
+            directions = [(dr, 0), (0, dc), (dr, dc)]
+            if not never:
+                if not isOpen(row, col - dc):
+                    directions.append((dr, -dc))
+                if not isOpen(row - dr, col):
+                    directions.append((-dr, dc))
+            return directions
+        if never:
+            if dc:
+                return [(0, dc), (1, dc), (-1, dc), (1, 0), (-1, 0)]
+            return [(dr, 0), (dr, 1), (dr, -1), (0, 1), (0, -1)]
+        if dc:
+            directions = [(0, dc)]
+            directions.extend((side, dc) for side in (1, -1) if not isOpen(row + side, col))
+        else:
+            directions = [(dr, 0)]
+            directions.extend((dr, side) for side in (1, -1) if not isOpen(row, col + side))
+        return directions
+
+    def identifySuccessors(self, current: int, previous, end: int) -> list:
+        """
+        Identify the successors of a given cell.
+
+        Args:
+            current (int): The index of the current cell.
+            previous (int): The index of the jump point the cell was reached from, None for the start.
+            end (int): The index of the end cell.
+
+        Returns:
+            list: The indices of the successors.
+        """
+        successors = []
+        if self.useJumpTable:
+            for direction in self.pruneDirections(current, previous):
+                jump_point = self.lookupJump(current, direction, end)
+                if jump_point is not None:
+                    successors.append(jump_point)
+            return successors
+
+        row, col = self.grid.cell(current)
+        end_cell = self.grid.cell(end)
+        if self.connectivity == 8:
+            for direction in self.pruneOctileDirections(current, previous):
+                jump_point = self.jumpOctile(row, col, direction, end_cell)
+                if jump_point is not None:
+                    successors.append(jump_point)
+            return successors
+        for dr, dc in self.pruneDirections(current, previous):
+            jump_point = self.jump(row + dr, col + dc, (dr, dc), end_cell)
+            if jump_point is not None:
+                successors.append(jump_point)
+        return successors
+
+    def prepare(self) -> Iterator[int]:
+        """
+        Build the jump table of the grid one row or column per step, when jumps
+        are looked up in it (see JumpTable.steps).
+        """
+        if self.useJumpTable and self.connectivity == 4:
+            self.jumpTable = yield from JumpTable.stepsForGrid(self.grid)
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Perform the Jump Point Search algorithm.
+
+        This method implements the Jump Point Search algorithm for solving
+        the pathfinding problem on a uniform-cost grid. It is A* over jump
+        points, where the cost between two jump points is their distance.
+        """
+        # Jump tables only hold the straight jumps of 4-connected grids
+        if self.connectivity == 8:
+            self.useJumpTable = False
+        self.padded = self.grid.paddedPassability()
+        self.width = self.cols + 2
+        if self.useJumpTable and self.jumpTable is None:
+            self.jumpTable = JumpTable.forGrid(self.grid)
+        open_set = self.openListClass()
+        push, pop = open_set.push, open_set.pop
+        push(0, start)
+        state = self.state
+        parents = state.parents
+        g_costs = state.useWeightedCosts() if self.fractionalCosts else state.costs
+        distance = self.octile if self.connectivity == 8 else self.manhattan
+        reached, closed, generation = state.reached, state.closed, state.generation
+        parents[start] = -1
+        g_costs[start] = 0
+        reached[start] = generation
+        expanded = result.expanded
+        peak = 1
+
+        while open_set and not self.isStopped():
+            _, current = pop()
+
+            if closed[current] == generation:
+                continue
+
+            closed[current] = generation
+            expanded.append(current)
+            yield current
+
+            if current == end:
+                self.finish(result, parents, end)
+                break
+
+            previous = parents[current]
+            for neighbor in self.identifySuccessors(current, previous if previous != -1 else None, end):
+                if closed[neighbor] != generation:
+                    tentative_g_cost = g_costs[current] + distance(current, neighbor)
+                    if reached[neighbor] != generation or tentative_g_cost < g_costs[neighbor]:
+                        reached[neighbor] = generation
+                        g_costs[neighbor] = tentative_g_cost
+                        f_cost = tentative_g_cost + self.heuristic(neighbor, end)
+                        parents[neighbor] = current
+                        if push(f_cost, neighbor):
+                            result.heapPushes += 1
+                        else:
+                            result.decreaseKeys += 1
+            if len(open_set) > peak:
+                peak = len(open_set)
+
+        result.peakFrontier = peak
+
+    def buildPath(self, parents, end: int) -> list:
+        """
+        Reconstruct the path from the start cell to the end cell, filling in
+        the cells which lie between two consecutive jump points.
+
+        Args:
+            parents (array): The index of the predecessor of every jump point.
+            end (int): Index of the end cell.
+
+        Returns:
+            list: the cells of the path, from the start cell to the end cell.
+        """
+        jump_points = super().buildPath(parents, end)
+        path = jump_points[:1]
+        for jump_point in jump_points[1:]:
+            row, col = self.grid.cell(jump_point)
+            prev_row, prev_col = self.grid.cell(path[-1])
+            dr = (row > prev_row) - (row < prev_row)
+            dc = (col > prev_col) - (col < prev_col)
+            while (prev_row, prev_col) != (row, col):
+                prev_row += dr
+                prev_col += dc
+                path.append(self.grid.index(prev_row, prev_col))
+        return path
+
@@ -0,0 +1,19 @@
+"""
+This module contains the headless implementation of Jump Point Search with precomputed jump distances.
+"""
+
+from src.engine.JPSEngine import JPSEngine
+
+class JPSPlusEngine(JPSEngine):
+    """
+    Jump Point Search engine with precomputed jump distances (JPS+).
+
+    The jump distances of the grid are computed once per version of its
+    obstacles and cached in a JumpTable, so searches on a static grid only
+    do table lookups instead of scanning the grid. The table only holds straight
+    jumps, so on 8-connected grids the engine scans like JPSEngine.
+
+    Args:
+        JPSEngine: The Jump Point Search engine.
+    """
+    useJumpTable = True
@@ -0,0 +1,186 @@
+"""
+This module contains the JumpTable class, which holds the precomputed jump distances of JPS+.
+"""
+
+from array import array
+from typing import Generator, Iterator
+
+from src.grid.GridModel import GridModel, OBSTACLE
+
+class JumpTable:
+    """
+    Precomputed jump distances for Jump Point Search (JPS+).
+
+    For every cell and each of the four directions, the table stores where a jump
+    started from that cell ends, without looking at the goal:
+        - a positive distance n means that the jump reaches a jump point after n steps.
+        - zero or a negative distance -n means that the jump runs into a wall or the
+        border of the grid after n free steps.
+
+    The distances are stored in one array('i') per direction, indexed by the flat
+    index of the cell, and are computed in a few linear sweeps over the grid, one
+    row or column per step (see steps). They only depend on the obstacles, so
+    tables are cached by the version of the grid and rebuilt once its obstacles
+    change.
+
+    Attributes:
+        rows (int): The number of rows in the grid.
+        cols (int): The number of columns in the grid.
+        version (int): The version of the grid the table was built for.
+        distances (list): The array of jump distances of every direction, in the
+            order of directions.
+        complete (bool): False until every sweep has been run.
+    """
+
+    # Directions of the tables, as (row, col) offsets: up, down, left, right
+    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+    # Dictionary mapping grid version to its table, holding at most maxCached tables
+    cache = {}
+    maxCached = 4
+
+    def __init__(self, grid: GridModel, build: bool = True) -> None:
+        self.rows = grid.rows
+        self.cols = grid.cols
+        self.version = grid.version
+        size = self.rows * self.cols
+        self.distances = [array('i', bytes(4 * size)) for _ in self.directions]
+        self.complete = False
+        if build:
+            self.build(grid)
+
+    @classmethod
+    def forGrid(cls, grid: GridModel) -> 'JumpTable':
+        """
+        Returns the jump table of a grid, building it if it is not cached.
+
+        Args:
+            grid (GridModel): The grid to get the table for.
+
+        Returns:
+            JumpTable: the jump table matching the obstacles of the grid.
+        """
+        steps = cls.stepsForGrid(grid)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    @classmethod
+    def stepsForGrid(cls, grid: GridModel) -> Generator:
+        """
+        Get the jump table of a grid, building it one step at a time if it is
+        not cached. The table is only cached once it is complete.
+
+        Args:
+            grid (GridModel): The grid to get the table for.
+
+        Yields:
+            int: the index of the first cell of the row or column swept by every
+                step of the build, nothing if the table was found in the cache.
+
+        Returns:
+            JumpTable: the jump table matching the obstacles of the grid.
+        """
+        table = cls.cache.get(grid.version)
+        if table is not None and table.rows == grid.rows and table.cols == grid.cols:
+            return table
+        table = cls(grid, build=False)
+        yield from table.steps(grid)
+        if len(cls.cache) >= cls.maxCached:
+            del cls.cache[next(iter(cls.cache))]
+        cls.cache[grid.version] = table
+        return table
+
+    def build(self, grid: GridModel) -> None:
+        """
+        Compute the jump distances of every cell, all at once.
+
+        Args:
+            grid (GridModel): The grid to build the table for.
+        """
+        for _ in self.steps(grid):
+            pass
+
+    def steps(self, grid: GridModel) -> Iterator[int]:
+        """
+        Compute the jump distances of every cell, one row or column per step.
+
+        A cell q reached when moving horizontally is a jump point if a cell above
+        or below it is open while the one behind it is blocked (a forced neighbor).
+        When moving vertically, q is a jump point if it has a forced neighbor to
+        its left or right, or if a horizontal jump from q reaches a jump point.
+        The horizontal tables are therefore computed first.
+
+        Args:
+            grid (GridModel): The grid to build the table for.
+
+        Yields:
+            int: the index of the first cell of the row or column swept by the step.
+        """
+        rows, cols = self.rows, self.cols
+        # 1 for every open cell, 0 for every obstacle
+        passable = bytes(grid.states).translate(bytes(0 if code == OBSTACLE else 1 for code in range(256)))
+        empty_row = bytes(cols)
+        up, down, left, right = self.distances
+
+        for row in range(rows):
+            start = row * cols
+            above = passable[start - cols:start] if row > 0 else empty_row
+            below = passable[start + cols:start + 2 * cols] if row < rows - 1 else empty_row
+            current = passable[start:start + cols]
+
+            # Moving right, from right to left
+            distance = 0
+            for col in range(cols - 1, -1, -1):
+                right[start + col] = distance
+                if not current[col]:
+                    distance = 0
+                elif (above[col] and col > 0 and not above[col - 1]) or (below[col] and col > 0 and not below[col - 1]):
+                    distance = 1
+                else:
+                    distance = distance + 1 if distance > 0 else distance - 1
+            # Moving left, from left to right
+            distance = 0
+            for col in range(cols):
+                left[start + col] = distance
+                if not current[col]:
+                    distance = 0
+                elif (above[col] and col < cols - 1 and not above[col + 1]) or (below[col] and col < cols - 1 and not below[col + 1]):
+                    distance = 1
+                else:
+                    distance = distance + 1 if distance > 0 else distance - 1
+            yield start
+
+        for col in range(cols):
+            # Moving down, from bottom to top, then moving up, from top to bottom
+            for table, sweep, step in ((down, range(rows - 1, -1, -1), -1), (up, range(rows), 1)):
+                distance = 0
+                for row in sweep:
+                    index = row * cols + col
+                    table[index] = distance
+                    if not passable[index]:
+                        distance = 0
+                    elif ((col > 0 and passable[index - 1] and not self.isOpen(passable, row + step, col - 1))
+                          or (col < cols - 1 and passable[index + 1] and not self.isOpen(passable, row + step, col + 1))
+                          or left[index] > 0 or right[index] > 0):
+                        distance = 1
+                    else:
+                        distance = distance + 1 if distance > 0 else distance - 1
+            yield col
+        self.complete = True
+
+    def isOpen(self, passable: bytes, row: int, col: int) -> bool:
+        """
+        Check whether a cell is inside the grid and is not an obstacle.
+
+        Args:
+            passable (bytes): 1 for every open cell, 0 for every obstacle.
+            row (int): row of cell.
+            col (int): col of cell.
+
+        Returns:
+            bool: True if the cell can be traversed.
+        """
+        return 0 <= row < self.rows and 0 <= col < self.cols and bool(passable[row * self.cols + col])
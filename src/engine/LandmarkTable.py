@@ -0,0 +1,243 @@
+"""
+This module contains the LandmarkTable class, which provides the landmark (ALT) heuristic.
+"""
+
+from array import array
+from collections import Counter
+from typing import Generator, Iterator
+
+from src.engine.ComponentIndex import ComponentIndex
+from src.engine.DistanceField import DistanceField
+from src.grid.GridModel import GridModel
+
+class LandmarkTable:
+    """
+    Distances from a few landmark cells to every cell, for the ALT heuristic.
+
+    By the triangle inequality, the distance between two cells a and b is at
+    least |d(L, a) - d(L, b)| for any landmark L. The heuristic is the largest
+    of these bounds over all landmarks and the Manhattan distance (the octile
+    distance on 8-connected grids, whose landmark distances count diagonal
+    moves as 1, which no move costs less than), so it never
+    overestimates and stays consistent, while being much better informed than
+    the Manhattan distance alone on mazes and maps with long walls, where the
+    shortest paths have to go around obstacles.
+
+    Landmarks are selected by farthest-point sampling in the largest component
+    of the grid: the first one is the cell farthest from an arbitrary cell of the
+    component, and every next one is the cell farthest from the landmarks already
+    selected. The distance field of every landmark is computed with a BFS and
+    stored as an array('H') when the distances fit in 16 bits, or an array('i')
+    otherwise. Cells which cannot reach the landmarks fall back to the Manhattan
+    or octile distance.
+
+    Tables only depend on the obstacles and the moves allowed on the grid, so
+    they are cached by the version of the grid and the number of landmarks. They
+    can be built over many steps (see steps), e.g. from the GUI thread.
+
+    Attributes:
+        rows (int): The number of rows in the grid.
+        cols (int): The number of columns in the grid.
+        version (int): The version of the grid the table was built for.
+        connectivity (int): The connectivity of the grid the table was built for.
+        diagonalCost (float): The cost of a diagonal move on the grid.
+        landmarks (list): The indices of the landmark cells.
+        distances (list): The array of distances of every cell from each landmark.
+        unreachable (int): The distance stored for the cells which cannot reach the landmarks.
+        complete (bool): False until every landmark has been selected and its field stored.
+    """
+
+    # Default number of landmarks
+    defaultCount = 8
+
+    # Number of cells compared or converted by every step of the build, see steps
+    cellsPerStep = 1 << 16
+
+    # Dictionary mapping (grid version, number of landmarks) to its table, holding at most maxCached tables
+    cache = {}
+    maxCached = 4
+
+    def __init__(self, grid: GridModel, count: int = None, build: bool = True) -> None:
+        self.rows = grid.rows
+        self.cols = grid.cols
+        self.version = grid.version
+        self.connectivity = grid.connectivity
+        self.diagonalCost = grid.diagonalCost
+        self.landmarks = []
+        self.distances = []
+        self.unreachable = -1
+        self.complete = False
+        if build:
+            self.build(grid, count or self.defaultCount)
+
+    @classmethod
+    def forGrid(cls, grid: GridModel, count: int = None) -> 'LandmarkTable':
+        """
+        Returns the landmark table of a grid, building it if it is not cached.
+
+        Args:
+            grid (GridModel): The grid to get the table for.
+            count (int): The number of landmarks.
+
+        Returns:
+            LandmarkTable: the landmark table matching the obstacles of the grid.
+        """
+        steps = cls.stepsForGrid(grid, count)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    @classmethod
+    def stepsForGrid(cls, grid: GridModel, count: int = None) -> Generator:
+        """
+        Get the landmark table of a grid, building it one step at a time if it
+        is not cached. The table is only cached once it is complete.
+
+        Args:
+            grid (GridModel): The grid to get the table for.
+            count (int): The number of landmarks.
+
+        Yields:
+            int: the index of a cell handled by every step of the build, nothing
+                if the table was found in the cache.
+
+        Returns:
+            LandmarkTable: the landmark table matching the obstacles of the grid.
+        """
+        key = (grid.version, count or cls.defaultCount)
+        table = cls.cache.get(key)
+        if table is None or table.rows != grid.rows or table.cols != grid.cols:
+            table = cls(grid, count, build=False)
+            yield from table.steps(grid, count or cls.defaultCount)
+            if len(cls.cache) >= cls.maxCached:
+                del cls.cache[next(iter(cls.cache))]
+            cls.cache[key] = table
+        return table
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the memory used by the distance arrays, in bytes.
+        """
+        return sum(len(distances) * distances.itemsize for distances in self.distances)
+
+    def build(self, grid: GridModel, count: int) -> None:
+        """
+        Select the landmarks and compute their distance fields, all at once.
+
+        Args:
+            grid (GridModel): The grid to build the table for.
+            count (int): The number of landmarks.
+        """
+        for _ in self.steps(grid, count):
+            pass
+
+    def steps(self, grid: GridModel, count: int) -> Iterator[int]:
+        """
+        Select the landmarks and compute their distance fields, one step at a time.
+
+        The components and the distance fields are computed with their own steps
+        (see ComponentIndex.steps and DistanceField.steps), and the passes over
+        every cell handle cellsPerStep cells per step, so that no step takes long
+        on large grids.
+
+        Algorithm:
+            1. Run a BFS from a cell of the largest component, and take the last
+            cell it reaches, i.e. the farthest one, as the first landmark.
+            2. Until count landmarks are selected:
+                2.1. Compute the distance field of the last landmark, and lower
+                the distance of every cell to its closest landmark.
+                2.2. Select the cell farthest from its closest landmark as the
+                next landmark, unless every cell already is a landmark.
+            3. Store the fields in 16-bit arrays if the distances fit.
+
+        Args:
+            grid (GridModel): The grid to build the table for.
+            count (int): The number of landmarks.
+
+        Yields:
+            int: the index of the last cell handled by the step.
+        """
+        size = self.rows * self.cols
+        chunk = self.cellsPerStep
+        labels = (yield from ComponentIndex.stepsForGrid(grid)).labels
+        sizes = Counter()
+        for first in range(0, size, chunk):
+            sizes.update(labels[first:first + chunk])
+            yield first
+        sizes.pop(-1, None)
+        if not sizes:
+            self.complete = True
+            return
+        seed = labels.index(max(sizes, key=sizes.get))
+        field = DistanceField(grid, seed, connectivity=self.connectivity, build=False)
+        yield from field.steps(grid)
+        landmark = field.order[-1]
+        fields = []
+        closest = None
+        while len(fields) < count:
+            field = DistanceField(grid, landmark, connectivity=self.connectivity, build=False)
+            yield from field.steps(grid)
+            self.landmarks.append(landmark)
+            fields.append(field)
+            if closest is None:
+                closest = array('i', field.distances)
+            farthest, largest = landmark, 0
+            for first in range(0, size, chunk):
+                lowered = array('i', map(min, closest[first:first + chunk], field.distances[first:first + chunk]))
+                closest[first:first + chunk] = lowered
+                distance = max(lowered)
+                if distance > largest:
+                    farthest, largest = first + lowered.index(distance), distance
+                yield first
+            if largest <= 0:
+                break
+            landmark = farthest
+
+        # The last cell reached by the BFS of a landmark is the farthest from it
+        if max(field.distances[field.order[-1]] for field in fields) < 0xFFFF:
+            # -1 wraps around to 0xFFFF in 16 bits
+            distances = []
+            for field in fields:
+                distances.append(array('H'))
+                for first in range(0, size, chunk):
+                    distances[-1].extend([distance & 0xFFFF for distance in field.distances[first:first + chunk]])
+                    yield first
+            self.unreachable = 0xFFFF
+            self.distances = distances
+        else:
+            self.distances = [field.distances for field in fields]
+        self.complete = True
+
+    def heuristic(self, a: int, b: int) -> float:
+        """
+        Calculate the ALT heuristic distance between two cells.
+
+        Args:
+            a (int): The index of the first point.
+            b (int): The index of the second point.
+
+        Returns:
+            float: The largest lower bound on the distance between the two points,
+                among the landmarks and the Manhattan or octile distance.
+        """
+        a_row, a_col = divmod(a, self.cols)
+        b_row, b_col = divmod(b, self.cols)
+        if self.connectivity == 8:
+            d_row, d_col = abs(a_row - b_row), abs(a_col - b_col)
+            best = max(d_row, d_col) + (self.diagonalCost - 1) * min(d_row, d_col)
+        else:
+            best = abs(a_row - b_row) + abs(a_col - b_col)
+        distances = self.distances
+        # The landmarks share one component, so a cell reaches either all of them or none
+        if not distances or distances[0][a] == self.unreachable or distances[0][b] == self.unreachable:
+            return best
+        for landmark in distances:
+            difference = landmark[a] - landmark[b]
+            if difference > best:
+                best = difference
+            elif -difference > best:
+                best = -difference
+        return best
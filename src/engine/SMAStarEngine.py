@@ -0,0 +1,268 @@
+"""
+This module contains the headless implementation of the SMA* (Simplified Memory-bounded A*) search algorithm.
+"""
+
+import heapq
+from typing import Iterator
+
+from src.engine.BaseEngine import BaseEngine
+from src.engine.SearchNode import SearchNode
+
+class SMAStarEngine(BaseEngine):
+    """
+    SMA* (Simplified Memory-bounded A*) search engine.
+
+    SMA* expands nodes in the same order as A*, but holds at most maxNodes nodes
+    of its search tree in memory. When the budget is spent, it removes the leaf
+    with the highest f_cost, the shallowest one among equals, and remembers the
+    f_cost of the removed leaf in its parent, which is opened again with that
+    f_cost so that the forgotten branch is generated again once it is the most
+    promising one. A node whose children are all forgotten gets the lowest of
+    their f_costs, the best lower bound known on the paths through it, and a
+    child generated again starts from its remembered f_cost. A cell is held by at most
+    one node: a successor reaching a cell held at a lower or equal g_cost is
+    dropped, and one reaching it cheaper replaces the subtree of the other node.
+
+    SMA* finds the cheapest path whenever the budget can hold it, i.e. when it
+    has fewer than maxNodes cells; the smaller the budget, the more often the
+    same cells are generated again.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+
+    Attributes:
+        nodes (dict): The nodes held in memory, by cell.
+        openList (list): Heap of the nodes waiting to be expanded, by lowest key,
+            then deepest; entries whose node changed since are skipped.
+        leaves (list): Heap of the leaves of the tree, by highest f_cost, then
+            shallowest; entries whose node changed since are skipped.
+    """
+
+    usesCosts = True
+
+    connectivities = (4, 8)
+
+    usesState = False
+
+    # Largest number of nodes held in memory
+    maxNodes = 1 << 12
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Implements the SMA* algorithm to find the shortest path from
+        the source node to the destination node.
+
+        Algorithm:
+            1. Initialize the open list with the root node, holding the source node.
+            2. While the open list is not empty and its lowest key is finite:
+                2.1. Pop the deepest node with the lowest key, and record its
+                cell as expanded. If it is the end node, build the path and return.
+                2.2. For each successor of the node if it was never expanded,
+                or else for its forgotten child with the lowest f_cost, skip the
+                successor if its cell is held at a lower or equal g_cost, and
+                forget the subtree holding it otherwise.
+                2.3. Its f_cost is the highest of the f_cost of the node, its
+                remembered f_cost and its own g_cost plus heuristic, or infinite
+                if it is as deep as the budget allows without being the end node.
+                2.4. While the memory is full, remove the shallowest leaf with
+                the highest f_cost, other than the node, and open its parent
+                again with the f_cost of the removed leaf. A parent left without
+                children becomes a leaf with the lowest f_cost of its forgotten ones.
+                2.5. Add the successor to the children of the node and to the
+                open list.
+                2.6. If the node still has forgotten children which may lead
+                to a path, push it back onto the open list.
+        """
+        costs = self.costs
+        masks, moves = self.masks, self.moves
+        heuristic = self.heuristic
+        expanded = result.expanded
+        maxNodes = max(self.maxNodes, 2)
+        infinity = float('inf')
+        self.openList, self.leaves = [], []
+        root = SearchNode(start, 0, heuristic(start, end))
+        self.nodes = {start: root}
+        self.pushOpen(root)
+        self.pushLeaf(root)
+        peak = 1
+
+        while not self.isStopped():
+            node = self.popOpen()
+            if node is None or node.key() == infinity:
+                break
+            node.open = False
+            expanded.append(node.cell)
+            yield node.cell
+
+            if node.cell == end:
+                result.path = node.path()
+                result.cost = self.grid.pathCost(result.path)
+                break
+
+            if node.expanded:
+                # A node is expanded again to generate its most promising forgotten child
+                forgotten = node.forgotten
+                regenerated = min(forgotten, key=forgotten.get)
+                bound = forgotten.pop(regenerated)
+            else:
+                node.expanded = True
+                node.children = []
+                regenerated, bound = -1, 0
+            for offset, length in moves[masks[node.cell]]:
+                neighbor = node.cell + offset
+                if regenerated >= 0 and neighbor != regenerated:
+                    continue
+                g_cost = node.g + (length if costs is None else length * costs[neighbor])
+                other = self.nodes.get(neighbor)
+                if other is not None:
+                    if other.g <= g_cost:
+                        continue
+                    self.removeSubtree(other)
+                if node.depth + 2 >= maxNodes and neighbor != end:
+                    f_cost = infinity
+                else:
+                    f_cost = max(node.f, bound, g_cost + heuristic(neighbor, end))
+                while len(self.nodes) >= maxNodes and self.pruneLeaf(node):
+                    pass
+                if len(self.nodes) >= maxNodes:
+                    # No leaf can make room, the successor is generated again later
+                    self.forgetChild(node, neighbor, f_cost)
+                    continue
+                child = SearchNode(neighbor, g_cost, f_cost, node)
+                self.nodes[neighbor] = child
+                node.children.append(child)
+                self.pushOpen(child)
+                self.pushLeaf(child)
+                result.heapPushes += 1
+            self.backupLeaf(node)
+            if node.key() != infinity:
+                node.open = True
+                self.pushOpen(node)
+            if len(self.nodes) > peak:
+                peak = len(self.nodes)
+
+        result.peakFrontier = peak
+
+    def pushOpen(self, node: SearchNode) -> None:
+        """
+        Push a node onto the open list with its current key.
+        """
+        heapq.heappush(self.openList, (node.key(), -node.depth, node))
+        if len(self.openList) > 2 * self.maxNodes + 64:
+            self.openList = [entry for entry in self.openList if self.isOpenEntry(entry)]
+            heapq.heapify(self.openList)
+
+    def pushLeaf(self, node: SearchNode) -> None:
+        """
+        Push a leaf onto the heap of leaves with its current f_cost.
+        """
+        heapq.heappush(self.leaves, (-node.f, node.depth, node))
+        if len(self.leaves) > 2 * self.maxNodes + 64:
+            self.leaves = [entry for entry in self.leaves if self.isLeafEntry(entry)]
+            heapq.heapify(self.leaves)
+
+    @staticmethod
+    def isOpenEntry(entry: tuple) -> bool:
+        """
+        Check whether an entry of the open list still describes its node.
+        """
+        key, _, node = entry
+        return node.alive and node.open and node.key() == key
+
+    @staticmethod
+    def isLeafEntry(entry: tuple) -> bool:
+        """
+        Check whether an entry of the heap of leaves still describes its node,
+        which must not be the root.
+        """
+        negative_f, _, node = entry
+        return node.alive and not node.children and node.parent is not None and node.f == -negative_f
+
+    def popOpen(self) -> SearchNode:
+        """
+        Pop the deepest node with the lowest key from the open list.
+
+        Returns:
+            SearchNode: the node, or None if the open list is empty.
+        """
+        while self.openList:
+            entry = heapq.heappop(self.openList)
+            if self.isOpenEntry(entry):
+                return entry[2]
+        return None
+
+    def pruneLeaf(self, keep: SearchNode) -> bool:
+        """
+        Remove the shallowest leaf with the highest f_cost from memory, and open
+        its parent again with the f_cost of the leaf.
+
+        Args:
+            keep (SearchNode): The node being expanded, which is not removed.
+
+        Returns:
+            bool: whether a leaf was removed.
+        """
+        kept = []
+        removed = None
+        while self.leaves:
+            entry = heapq.heappop(self.leaves)
+            if not self.isLeafEntry(entry):
+                continue
+            if entry[2] is keep:
+                kept.append(entry)
+                continue
+            removed = entry[2]
+            break
+        for entry in kept:
+            heapq.heappush(self.leaves, entry)
+        if removed is None:
+            return False
+
+        removed.alive = False
+        del self.nodes[removed.cell]
+        parent = removed.parent
+        parent.children.remove(removed)
+        self.forgetChild(parent, removed.cell, removed.f)
+        # The f_cost of the node being expanded still bounds the successors it has left to generate
+        if parent is not keep:
+            self.backupLeaf(parent)
+        return True
+
+    def forgetChild(self, parent: SearchNode, cell: int, f_cost: float) -> None:
+        """
+        Remember the f_cost of a child which is not held in memory, and open its
+        parent again if the child may lead to a path.
+        """
+        if parent.forgotten is None:
+            parent.forgotten = {}
+        parent.forgotten[cell] = f_cost
+        if f_cost != float('inf'):
+            parent.open = True
+            self.pushOpen(parent)
+
+    def removeSubtree(self, node: SearchNode) -> None:
+        """
+        Remove a node and its descendants from memory, without remembering them,
+        since a cheaper path to the cell of the node was found.
+        """
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            current.alive = False
+            del self.nodes[current.cell]
+            if current.children:
+                stack.extend(current.children)
+        parent = node.parent
+        parent.children.remove(node)
+        self.backupLeaf(parent)
+
+    def backupLeaf(self, node: SearchNode) -> None:
+        """
+        Back the f_cost of an expanded node which holds no children any more up
+        from the f_costs of its forgotten children, and push it onto the heap of
+        leaves. Only the f_costs of leaves are compared, so those of the other
+        nodes are left as they are.
+        """
+        if not node.children:
+            node.f = min(node.forgotten.values()) if node.forgotten else float('inf')
+            self.pushLeaf(node)
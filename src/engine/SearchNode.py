@@ -0,0 +1,72 @@
+"""
+This module contains the SearchNode class, a node of the search tree kept in memory by SMA*.
+"""
+
+class SearchNode:
+    """
+    Class that represents a node of a search tree held in memory.
+
+    Unlike the other engines, which keep one entry per cell in a SearchState,
+    SMA* keeps an explicit tree of nodes, from which it removes the least
+    promising leaves once its node budget is spent. A removed node is not lost
+    entirely: the f_cost of every removed child of a node is kept in the node,
+    so that the search knows when it is worth generating it again.
+
+    Attributes:
+        cell (int): The index of the cell of the node.
+        g (float): The cost of the path from the start cell to the cell.
+        f (float): The lower bound on the cost of the paths through the node,
+            backed up from its forgotten children once none of its children is held.
+        depth (int): The number of moves from the start cell.
+        parent (SearchNode): The parent of the node, None for the root.
+        children (list): The children of the node which are held in memory, None
+            until the node is expanded.
+        forgotten (dict): The f of the children removed from memory, by cell, None
+            until a child is removed.
+        expanded (bool): Whether the successors of the node have been generated.
+        open (bool): Whether the node is waiting to be expanded, for the first
+            time or to generate its forgotten children again.
+        alive (bool): Whether the node is held in memory.
+    """
+
+    __slots__ = ('cell', 'g', 'f', 'depth', 'parent', 'children', 'forgotten', 'expanded', 'open', 'alive')
+
+    def __init__(self, cell: int, g: float, f: float, parent: 'SearchNode' = None) -> None:
+        self.cell = cell
+        self.g = g
+        self.f = f
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.parent = parent
+        # Most nodes are leaves which never lose a child, so both are created on demand
+        self.children = None
+        self.forgotten = None
+        self.expanded = False
+        self.open = True
+        self.alive = True
+
+    def key(self) -> float:
+        """
+        Returns the priority of the node in the open list: its f if it has never
+        been expanded, or the lowest f of its forgotten children.
+        """
+        if not self.expanded:
+            return self.f
+        return min(self.forgotten.values()) if self.forgotten else float('inf')
+
+    def __lt__(self, other: 'SearchNode') -> bool:
+        """
+        Order nodes by cell, which breaks the ties between equal heap entries.
+        """
+        return self.cell < other.cell
+
+    def path(self) -> list:
+        """
+        Returns the cells of the path from the start cell to the cell of the node.
+        """
+        path = []
+        node = self
+        while node is not None:
+            path.append(node.cell)
+            node = node.parent
+        path.reverse()
+        return path
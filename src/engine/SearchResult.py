@@ -0,0 +1,65 @@
+"""
+This module contains the SearchResult class, which holds the outcome of a headless search.
+"""
+
+class SearchResult:
+    """
+    Class that represents the outcome of a search engine run.
+
+    Instead of emitting a signal for every cell, the search engines record everything
+    that happened during a search in a SearchResult object, which can then be inspected
+    headlessly or replayed onto the grid widget.
+
+    The cells of the path and the expanded cells are stored by their flat index
+    (row * cols + col) in the grid model.
+
+    Attributes:
+        start (tuple): Coordinates of the start cell (row, col).
+        end (tuple): Coordinates of the end cell (row, col).
+        path (list): The indices of the cells of the path from start to end, empty if no path was found.
+        cost (int): The cost of the path, None if no path was found.
+        expanded (list): The indices of the cells in the order in which they were expanded.
+        abstractExpanded (list): The indices of the cells of the abstract graph nodes expanded
+            by hierarchical engines, before the cells of expanded.
+        heapPushes (int): The number of entries added to the open list.
+        decreaseKeys (int): The number of queued entries whose priority was lowered in place.
+        peakFrontier (int): The largest size reached by the open list.
+        stopped (bool): True if the search was stopped before it finished.
+    """
+    def __init__(self, start: tuple, end: tuple) -> None:
+        self.start = start
+        self.end = end
+        self.path = []
+        self.cost = None
+        self.expanded = []
+        self.abstractExpanded = []
+        self.heapPushes = 0
+        self.decreaseKeys = 0
+        self.peakFrontier = 0
+        self.stopped = False
+
+    @property
+    def found(self) -> bool:
+        """
+        Check whether the search found a path.
+
+        Returns:
+            bool: True if a path from start to end was found.
+        """
+        return bool(self.path)
+
+    @property
+    def nodesExpanded(self) -> int:
+        """
+        Returns the number of nodes expanded by the search, abstract nodes included.
+
+        Returns:
+            int: the number of expanded nodes.
+        """
+        return len(self.expanded) + len(self.abstractExpanded)
+
+    def __repr__(self) -> str:
+        return (f"SearchResult(found={self.found}, cost={self.cost}, "
+                f"expanded={self.nodesExpanded}, pushes={self.heapPushes}, "
+                f"decreaseKeys={self.decreaseKeys}, "
+                f"peakFrontier={self.peakFrontier})")
@@ -0,0 +1,79 @@
+"""
+This module contains the SearchState class, which holds the per-cell bookkeeping of a search in flat arrays.
+"""
+
+from array import array
+
+class SearchState:
+    """
+    Class that holds the per-cell bookkeeping of a search.
+
+    Instead of dictionaries and sets keyed by cell, the engines keep the parent,
+    the cost and the reached/closed flags of every cell in preallocated arrays
+    indexed by the flat index of the cell, which costs 10 bytes per cell and no
+    allocation during the search. A cell is reached or closed in the current run
+    if its stamp equals the current generation, so starting a new run only bumps
+    the generation; the arrays are cleared only when the generation wraps around.
+    The parents and costs of a cell are only valid once it has been reached.
+    Searches on grids with movement costs keep their costs in a second array
+    of doubles, allocated by the first of them.
+
+    Attributes:
+        size (int): The number of cells.
+        generation (int): The stamp of the current run, between 1 and maxGeneration.
+        parents (array): The index of the parent of every cell, -1 for the start cell.
+        costs (array): The cost of reaching every cell from the start (g_cost).
+        weightedCosts (array): The g_cost of every cell on grids with movement costs, None until used.
+        reached (bytearray): The generation in which every cell was last reached.
+        closed (bytearray): The generation in which every cell was last expanded.
+        reverse (SearchState): Optional second state for searches from both ends.
+    """
+
+    # Largest generation stamp which fits in a byte
+    maxGeneration = 255
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.generation = 0
+        self.parents = array('i', [-1]) * size
+        self.costs = array('i', [0]) * size
+        self.reached = bytearray(size)
+        self.closed = bytearray(size)
+        self.weightedCosts = None
+        self.reverse = None
+
+    def reset(self) -> None:
+        """
+        Start a new run, forgetting every reached and closed cell.
+        """
+        self.generation += 1
+        if self.generation > self.maxGeneration:
+            self.reached[:] = bytes(self.size)
+            self.closed[:] = bytes(self.size)
+            self.generation = 1
+        if self.reverse is not None:
+            self.reverse.reset()
+
+    def useWeightedCosts(self) -> array:
+        """
+        Returns the array of double g_costs, for searches on grids with movement costs.
+
+        Returns:
+            array: the weightedCosts array, allocated on first use.
+        """
+        if self.weightedCosts is None:
+            self.weightedCosts = array('d', [0.0]) * self.size
+        return self.weightedCosts
+
+    def reverseState(self) -> 'SearchState':
+        """
+        Returns a second state, reset together with this one, for the half of a
+        bidirectional search which runs from the end cell.
+
+        Returns:
+            SearchState: the state of the reverse search.
+        """
+        if self.reverse is None:
+            self.reverse = SearchState(self.size)
+            self.reverse.reset()
+        return self.reverse
@@ -0,0 +1,181 @@
+"""
+This module contains the SearchWorker class, which runs a search engine in a separate process.
+"""
+
+import multiprocessing
+import struct
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from itertools import islice
+
+from src.engine.SearchResult import SearchResult
+from src.grid.GridModel import GridModel, CHECKED, PATH, ABSTRACT
+
+class SearchWorker:
+    """
+    A search running in a worker process, on a shared memory snapshot of a grid.
+
+    The states of the grid, followed by its movement costs if it has any, are
+    copied once into a multiprocessing shared memory block, which the worker
+    process attaches to by name, so the grid is never pickled; the worker's
+    grid reads its states from the block without copying them. Its connectivity
+    settings are passed along with the other arguments. The worker runs the
+    engine at full speed, and streams the cells it expands back through a
+    one-way pipe, as compact messages of a state code byte followed by int32
+    cell indices, the path last. The search ends with a summary
+    message, of code 0 and the counters and path cost of the result.
+
+    The pipe holds a limited number of bytes, so a worker whose messages are not
+    received waits for them to be, e.g. while the search is paused in the GUI.
+    Since the search runs in its own process, it never holds the GIL of the GUI
+    process, and stopping it terminates the process at once.
+
+    Attributes:
+        process (multiprocessing.Process): The worker process.
+        connection (multiprocessing.connection.Connection): The receiving end of the pipe.
+        memory (SharedMemory): The shared memory block holding the states and costs of the grid.
+        result (SearchResult): The result, filled in as the messages are received.
+        finished (bool): Whether the summary of the search, or the end of the pipe, was received.
+        hasCosts (bool): Whether the grid has movement costs, shared after its states.
+    """
+
+    # Start method of the worker processes, which must not inherit the threads of the GUI process
+    context = multiprocessing.get_context('spawn')
+
+    # Number of engine steps between two messages of the worker
+    stepsPerMessage = 256
+
+    # Code of the summary message, and its heapPushes, decreaseKeys and peakFrontier counters and path cost
+    summaryCode = 0
+    summary = struct.Struct('<qqqd')
+
+    # Largest number of messages received at a time
+    maxReceived = 64
+
+    def __init__(self, rows: int, cols: int, states, start: tuple, end: tuple, engineClass,
+                 openListClass=None, heuristicClass=None, costs=None, movement=(4,)) -> None:
+        size = rows * cols
+        costBytes = len(costs) * costs.itemsize if costs is not None else 0
+        self.memory = SharedMemory(create=True, size=max(size + costBytes, 1))
+        self.memory.buf[:size] = states
+        if costs is not None:
+            self.memory.buf[size:size + costBytes] = memoryview(costs).cast('B')
+        self.hasCosts = costs is not None
+        self.connection, sender = self.context.Pipe(duplex=False)
+        self.process = self.context.Process(
+            target=SearchWorker.work, daemon=True,
+            args=(self.memory.name, rows, cols, start, end, engineClass, openListClass, heuristicClass,
+                  self.hasCosts, movement, sender))
+        self.process.start()
+        # Only the worker writes to the pipe, so that receiving ends once it exits
+        sender.close()
+        self.result = SearchResult(start, end)
+        self.finished = False
+
+    @classmethod
+    def work(cls, name: str, rows: int, cols: int, start: tuple, end: tuple, engineClass,
+             openListClass, heuristicClass, hasCosts, movement, connection) -> None:
+        """
+        Run a search and send its cells through the pipe. Executed in the worker process.
+
+        Args:
+            name (str): The name of the shared memory block holding the states and costs of the grid.
+            rows (int): The number of rows in the grid.
+            cols (int): The number of columns in the grid.
+            start (tuple): Coordinates of the start cell (row, col).
+            end (tuple): Coordinates of the end cell (row, col).
+            engineClass (type): The search engine class.
+            openListClass (type): The open list of best-first engines, None for the default one.
+            heuristicClass (type): Optional heuristic provider, built for the grid with forGrid.
+            hasCosts (bool): Whether the movement costs of the cells follow their states.
+            movement (tuple): The arguments of GridModel.setConnectivity for the grid.
+            connection (multiprocessing.connection.Connection): The sending end of the pipe.
+        """
+        memory = SharedMemory(name=name)
+        # The grid reads its states straight from the shared memory, which the GUI process never writes again
+        size = rows * cols
+        states = memory.buf[:size]
+        try:
+            grid = GridModel(rows, cols, states)
+            if hasCosts:
+                grid.costs = array('d')
+                grid.costs.frombytes(memory.buf[size:size + size * grid.costs.itemsize])
+            grid.setConnectivity(*movement)
+
+            heuristic = heuristicClass.forGrid(grid).heuristic if heuristicClass is not None else None
+            engine = engineClass(grid, openListClass=openListClass, heuristic=heuristic)
+            # The GUI process already checked reachability against its live component index
+            engine.checkReachability = False
+            result = SearchResult(start, end)
+            steps = engine.steps(result)
+            sent = {ABSTRACT: 0, CHECKED: 0}
+            with connection:
+                while True:
+                    count = sum(1 for _ in islice(steps, cls.stepsPerMessage))
+                    for code, cells in ((ABSTRACT, result.abstractExpanded), (CHECKED, result.expanded)):
+                        if len(cells) > sent[code]:
+                            connection.send_bytes(bytes((code,)) + array('i', cells[sent[code]:]).tobytes())
+                            sent[code] = len(cells)
+                    if count < cls.stepsPerMessage:
+                        break
+                if result.path:
+                    connection.send_bytes(bytes((PATH,)) + array('i', result.path).tobytes())
+                connection.send_bytes(bytes((cls.summaryCode,)) + cls.summary.pack(
+                    result.heapPushes, result.decreaseKeys, result.peakFrontier, result.cost or 0))
+        finally:
+            # The memory cannot be closed while a view of it is alive
+            states.release()
+            memory.close()
+
+    def receive(self) -> list:
+        """
+        Receive the messages sent by the worker so far, without waiting.
+
+        The cells are also recorded in the result, and the summary fills in its counters
+        and the cost of the path.
+
+        Returns:
+            list: (state code, array('i') of cell indices) pairs, empty if no cells were ready.
+        """
+        batches = []
+        result = self.result
+        while not self.finished and len(batches) < self.maxReceived:
+            try:
+                if not self.connection.poll():
+                    break
+                message = self.connection.recv_bytes()
+            except (EOFError, OSError):
+                # The worker exited without a summary, e.g. because the engine failed
+                result.stopped = True
+                self.finished = True
+                break
+            code = message[0]
+            if code == self.summaryCode:
+                result.heapPushes, result.decreaseKeys, result.peakFrontier, cost = self.summary.unpack_from(message, 1)
+                # The path message counts moves, which is its cost on uniform 4-connected grids
+                if result.path and cost != result.cost:
+                    result.cost = cost
+                self.finished = True
+                break
+            cells = array('i')
+            cells.frombytes(memoryview(message)[1:])
+            if code == ABSTRACT:
+                result.abstractExpanded.extend(cells)
+            elif code == CHECKED:
+                result.expanded.extend(cells)
+            else:
+                result.path = cells.tolist()
+                result.cost = len(result.path) - 1
+            batches.append((code, cells))
+        return batches
+
+    def stop(self) -> None:
+        """
+        Terminate the worker if it is still running, and release the pipe and the shared memory.
+        """
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.connection.close()
+        self.memory.close()
+        self.memory.unlink()
@@ -0,0 +1,181 @@
+"""
+This module contains a vectorized implementation of the BFS search algorithm, expanding one wavefront at a time.
+"""
+
+from typing import Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional, only this engine needs it
+    np = None
+
+from src.engine.BaseEngine import BaseEngine
+from src.grid.GridModel import OBSTACLE
+
+class WavefrontEngine(BaseEngine):
+    """
+    Wavefront (vectorized BFS) search engine.
+
+    Instead of expanding one cell at a time, the engine expands the whole BFS
+    frontier at once. The frontier is an array of flat cell indices: adding the
+    offset of each of the four directions to it, masked by the grid borders and
+    by the cells which are open and not reached yet, gives the next frontier.
+    Every layer costs a handful of NumPy array operations, whatever its size,
+    and produces the distance from the source to every cell of the grid and the
+    direction of the parent of every cell. This pays off on large open maps,
+    where the frontier is wide, but not in narrow mazes, where layers hold only
+    a few cells each. On 8-connected grids, the frontier is shifted diagonally
+    too, keeping the moves allowed by the corner-cutting policy, and the path
+    has the fewest moves. Requires numpy.
+
+    Args:
+        BaseEngine: The base class for all search engines.
+    """
+
+    # True if numpy could be imported
+    available = np is not None
+
+    connectivities = (4, 8)
+
+    # The distances and parent directions are kept in numpy arrays
+    usesState = False
+
+    def __init__(self, grid, stopEvent=None, openListClass=None, state=None, heuristic=None) -> None:
+        if np is None:
+            raise ImportError("The wavefront engine requires numpy: pip install numpy")
+        super().__init__(grid, stopEvent, openListClass, state, heuristic)
+
+    def distanceField(self, source: int, target: int = None, expanded: list = None) -> tuple:
+        """
+        Compute the BFS distance from a source cell to every cell of the grid.
+
+        Args:
+            source (int): The index of the source cell.
+            target (int): Optional index of a cell at which to stop, None for the whole grid.
+            expanded (list): Optional list to which the expanded cells are appended, layer by layer.
+
+        Returns:
+            tuple: the distances, parent directions and largest frontier size, as returned by wavefronts.
+        """
+        layers = self.wavefronts(source, target, expanded)
+        while True:
+            try:
+                next(layers)
+            except StopIteration as finished:
+                return finished.value
+
+    def wavefronts(self, source: int, target: int = None, expanded: list = None) -> Iterator[int]:
+        """
+        Compute the BFS distance from a source cell to every cell of the grid, one layer per step.
+
+        Algorithm:
+            1. Initialize the frontier with the source cell, at distance 0.
+            2. While the frontier is not empty:
+                2.1. Record the cells of the frontier as expanded.
+                2.2. If the target cell has been reached, stop.
+                2.3. Shift the frontier by one cell in each direction and keep
+                the cells which are open and not reached yet, together with the
+                direction of their parent. Diagonal shifts also need the cells
+                beside the move to be open, following the corner-cutting policy.
+                2.4. Remove duplicates, keeping the first parent direction; these
+                cells get the next distance and become the new frontier.
+
+        Args:
+            source (int): The index of the source cell.
+            target (int): Optional index of a cell at which to stop, None for the whole grid.
+            expanded (list): Optional list to which the expanded cells are appended, layer by layer.
+
+        Yields:
+            int: the index of the last cell of every layer, once it is expanded.
+
+        Returns:
+            tuple: the flat int32 array of distances (-1 for unreached cells), the flat
+                uint8 array of parent directions (0 for the source and unreached cells,
+                then 1 + the position in moveOffsets of the move from the parent)
+                and the size of the largest frontier.
+        """
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        open_cells = np.frombuffer(self.states, dtype=np.uint8) != OBSTACLE
+        unvisited = open_cells.copy()
+        never = self.grid.cornerCutting == 'never'
+        distances = np.full(size, -1, dtype=np.int32)
+        directions = np.zeros(size, dtype=np.uint8)
+
+        frontier = np.array([source], dtype=np.int64)
+        unvisited[source] = False
+        distances[source] = 0
+        layer = 0
+        peak = 1
+
+        while len(frontier) and not self.isStopped():
+            if expanded is not None:
+                expanded.extend(frontier.tolist())
+            yield int(frontier[-1])
+            if target is not None and distances[target] >= 0:
+                break
+
+            layer += 1
+            columns = frontier % cols
+            inside = {-1: frontier >= cols, 1: frontier < size - cols}
+            inside_columns = {-1: columns > 0, 1: columns < cols - 1}
+            shifted = []
+            for d_row, d_col in self.moveOffsets():
+                if d_row and d_col:
+                    cells = frontier[inside[d_row] & inside_columns[d_col]]
+                    vertical, horizontal = open_cells[cells + d_row * cols], open_cells[cells + d_col]
+                    cells = cells[(vertical & horizontal) if never else (vertical | horizontal)]
+                elif d_row:
+                    cells = frontier[inside[d_row]]
+                else:
+                    cells = frontier[inside_columns[d_col]]
+                shifted.append(cells + (d_row * cols + d_col))
+            candidates = np.concatenate(shifted)
+            codes = np.concatenate([np.full(len(cells), code, dtype=np.uint8)
+                                    for code, cells in enumerate(shifted, 1)])
+            keep = unvisited[candidates]
+            frontier, first = np.unique(candidates[keep], return_index=True)
+            unvisited[frontier] = False
+            distances[frontier] = layer
+            directions[frontier] = codes[keep][first]
+            peak = max(peak, len(frontier))
+
+        return distances, directions, peak
+
+    def moveOffsets(self) -> tuple:
+        """
+        Returns the (row, col) offsets of the moves of the engine on its grid.
+        """
+        return self.grid.moveOffsets[self.connectivity]
+
+    def pathTo(self, directions, target: int) -> list:
+        """
+        Follow the parent directions from a cell back to the source.
+
+        Args:
+            directions: The flat array of parent directions returned by wavefronts.
+            target (int): The index of a reached cell.
+
+        Returns:
+            list: the cells of the path, from the source cell to the target cell.
+        """
+        offsets = [0] + [-(d_row * self.cols + d_col) for d_row, d_col in self.moveOffsets()]
+        path = [target]
+        current = target
+        while directions[current]:
+            current += offsets[directions[current]]
+            path.append(current)
+        path.reverse()
+        return path
+
+    def run(self, start: int, end: int, result) -> Iterator[int]:
+        """
+        Find the shortest path from the start cell to the end cell, one wavefront at a time.
+        """
+        distances, directions, peak = yield from self.wavefronts(start, end, result.expanded)
+        if distances[end] >= 0:
+            result.path = self.pathTo(directions, end)
+            result.cost = self.grid.pathCost(result.path)
+        result.heapPushes = int(np.count_nonzero(distances >= 0)) - 1
+        result.peakFrontier = peak
@@ -5,18 +5,32 @@ This module contains the GridEventHandler class, which is responsible for handli
 
 from PyQt5.QtCore import Qt, QPropertyAnimation
 from PyQt5.QtGui import QFont
-from src.grid.Cell import Cell
 from src.custom.CustomGraphicsTextItem import CustomGraphicsTextItem
 
 class GridEventHandler:
     """
     Class that handles mouse events on the grid.
+
+    The states of the cells are read from and written to the grid model of the
+    grid widget, and cells are identified by their (row, col) coordinates, so the
+    handler works with every renderer of the grid widget.
+    Obstacle edits go through GridModel.setState, which gives the grid a new
+    version, so that caches keyed by the version (jump tables, distance fields)
+    never serve data computed for the old obstacles.
+
+    When a terrain cost is selected, the right mouse button paints that movement
+    cost onto the cells which are not obstacles instead of placing obstacles.
+
+    Attributes:
+        terrainCost (float): The movement cost painted by the right mouse button,
+            None to place and remove obstacles.
     """
     def __init__(self, gridWidget) -> None:
         self.gridWidget = gridWidget
         self.activePopups = {}
         self.dragging = False
         self.dragState = None
+        self.terrainCost = None
         
     def handleMousePress(self, event) -> None:
         """
@@ -28,15 +42,15 @@ class GridEventHandler:
         Args:
             event: the mouse press event.
         """
-        item = self.getCellFromEvent(event)
+        cell = self.getCellFromEvent(event)
         
-        if isinstance(item, Cell):
+        if cell is not None:
             if event.button() == Qt.LeftButton:
-                self.handleLeftClick(item)
+                self.handleLeftClick(cell)
             elif event.button() == Qt.RightButton:
                 self.dragging = True
-                self.setDragState(item)
-                self.handleRightClick(item)
+                self.setDragState(cell)
+                self.handleRightClick(cell)
                     
     def handleMouseRelease(self, event) -> None:
         """
@@ -64,56 +78,75 @@ class GridEventHandler:
             event: the mouse move event.
         """
         if self.dragging:
-            item = self.getCellFromEvent(event)
-            if isinstance(item, Cell):
-                self.handleRightClick(item)
+            cell = self.getCellFromEvent(event)
+            if cell is not None:
+                self.handleRightClick(cell)
     
-    def handleLeftClick(self, item: Cell) -> None:
+    def handleLeftClick(self, cell: tuple) -> None:
         """
         Handle left-click events on the grid.
         
         This method is used to set the start and end nodes on the grid.
 
         Args:
-            item (Cell): the cell that the user has clicked on.
+            cell (tuple): the (row, col) of the cell that the user has clicked on.
         """
-        if item.getState() == 'empty':
+        state = self.getState(cell)
+        if state == 'empty':
             if not self.gridWidget.getStartNodeState():
-                self.updateCellState(item, 'start', 'Start')
+                self.updateCellState(cell, 'start', 'Start')
                 self.gridWidget.updateStartNodeState()
             elif not self.gridWidget.getEndNodeState():
-                self.updateCellState(item, 'end', 'End')
+                self.updateCellState(cell, 'end', 'End')
                 self.gridWidget.updateEndNodeState()
-        elif item.getState() == 'start':
-            self.updateCellState(item, 'empty', 'Empty')
+        elif state == 'start':
+            self.updateCellState(cell, 'empty', 'Empty')
             self.gridWidget.updateStartNodeState()
-        elif item.getState() == 'end':
-            self.updateCellState(item, 'empty', 'Empty')
+        elif state == 'end':
+            self.updateCellState(cell, 'empty', 'Empty')
             self.gridWidget.updateEndNodeState()
             
-    def handleRightClick(self, item: Cell) -> None:
+    def handleRightClick(self, cell: tuple) -> None:
         """
         Handle right-click events on the grid.
         
-        This method is used to set obstacles on the grid. It also supports
-        dragging the mouse to set multiple obstacles at once.
+        This method is used to set obstacles on the grid, or to paint the
+        terrain cost onto cells when one is selected. It also supports
+        dragging the mouse to set multiple cells at once.
+
+        Args:
+            cell (tuple): the (row, col) of the cell that the user has right-clicked on.
+        """
+        state = self.getState(cell)
+        if self.dragState == 'obstacle' and state == 'empty':
+            self.updateCellState(cell, 'obstacle', 'Obstacle')
+        elif self.dragState == 'empty' and state == 'obstacle':
+            self.updateCellState(cell, 'empty', 'Empty')
+        elif self.dragState == 'terrain' and state != 'obstacle':
+            if self.gridWidget.model.getCost(*cell) != self.terrainCost:
+                self.gridWidget.setCellCost(*cell, self.terrainCost)
+                self.showPopupText(cell, f"Cost {self.terrainCost:g}")
+
+    def getState(self, cell: tuple) -> str:
+        """
+        Get the state of a cell from the grid model.
 
         Args:
-            item (Cell): the cell that the user has right-clicked on.
+            cell (tuple): the (row, col) of the cell whose state is read.
+
+        Returns:
+            str: state of cell.
         """
-        if self.dragState == 'obstacle' and item.getState() == 'empty':
-            self.updateCellState(item, 'obstacle', 'Obstacle')
-        elif self.dragState == 'empty' and item.getState() == 'obstacle':
-            self.updateCellState(item, 'empty', 'Empty')
+        return self.gridWidget.model.getState(*cell)
     
-    def updateCellState(self, item: Cell, newState: str, popupText: str) -> None:
+    def updateCellState(self, cell: tuple, newState: str, popupText: str) -> None:
         """
         Update the state of a cell on the grid.
         """
-        item.setState(newState)
-        self.showPopupText(item, popupText)
+        self.gridWidget.setCellState(*cell, newState)
+        self.showPopupText(cell, popupText)
         
-    def getCellFromEvent(self, event) -> Cell:
+    def getCellFromEvent(self, event) -> tuple:
         """
         Get the cell that the user has clicked on.
 
@@ -121,29 +154,34 @@ class GridEventHandler:
             event: the mouse event.
 
         Returns:
-            Cell: returns the cell that the user has clicked on.
+            tuple: the (row, col) of the cell that the user has clicked on,
+                or None if the mouse is outside the grid.
         """
         scenePos = self.gridWidget.mapToScene(event.pos())
-        return self.gridWidget.scene.itemAt(scenePos, self.gridWidget.transform())
+        return self.gridWidget.cellAt(scenePos)
     
-    def setDragState(self, item: Cell) -> None:
+    def setDragState(self, cell: tuple) -> None:
         """
         Set the drag state of the grid.
         
         Once the user has right-clicked and started dragging over the grid, this
         method ensures that all cells that the user drags over will be set to either
         'obstacle' or 'empty'. This is so that the user doesn't accidentally set
-        a cell to 'obstacle' and back to 'empty' on the same drag.
+        a cell to 'obstacle' and back to 'empty' on the same drag. When a terrain
+        cost is selected, the drag paints that cost instead.
 
         Args:
-            item (Cell): _description_
+            cell (tuple): the (row, col) of the cell where the drag started.
         """
-        if item.getState() == 'empty':
+        state = self.getState(cell)
+        if self.terrainCost is not None:
+            self.dragState = 'terrain'
+        elif state == 'empty':
             self.dragState = 'obstacle'
-        elif item.getState() == 'obstacle':
+        elif state == 'obstacle':
             self.dragState = 'empty'
     
-    def showPopupText(self, cell: Cell, text: str) -> None:
+    def showPopupText(self, cell: tuple, text: str) -> None:
         """
         Show a popup text above a cell on the grid.
         
@@ -152,11 +190,12 @@ class GridEventHandler:
         This is to avoid confusion when the user is setting the start and end nodes or obstacles.
 
         Args:
-            cell (Cell): the cell over which the text will pop up.
+            cell (tuple): the (row, col) of the cell over which the text will pop up.
             text (str): the text which will be displayed in the popup - represents the state of the cell.
         """
         # Get position of cell
-        cellPos = (cell.x(), cell.y())
+        size = self.gridWidget.cell_size
+        cellPos = (cell[1] * size, cell[0] * size)
 
         # Check if cell is already active
         if cellPos in self.activePopups:
@@ -167,7 +206,7 @@ class GridEventHandler:
         # Call custom graphics text item
         popupText = CustomGraphicsTextItem(text)
         popupText.setDefaultTextColor(Qt.black)
-        popupText.setPos(cell.x(), cell.y() - cell.rect().height() / 2)
+        popupText.setPos(cellPos[0], cellPos[1] - size / 2)
         self.gridWidget.scene.addItem(popupText)
 
         font = QFont("Segoe UI", 8)
@@ -6,16 +6,26 @@ This module contains the WindowEventHandler class which is responsible for handl
 import os
 import threading
 
-from PyQt5.QtWidgets import QWidget, QDialog, QMessageBox
+from PyQt5.QtWidgets import QWidget, QDialog, QMessageBox, QFileDialog
 from PyQt5.QtCore import pyqtSlot
 
 from src.dialogs.AlgorithmSelectionDialog import AlgorithmSelectionDialog
 from src.dialogs.ResetDialog import ResetDialog
+from src.grid.GridModel import GridModel
+from src.grid.MovingAIMap import MovingAIMap
 
 class WindowEventHandler:
     """
     Class that handles events on the main window.
     """
+
+    # Filters of the save and open file dialogs, grids can also be opened from Moving AI maps
+    gridFileFilter = "Grid files (*.grid);;All files (*)"
+    openFileFilter = "Grid files (*.grid);;Moving AI maps (*.map);;All files (*)"
+
+    # Grids with at least this many cells are saved raw, so that they can be memory-mapped when opened
+    rawSaveCells = 1 << 20
+
     def __init__(self, grid_window):
         self.grid_window = grid_window
         self.lock = threading.Lock()
@@ -76,6 +86,82 @@ class WindowEventHandler:
                 self.grid_window.gridWidget.resetGrid(option)
             overlay.deleteLater()
     
+    def pauseClicked(self) -> None:
+        """
+        Handle the pause button click event.
+
+        This method is called when the user clicks the pause button. It pauses
+        the current search, or resumes it if it is already paused.
+        """
+        search = self.grid_window.currentSearch
+        if search is None or not search.isRunning():
+            self.grid_window.pauseButton.setText('Pause')
+        elif search.isPaused():
+            search.resumeSearch()
+            self.grid_window.pauseButton.setText('Pause')
+        else:
+            search.pauseSearch()
+            self.grid_window.pauseButton.setText('Resume')
+
+    def stepClicked(self) -> None:
+        """
+        Handle the step button click event.
+
+        This method is called when the user clicks the step button. It pauses
+        the current search if needed, and shows the next cell it updates.
+        """
+        search = self.grid_window.currentSearch
+        if search is None or not search.isRunning():
+            return
+        search.pauseSearch()
+        self.grid_window.pauseButton.setText('Resume')
+        search.stepSearch()
+
+    def saveClicked(self) -> None:
+        """
+        Handle the save button click event.
+
+        This method is called when the user clicks the save button. It stops the
+        current search and asks for a file to save the grid to. Small grids are
+        run-length encoded, while large ones are saved raw, to be memory-mapped.
+        """
+        with self.lock:
+            self.grid_window.stopCurrentSearch()
+            path, _ = QFileDialog.getSaveFileName(self.grid_window, "Save Grid", "", self.gridFileFilter)
+            if not path:
+                return
+            if not os.path.splitext(path)[1]:
+                path += '.grid'
+            model = self.grid_window.gridWidget.model
+            encoding = 'raw' if model.rows * model.cols >= self.rawSaveCells else 'rle'
+            try:
+                model.save(path, encoding)
+            except OSError as error:
+                QMessageBox.critical(self.grid_window, "Error", f"Could not save the grid: {error}")
+
+    def openClicked(self) -> None:
+        """
+        Handle the open button click event.
+
+        This method is called when the user clicks the open button. It stops the
+        current search, asks for a grid file or a Moving AI map and replaces the
+        grid by its content.
+        """
+        with self.lock:
+            self.grid_window.stopCurrentSearch()
+            path, _ = QFileDialog.getOpenFileName(self.grid_window, "Open Grid", "", self.openFileFilter)
+            if not path:
+                return
+            try:
+                if path.endswith('.map'):
+                    model = MovingAIMap(path).read()
+                else:
+                    model = GridModel.load(path)
+            except (OSError, ValueError) as error:
+                QMessageBox.critical(self.grid_window, "Error", f"Could not open the grid: {error}")
+                return
+            self.grid_window.loadGrid(model)
+
     def showBlurOverlay(self) -> QWidget:
         """
         Show a blur overlay on the main window.
@@ -113,8 +199,49 @@ class WindowEventHandler:
 
     def changeSpeed(self):
         """
-        Handle the speed slider value change event.
+        Handle the speed slider value change and instant check box events.
+
+        The slider is mapped exponentially onto the number of cells animated per
+        frame, from a few cells per second up to several hundred cells per frame.
+        When the instant check box is ticked, results are shown at once.
+        """
+        if self.grid_window.instantCheckBox.isChecked():
+            cellsPerFrame = 0
+        else:
+            speed = self.grid_window.speedSlider.value()
+            cellsPerFrame = 10 ** ((speed - 30) / 25)
+        for algorithm in self.grid_window.algorithmToInstanceMap.values():
+            algorithm.setCellsPerFrame(cellsPerFrame)
+
+    def changeBrush(self):
+        """
+        Handle the brush combo box selection event.
+
+        The right mouse button places obstacles, or paints the selected terrain
+        cost onto the cells of the grid.
+        """
+        cost = self.grid_window.brushComboBox.currentData()
+        self.grid_window.gridWidget.eventHandler.terrainCost = cost
+
+    def changeMovement(self):
+        """
+        Handle the movement combo box selection event.
+
+        The searches move in 4 directions, or in 8, with or without cutting the
+        corners of obstacles. Algorithms which only move in 4 directions keep
+        doing so on 8-connected grids.
+        """
+        self.grid_window.stopCurrentSearch()
+        connectivity, cornerCutting = self.grid_window.movementComboBox.currentData()
+        self.grid_window.gridWidget.model.setConnectivity(connectivity, cornerCutting)
+
+    def changeWorker(self):
+        """
+        Handle the worker process check box events.
+
+        When the check box is ticked, the next searches run in a worker process,
+        for the algorithms which support it, instead of in the GUI process.
         """
-        speed = self.grid_window.speedSlider.value()
+        useWorker = self.grid_window.workerCheckBox.isChecked()
         for algorithm in self.grid_window.algorithmToInstanceMap.values():
-            algorithm.setDelay(speed)
+            algorithm.useWorker = useWorker
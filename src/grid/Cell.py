@@ -8,19 +8,24 @@ from PyQt5.QtGui import QColor, QBrush, QPen
 class Cell(QGraphicsRectItem):
     """
     Class for defining a cell object in the grid.
-    
-    This class represents a cell object in the grid, which can be in one of the following states:
+
+    This class is a view onto one cell of a GridModel: the state itself is stored
+    in the model, and the cell only draws it. A cell can be in one of the following states:
         - empty: cell is empty;
         - obstacle: cell is an obstacle, i.e., not traversable;
         - checked: cell has been checked by a path finder;
         - start: cell marks the source node for the path finder;
         - end: cell marks the destination node for the path finder;
-        - path: cell is part of the path found by the path finder.
+        - path: cell is part of the path found by the path finder;
+        - abstract: cell is a node of an abstract graph expanded by a hierarchical path finder.
+
+    Empty cells whose movement cost is above 1 are shaded from the empty color
+    towards the terrain color, the darker the more expensive.
 
     Args:
         QGraphicsRectItem: The QGraphicsRectItem class provides a rectangle item that you can add to a QGraphicsScene.
     """
-    
+
     # Dictionary mapping state of cell to color in grid
     stateColorMap = {
         'empty': QColor(245, 245, 245),
@@ -28,26 +33,89 @@ class Cell(QGraphicsRectItem):
         'checked': QColor(198, 198, 198),
         'start': QColor(65, 252, 3),
         'end': QColor(252, 3, 3),
-        'path': QColor(152, 111, 191)
+        'path': QColor(152, 111, 191),
+        'abstract': QColor(120, 170, 230)
     }
-    
+
     # Color of border of cell
     borderColor = QColor(102, 102, 102)
-    
-    def __init__(self, x, y, size) -> None:
+
+    # Color of the most expensive terrain
+    terrainColor = QColor(166, 124, 72)
+
+    # Number of shades of terrain, and the movement cost drawn with the darkest one
+    terrainShades = 8
+    maxShadedCost = 10
+
+    # Brushes and pen shared by all cells, created on first use
+    stateBrushMap = {}
+    terrainBrushMap = {}
+    borderPen = None
+
+    def __init__(self, model, row, col, size) -> None:
         super().__init__(0, 0, size, size)
-        self.setPos(x * size, y * size)
-        self.state = 'empty'
+        self.setPos(col * size, row * size)
+        self.model = model
+        self.row = row
+        self.col = col
+        if Cell.borderPen is None:
+            Cell.borderPen = QPen(self.borderColor)
+        self.setPen(Cell.borderPen)
         self.updateColor()
 
     def updateColor(self) -> None:
         """
-        Updates the color of the cell based on its state.
+        Updates the color of the cell based on its state and movement cost in the model.
+        """
+        state = self.getState()
+        if state == 'empty':
+            shade = self.terrainShade(self.model.getCost(self.row, self.col))
+            if shade:
+                brush = self.terrainBrushMap.get(shade)
+                if brush is None:
+                    brush = self.terrainBrushMap[shade] = QBrush(self.shadeColor(shade))
+                self.setBrush(brush)
+                return
+        brush = self.stateBrushMap.get(state)
+        if brush is None:
+            color = self.stateColorMap.get(state, self.stateColorMap['empty'])
+            brush = self.stateBrushMap[state] = QBrush(color)
+        self.setBrush(brush)
+
+    @classmethod
+    def terrainShade(cls, cost) -> int:
+        """
+        Returns the shade of terrain drawn for a movement cost.
+
+        Args:
+            cost (float): the movement cost of a cell.
+
+        Returns:
+            int: 0 for costs up to 1, which are drawn as empty cells, otherwise
+                a shade between 1 and terrainShades.
+        """
+        if cost <= 1:
+            return 0
+        return min(cls.terrainShades, 1 + int((cost - 1) * (cls.terrainShades - 1) / (cls.maxShadedCost - 1)))
+
+    @classmethod
+    def shadeColor(cls, shade: int) -> QColor:
+        """
+        Returns the color of a shade of terrain.
+
+        Args:
+            shade (int): the shade, between 1 and terrainShades.
+
+        Returns:
+            QColor: the color between the empty color and the terrain color.
         """
-        color = self.stateColorMap.get(self.state, self.stateColorMap['empty'])
-        self.setBrush(QBrush(color))
-        self.setPen(QPen(self.borderColor))
-        
+        empty = cls.stateColorMap['empty']
+        weight = shade / cls.terrainShades
+        return QColor(*(round(a + (b - a) * weight) for a, b in (
+            (empty.red(), cls.terrainColor.red()),
+            (empty.green(), cls.terrainColor.green()),
+            (empty.blue(), cls.terrainColor.blue()))))
+
     def setState(self, state) -> None:
         """
         Sets the state of the cell.
@@ -55,9 +123,9 @@ class Cell(QGraphicsRectItem):
         Args:
             state (str): state of cell.
         """
-        self.state = state
+        self.model.setState(self.row, self.col, state)
         self.updateColor()
-        
+
     def getState(self) -> str:
         """
         Returns the state of the cell.
@@ -65,4 +133,4 @@ class Cell(QGraphicsRectItem):
         Returns:
             str: state of cell.
         """
-        return self.state
\ No newline at end of file
+        return self.model.getState(self.row, self.col)
@@ -0,0 +1,84 @@
+"""
+Module under which the CellUpdateBuffer class is defined.
+
+"""
+
+import threading
+from array import array
+from itertools import islice
+
+class CellUpdateBuffer:
+    """
+    Class for collecting cell state updates until the grid is redrawn.
+
+    Producers (the timeline player, or searches running in other threads) push
+    batches of (index, state code) updates into the buffer, and the grid widget
+    drains it once per frame. Updates of the same cell are merged, so when the
+    GUI falls behind only the latest state of each cell is kept and the
+    intermediate ones are dropped. The buffer is thread-safe.
+
+    Attributes:
+        maxPending (int): The number of pending cells above which the buffer is full.
+        _pending (dict): Maps the index of each pending cell to its latest state code.
+        _lock (threading.Lock): The lock guarding the pending updates.
+    """
+    def __init__(self, maxPending: int = 65536) -> None:
+        self.maxPending = maxPending
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def push(self, indices, codes) -> None:
+        """
+        Add a batch of cell updates.
+
+        Args:
+            indices: The flat indices of the cells.
+            codes: The new state code of every cell.
+        """
+        with self._lock:
+            self._pending.update(zip(indices, codes))
+
+    def drain(self, limit: int = None) -> tuple:
+        """
+        Remove pending updates from the buffer, oldest first.
+
+        Args:
+            limit (int): The maximum number of cells to remove, all of them if None.
+
+        Returns:
+            tuple: an array('i') of cell indices and a bytes object of their state codes.
+        """
+        with self._lock:
+            if limit is None or limit >= len(self._pending):
+                items = self._pending
+                self._pending = {}
+            else:
+                items = dict(islice(self._pending.items(), limit))
+                for index in items:
+                    del self._pending[index]
+        return array('i', items.keys()), bytes(items.values())
+
+    def clear(self) -> None:
+        """
+        Drop all pending updates.
+        """
+        with self._lock:
+            self._pending = {}
+
+    def pending(self) -> int:
+        """
+        Returns the number of cells waiting to be drawn.
+
+        Returns:
+            int: the number of pending cells.
+        """
+        return len(self._pending)
+
+    def isFull(self) -> bool:
+        """
+        Check whether producers should wait for the grid to catch up.
+
+        Returns:
+            bool: True if at least maxPending cells are waiting to be drawn.
+        """
+        return len(self._pending) >= self.maxPending
@@ -0,0 +1,240 @@
+"""
+This module contains the GridFile class, which reads and writes grids in a compact binary format.
+"""
+
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+
+from src.grid.GridModel import EMPTY, OBSTACLE, START, END
+
+class GridFile:
+    """
+    Binary file format of grids.
+
+    A grid file starts with a 32-byte little-endian header:
+        - magic (6 bytes): b'PFGRID';
+        - format version (1 byte);
+        - encoding (1 byte): 0 for raw, 1 for packed, 2 for run-length encoded;
+        - rows, cols (4 bytes each);
+        - offset, length (8 bytes each): the position and size of the cell data.
+
+    Grids with movement costs are written in format version 2, whose header is
+    followed by the offset and length (8 bytes each) of a cost section, which
+    holds one little-endian double per cell after the cell data. Grids without
+    costs are still written in format version 1.
+
+    Only the map itself is stored: every cell is empty, an obstacle, the start
+    or the end cell, and checked or path cells are saved as empty ones. The
+    cell data is encoded as:
+        - raw: one byte per cell, holding the state code of GridModel. The data
+        starts at a multiple of 64 KiB, so that it can be memory-mapped on every
+        platform and used as the states array of the grid model, without copying.
+        - packed: two bits per cell, four cells per byte, the first in the lowest bits.
+        - rle: (count, state code) byte pairs, for runs of up to 255 cells.
+
+    Attributes:
+        path (str): The path of the file.
+    """
+
+    # Header: magic, format version, encoding, rows, cols, data offset, data length
+    header = struct.Struct('<6sBBIIQQ')
+    magic = b'PFGRID'
+    formatVersion = 2
+
+    # Extension of the header in format version 2: cost section offset and length
+    costHeader = struct.Struct('<QQ')
+
+    # Dictionary mapping encoding name to its code in the header
+    encodings = {'raw': 0, 'packed': 1, 'rle': 2}
+
+    # Alignment of raw cell data, a multiple of mmap.ALLOCATIONGRANULARITY on every platform
+    rawAlignment = 1 << 16
+
+    # Translation tables between state codes and the stored codes
+    saved = bytes(code if code in (OBSTACLE, START, END) else EMPTY for code in range(256))
+    packedCodes = [EMPTY, OBSTACLE, START, END]
+    toPacked = bytes.maketrans(bytes(packedCodes), bytes(range(len(packedCodes))))
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def write(self, rows: int, cols: int, states, encoding: str = 'raw', costs=None) -> None:
+        """
+        Write a grid to the file.
+
+        Args:
+            rows (int): The number of rows in the grid.
+            cols (int): The number of columns in the grid.
+            states: The state code of every cell, row by row.
+            encoding (str): 'raw', 'packed' or 'rle'.
+            costs (array): Optional movement cost of every cell, as an array of doubles.
+        """
+        if encoding not in self.encodings:
+            raise ValueError(f"Unknown grid encoding: {encoding}")
+        data = states[:].translate(self.saved)
+        if encoding == 'packed':
+            data = self.pack(data)
+        elif encoding == 'rle':
+            data = self.encodeRuns(data)
+        version, headerSize = 1, self.header.size
+        if costs is not None:
+            version, headerSize = self.formatVersion, headerSize + self.costHeader.size
+        offset = self.rawAlignment if encoding == 'raw' else headerSize
+
+        # Write next to the file and swap it in, so that a grid mapped from the old file stays valid
+        temporary = self.path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(self.header.pack(self.magic, version, self.encodings[encoding],
+                                        rows, cols, offset, len(data)))
+            if costs is not None:
+                costs = array('d', costs)
+                if sys.byteorder == 'big':
+                    costs.byteswap()
+                file.write(self.costHeader.pack(offset + len(data), len(costs) * costs.itemsize))
+            file.write(bytes(offset - headerSize))
+            file.write(data)
+            if costs is not None:
+                costs.tofile(file)
+        os.replace(temporary, self.path)
+
+    def read(self, useMmap: bool = True) -> tuple:
+        """
+        Read a grid from the file.
+
+        Args:
+            useMmap (bool): Whether to memory-map raw cell data instead of reading it.
+
+        Returns:
+            tuple: the number of rows, the number of columns, and the states of the
+                cells, as a copy-on-write mmap for mapped raw files or a bytearray.
+
+        Raises:
+            ValueError: if the file is not a valid grid file.
+        """
+        with open(self.path, 'rb') as file:
+            header = file.read(self.header.size)
+            if len(header) != self.header.size:
+                raise ValueError(f"{self.path} is not a grid file")
+            magic, version, encoding, rows, cols, offset, length = self.header.unpack(header)
+            if magic != self.magic:
+                raise ValueError(f"{self.path} is not a grid file")
+            if version > self.formatVersion:
+                raise ValueError(f"{self.path} was written by a newer version (format {version})")
+            if encoding not in self.encodings.values():
+                raise ValueError(f"{self.path} uses an unknown encoding ({encoding})")
+            size = rows * cols
+
+            if encoding == self.encodings['raw']:
+                if length != size:
+                    raise ValueError(f"{self.path} holds {length} cells instead of {size}")
+                if useMmap and size and offset % mmap.ALLOCATIONGRANULARITY == 0:
+                    # Pages are loaded on first access, and edits stay private to the process
+                    return rows, cols, mmap.mmap(file.fileno(), size, offset=offset, access=mmap.ACCESS_COPY)
+
+            file.seek(offset)
+            data = file.read(length)
+            if len(data) != length:
+                raise ValueError(f"{self.path} is truncated")
+
+        if encoding == self.encodings['packed']:
+            data = self.unpack(data, size)
+        elif encoding == self.encodings['rle']:
+            data = self.decodeRuns(data)
+        if len(data) != size:
+            raise ValueError(f"{self.path} holds {len(data)} cells instead of {size}")
+        return rows, cols, bytearray(data)
+
+    def readCosts(self):
+        """
+        Read the movement costs of the cells from the file.
+
+        Returns:
+            array: the movement cost of every cell, as an array of doubles, or None
+                if the file holds no costs.
+
+        Raises:
+            ValueError: if the cost section is not valid.
+        """
+        with open(self.path, 'rb') as file:
+            _, version, _, rows, cols, _, _ = self.header.unpack(file.read(self.header.size))
+            if version < 2:
+                return None
+            offset, length = self.costHeader.unpack(file.read(self.costHeader.size))
+            costs = array('d')
+            if length != rows * cols * costs.itemsize:
+                raise ValueError(f"{self.path} holds {length} bytes of costs instead of {rows * cols * costs.itemsize}")
+            file.seek(offset)
+            data = file.read(length)
+        if len(data) != length:
+            raise ValueError(f"{self.path} is truncated")
+        costs.frombytes(data)
+        if sys.byteorder == 'big':
+            costs.byteswap()
+        return costs
+
+    @classmethod
+    def pack(cls, data: bytes) -> bytes:
+        """
+        Pack state codes into two bits per cell.
+
+        Args:
+            data (bytes): The state codes of the cells, translated by saved.
+
+        Returns:
+            bytes: four cells per byte, the first in the lowest bits.
+        """
+        # The codes were translated by saved before, so only the four packed codes remain
+        codes = data.translate(cls.toPacked) + bytes(-len(data) % 4)
+        quarters = zip(codes[0::4], codes[1::4], codes[2::4], codes[3::4])
+        return bytes(a | b << 2 | c << 4 | d << 6 for a, b, c, d in quarters)
+
+    @classmethod
+    def unpack(cls, data: bytes, size: int) -> bytes:
+        """
+        Unpack two-bit cells into state codes.
+
+        Args:
+            data (bytes): The packed cells.
+            size (int): The number of cells.
+
+        Returns:
+            bytes: the state codes of the cells.
+        """
+        codes = cls.packedCodes
+        # The four state codes held by every possible byte
+        table = [bytes(codes[value >> shift & 3] for shift in (0, 2, 4, 6)) for value in range(256)]
+        return b''.join(map(table.__getitem__, data))[:size]
+
+    @staticmethod
+    def encodeRuns(data: bytes) -> bytes:
+        """
+        Run-length encode state codes.
+
+        Args:
+            data (bytes): The state codes of the cells.
+
+        Returns:
+            bytes: (count, state code) pairs, with counts of at most 255.
+        """
+        encoded = bytearray()
+        for run in re.finditer(rb'(.)\1{0,254}', data, re.DOTALL):
+            encoded.append(run.end() - run.start())
+            encoded.append(data[run.start()])
+        return bytes(encoded)
+
+    @staticmethod
+    def decodeRuns(data: bytes) -> bytes:
+        """
+        Decode run-length encoded state codes.
+
+        Args:
+            data (bytes): (count, state code) pairs.
+
+        Returns:
+            bytes: the state codes of the cells.
+        """
+        return b''.join(bytes((code,)) * count for count, code in zip(data[0::2], data[1::2]))
@@ -0,0 +1,618 @@
+"""
+Module under which the GridModel class is defined.
+
+"""
+
+import itertools
+import math
+from array import array
+
+# Integer codes of the cell states, as stored in GridModel.states
+EMPTY = 0
+OBSTACLE = 1
+CHECKED = 2
+START = 3
+END = 4
+PATH = 5
+ABSTRACT = 6
+
+# Source of the version numbers of grid models, unique across all models
+_versions = itertools.count(1)
+
+class GridModel:
+    """
+    Class for defining the state of the grid independently of any widgets.
+
+    This class holds the state of every cell of the grid as one byte in a flat
+    bytearray, indexed by row * cols + col. It is the single source of truth for
+    the grid: the grid widget, its event handler and the search engines all read
+    from it, while Cell objects are only views onto it. The states are:
+        - empty, obstacle, checked, start, end, path, abstract.
+
+    Attributes:
+        rows (int): The number of rows in the grid.
+        cols (int): The number of columns in the grid.
+        states (bytearray): The integer code of the state of every cell, a memory-mapped file
+            or a memoryview (see searchableStates).
+        version (int): The version of the obstacles of the grid (see touch).
+        listeners (list): The callables notified of changes of the obstacles (see addListener).
+        costs (array): The movement cost of every cell, None when every move costs 1 (see setCost).
+        connectivity (int): The number of cells a cell can move to, 4 or 8 (see setConnectivity).
+        cornerCutting (str): Which diagonal moves around obstacles are allowed, 'never' or 'one'.
+        diagonalCost (float): The cost of a diagonal move relative to a straight one.
+    """
+
+    # Dictionary mapping name of state to its integer code
+    stateCodes = {
+        'empty': EMPTY,
+        'obstacle': OBSTACLE,
+        'checked': CHECKED,
+        'start': START,
+        'end': END,
+        'path': PATH,
+        'abstract': ABSTRACT
+    }
+
+    # List mapping integer code of state to its name
+    stateNames = ['empty', 'obstacle', 'checked', 'start', 'end', 'path', 'abstract']
+
+    # Dictionary mapping connectivity to the (row, col) offsets of the moves, the straight ones first
+    moveOffsets = {
+        4: ((-1, 0), (1, 0), (0, -1), (0, 1)),
+        8: ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+    }
+
+    # Corner-cutting policies: diagonal moves need both cells beside them free, or at least one
+    cornerCuttingPolicies = ('never', 'one')
+
+    # Translation table of the states into the passability array, 1 for every state but obstacles
+    passableTable = bytes(int(code != OBSTACLE) for code in range(256))
+
+    # Touches changing at most one cell in this many update the move masks instead of dropping them
+    maskUpdateRatio = 64
+
+    def __init__(self, rows, cols, states=None) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.states = states if states is not None else bytearray(rows * cols)
+        self.version = next(_versions)
+        self.listeners = []
+        self.costs = None
+        # Lowest movement cost, computed on demand and dropped when a cost changes
+        self._minCost = None
+        self.connectivity = 4
+        self.cornerCutting = 'never'
+        self.diagonalCost = math.sqrt(2)
+        # Padded passability array and move masks, built on demand and kept up to date by touch()
+        self._padded = None
+        self._masks = None
+        # Dictionary mapping (connectivity, with lengths) to the offset tables of the move masks
+        self._tables = {}
+
+    @classmethod
+    def fromStates(cls, states) -> 'GridModel':
+        """
+        Create a grid model from a 2D list of cell states.
+
+        Args:
+            states (list): The 2D list of cell state names.
+
+        Returns:
+            GridModel: the new grid model.
+        """
+        model = cls(len(states), len(states[0]) if states else 0)
+        codes = cls.stateCodes
+        model.states = bytearray(codes[state] for row in states for state in row)
+        return model
+
+    @classmethod
+    def load(cls, path: str, useMmap: bool = True) -> 'GridModel':
+        """
+        Load a grid model from a grid file, with the movement costs it holds.
+
+        The states of a grid loaded from a raw file are a copy-on-write memory
+        map of the file rather than a bytearray (see searchableStates).
+
+        Args:
+            path (str): The path of the grid file.
+            useMmap (bool): Whether to memory-map raw files instead of reading them.
+
+        Returns:
+            GridModel: the loaded grid model.
+        """
+        from src.grid.GridFile import GridFile
+        file = GridFile(path)
+        model = cls(*file.read(useMmap))
+        model.costs = file.readCosts()
+        return model
+
+    def save(self, path: str, encoding: str = 'raw') -> None:
+        """
+        Save the grid model to a grid file, with its movement costs. Checked and
+        path cells are saved as empty cells.
+
+        Args:
+            path (str): The path of the grid file.
+            encoding (str): 'raw' (memory-mappable), 'packed' (2 bits per cell) or 'rle'.
+        """
+        from src.grid.GridFile import GridFile
+        GridFile(path).write(self.rows, self.cols, self.states, encoding, self.costs)
+
+    def copy(self) -> 'GridModel':
+        """
+        Create a copy of the grid model.
+
+        Returns:
+            GridModel: a grid model with a copy of the cell states and movement costs.
+        """
+        model = GridModel(self.rows, self.cols)
+        model.states[:] = self.states
+        model.version = self.version
+        if self.costs is not None:
+            model.costs = array('d', self.costs)
+            model._minCost = self._minCost
+        model.connectivity = self.connectivity
+        model.cornerCutting = self.cornerCutting
+        model.diagonalCost = self.diagonalCost
+        if self._masks is not None:
+            model._padded = bytearray(self._padded)
+            model._masks = bytearray(self._masks)
+        model._tables = self._tables
+        return model
+
+    def setConnectivity(self, connectivity: int, cornerCutting: str = 'never', diagonalCost: float = math.sqrt(2)) -> None:
+        """
+        Sets the moves allowed on the grid, and gives it a new version if they
+        changed, since the data cached by version depends on them.
+
+        Moves go to the 4 cells sharing a side with a cell by default. On 8-connected
+        grids, they also go to the 4 diagonal cells, at the cost of diagonalCost times
+        the cost of the cell entered (sqrt(2) for octile distances, 1 for Chebyshev
+        ones). Diagonal moves never squeeze between two obstacles: the corner-cutting
+        policy 'never' also forbids them when one of the two cells beside the move is
+        an obstacle, as in the Moving AI benchmarks, while 'one' allows them as long
+        as one of the two is free. Either way, two cells connected on an 8-connected
+        grid are connected on a 4-connected one too.
+
+        Args:
+            connectivity (int): 4 for straight moves only, 8 for diagonal moves too.
+            cornerCutting (str): 'never' or 'one'.
+            diagonalCost (float): The cost of a diagonal move, between 1 and 2.
+
+        Raises:
+            ValueError: if one of the settings is not supported.
+        """
+        if connectivity not in self.moveOffsets:
+            raise ValueError(f"Grids are 4- or 8-connected, not {connectivity}-connected")
+        if cornerCutting not in self.cornerCuttingPolicies:
+            raise ValueError(f"Unknown corner-cutting policy {cornerCutting!r}")
+        if not 1 <= diagonalCost <= 2:
+            raise ValueError(f"Diagonal moves must cost between 1 and 2, not {diagonalCost}")
+        # Integral costs keep the priorities of uniform grids integers, for bucket queues
+        if float(diagonalCost).is_integer():
+            diagonalCost = int(diagonalCost)
+        settings = (connectivity, cornerCutting, diagonalCost)
+        if settings != (self.connectivity, self.cornerCutting, self.diagonalCost):
+            self.connectivity, self.cornerCutting, self.diagonalCost = settings
+            self._tables = {}
+            self.touch()
+
+    def touch(self, indices=()) -> None:
+        """
+        Give the grid a new version, after its obstacles changed, and notify the listeners.
+
+        Versions are unique across all grids and kept by copies, so that data
+        derived from the obstacles (e.g. jump tables) can be cached by version.
+        Code which writes obstacles directly into the states array must call
+        touch afterwards, with the changed cells.
+
+        Args:
+            indices: flat indices of the cells which became or stopped being obstacles.
+        """
+        self.version = next(_versions)
+        if self._masks is not None:
+            if indices and len(indices) * self.maskUpdateRatio <= len(self._masks):
+                self.updateMasks(indices)
+            else:
+                self._padded = self._masks = None
+        for listener in self.listeners:
+            listener(indices)
+
+    def addListener(self, listener) -> None:
+        """
+        Register a callable to be notified of changes of the obstacles, e.g. an
+        incremental planner.
+
+        Args:
+            listener (Callable): Called with the flat indices of the changed cells.
+        """
+        self.listeners.append(listener)
+
+    def removeListener(self, listener) -> None:
+        """
+        Unregister a callable registered with addListener.
+
+        Args:
+            listener (Callable): The callable to unregister.
+        """
+        self.listeners.remove(listener)
+
+    def index(self, row, col) -> int:
+        """
+        Returns the flat index of a cell.
+
+        Args:
+            row: row of cell.
+            col: col of cell.
+
+        Returns:
+            int: the index of the cell in the states array.
+        """
+        return row * self.cols + col
+
+    def cell(self, index) -> tuple:
+        """
+        Returns the coordinates of a cell from its flat index.
+
+        Args:
+            index (int): the index of the cell in the states array.
+
+        Returns:
+            tuple: the row and column of the cell.
+        """
+        return divmod(index, self.cols)
+
+    def getState(self, row, col) -> str:
+        """
+        Returns the state of a cell.
+
+        Args:
+            row: row of cell.
+            col: col of cell.
+
+        Returns:
+            str: state of cell.
+        """
+        return self.stateNames[self.states[row * self.cols + col]]
+
+    def setState(self, row, col, state) -> None:
+        """
+        Sets the state of a cell.
+
+        Args:
+            row: row of cell.
+            col: col of cell.
+            state (str): state of cell.
+        """
+        index = row * self.cols + col
+        code = self.stateCodes[state]
+        changed = (self.states[index] == OBSTACLE) != (code == OBSTACLE)
+        self.states[index] = code
+        if changed:
+            self.touch([index])
+
+    def getCost(self, row, col) -> float:
+        """
+        Returns the movement cost of a cell.
+
+        Args:
+            row: row of cell.
+            col: col of cell.
+
+        Returns:
+            float: the cost of moving into the cell.
+        """
+        if self.costs is None:
+            return 1
+        return self.costs[row * self.cols + col]
+
+    def setCost(self, row, col, cost) -> None:
+        """
+        Sets the movement cost of a cell.
+
+        The costs array is only allocated once a cost other than 1 is set, so
+        uniform grids cost nothing extra. Engines which take costs into account
+        read it directly; the others treat every move as costing 1. Costs do not
+        change the version, since they do not change which cells are obstacles.
+
+        Args:
+            row: row of cell.
+            col: col of cell.
+            cost (float): the cost of moving into the cell.
+
+        Raises:
+            ValueError: if the cost is not positive.
+        """
+        if not cost > 0:
+            raise ValueError(f"Movement costs must be positive, not {cost}")
+        if self.costs is None:
+            if cost == 1:
+                return
+            self.costs = array('d', [1.0]) * (self.rows * self.cols)
+        self.costs[row * self.cols + col] = cost
+        self._minCost = None
+
+    def clearCosts(self) -> None:
+        """
+        Give every cell the movement cost 1 again, releasing the costs array.
+        """
+        self.costs = None
+        self._minCost = None
+
+    def minCost(self) -> float:
+        """
+        Returns the lowest movement cost of the grid, e.g. to scale heuristics
+        which count steps so that they stay admissible.
+
+        Returns:
+            float: the lowest cost of any cell, 1 for grids without costs.
+        """
+        if self.costs is None:
+            return 1
+        if self._minCost is None:
+            self._minCost = min(self.costs) if len(self.costs) else 1
+        return self._minCost
+
+    def pathCost(self, path) -> float:
+        """
+        Returns the cost of a path, the sum of the costs of its cells but the first one,
+        diagonal moves costing diagonalCost times the cost of the cell entered.
+
+        Args:
+            path: flat indices of the cells of the path, from start to end.
+
+        Returns:
+            float: the cost of the path, its number of moves for 4-connected grids without costs.
+        """
+        if self.costs is None and self.connectivity == 4:
+            return len(path) - 1
+        costs = self.costs
+        cols = self.cols
+        cost = 0
+        for previous, index in zip(path, path[1:]):
+            step = 1 if costs is None else costs[index]
+            # A diagonal move changes both the row and the column
+            if index // cols != previous // cols and index % cols != previous % cols:
+                step *= self.diagonalCost
+            cost += step
+        return cost
+
+    def isPassable(self, row, col) -> bool:
+        """
+        Check whether a cell lies inside the grid and can be traversed.
+
+        Args:
+            row: row of cell.
+            col: col of cell.
+
+        Returns:
+            bool: True if the cell is inside the grid and is not an obstacle.
+        """
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.states[row * self.cols + col] != OBSTACLE
+
+    def neighbors(self, index: int, connectivity: int = None) -> list:
+        """
+        Returns the cells a cell can move to, following the connectivity and
+        corner-cutting policy of the grid.
+
+        Args:
+            index (int): the index of the cell in the states array.
+            connectivity (int): Optional connectivity to follow instead of the one of the grid.
+
+        Returns:
+            list: the indices of the free neighbors, the straight ones first.
+        """
+        cols = self.cols
+        row, col = divmod(index, cols)
+        isPassable = self.isPassable
+        never = self.cornerCutting == 'never'
+        neighbors = []
+        for d_row, d_col in self.moveOffsets[connectivity or self.connectivity]:
+            if not isPassable(row + d_row, col + d_col):
+                continue
+            if d_row and d_col:
+                vertical, horizontal = isPassable(row + d_row, col), isPassable(row, col + d_col)
+                if not ((vertical and horizontal) if never else (vertical or horizontal)):
+                    continue
+            neighbors.append(index + d_row * cols + d_col)
+        return neighbors
+
+    def paddedPassability(self) -> bytearray:
+        """
+        Returns the passability of the cells, surrounded by a ring of obstacles.
+
+        Cell (row, col) is at index (row + 1) * (cols + 2) + col + 1, and holds 1
+        if the cell can be traversed and 0 otherwise, so that the cells around
+        any cell of the grid can be read without testing the borders.
+
+        Returns:
+            bytearray: the (rows + 2) * (cols + 2) bytes of the padded grid.
+        """
+        if self._padded is None:
+            self.buildMasks()
+        return self._padded
+
+    def neighborMasks(self) -> bytearray:
+        """
+        Returns the move mask of every cell, bit k being set when the move of
+        moveOffsets[8][k] is allowed, following the connectivity and corner-cutting
+        policy of the grid. Obstacles have no moves.
+
+        Returns:
+            bytearray: the mask of every cell, by flat index.
+        """
+        if self._masks is None:
+            self.buildMasks()
+        return self._masks
+
+    def neighborOffsets(self, connectivity: int = None, lengths: bool = False) -> list:
+        """
+        Returns the moves allowed by every move mask, as flat index offsets.
+
+        The masks of 8-connected grids also hold diagonal moves, which the tables
+        of connectivity 4 leave out, so 4-connected engines can use them as well.
+
+        Args:
+            connectivity (int): Optional connectivity to follow instead of the one of the grid.
+            lengths (bool): Whether the moves are (offset, length) pairs, the length of
+                diagonal moves being diagonalCost, instead of offsets.
+
+        Returns:
+            list: the 256 tuples of moves, the straight ones first, indexed by mask.
+        """
+        connectivity = connectivity or self.connectivity
+        key = (connectivity, lengths)
+        table = self._tables.get(key)
+        if table is None:
+            moves = []
+            for d_row, d_col in self.moveOffsets[connectivity]:
+                offset = d_row * self.cols + d_col
+                moves.append((offset, self.diagonalCost if d_row and d_col else 1) if lengths else offset)
+            table = [tuple(move for bit, move in enumerate(moves) if mask >> bit & 1) for mask in range(256)]
+            self._tables[key] = table
+        return table
+
+    def buildMasks(self) -> None:
+        """
+        Build the padded passability array and the move masks of the whole grid.
+
+        With a ring of obstacles around the grid, and a mask of the allowed moves
+        of every cell (see neighborMasks and neighborOffsets), the engines never
+        test the borders of the grid when looking for neighbors. Both arrays are
+        built on first use, and kept up to date by touch() when only a few cells
+        change.
+
+        The padded array is read as one little-endian integer, one byte per cell,
+        so shifting it by whole bytes lines every cell up with one of its
+        neighbors; the masks are then combined with a few bitwise operations
+        on these integers, without any loop over the cells.
+        """
+        rows, cols = self.rows, self.cols
+        width = cols + 2
+        free = bytes(self.states).translate(self.passableTable)
+        if rows and cols:
+            padded = bytes(width + 1) + bytes(2).join(
+                free[row * cols:(row + 1) * cols] for row in range(rows)) + bytes(width + 1)
+        else:
+            padded = bytes((rows + 2) * width)
+
+        cells = int.from_bytes(padded, 'little')
+        up, down = cells << 8 * width, cells >> 8 * width
+        left, right = cells << 8, cells >> 8
+        masks = up | down << 1 | left << 2 | right << 3
+        if self.connectivity == 8:
+            never = self.cornerCutting == 'never'
+            for bit, (diagonal, vertical, horizontal) in enumerate((
+                    (cells << 8 * (width + 1), up, left), (cells << 8 * (width - 1), up, right),
+                    (cells >> 8 * (width - 1), down, left), (cells >> 8 * (width + 1), down, right)), 4):
+                corner = (vertical & horizontal) if never else (vertical | horizontal)
+                masks |= (diagonal & corner) << bit
+        # Only the cells of the grid which are not obstacles keep their moves
+        masks &= cells * 0xFF
+        masks = masks.to_bytes(len(padded), 'little')
+
+        self._padded = bytearray(padded)
+        self._masks = bytearray(b''.join(masks[(row + 1) * width + 1:(row + 1) * width + 1 + cols]
+                                         for row in range(rows)))
+
+    def updateMasks(self, indices) -> None:
+        """
+        Update the padded passability array and the move masks around a few changed cells.
+
+        A cell changes the moves of the cells around it, the diagonal ones included
+        since the cells beside a diagonal move decide whether it is allowed.
+
+        Args:
+            indices: flat indices of the cells which became or stopped being obstacles.
+        """
+        rows, cols = self.rows, self.cols
+        width = cols + 2
+        padded, masks = self._padded, self._masks
+        affected = set()
+        for index in indices:
+            row, col = divmod(index, cols)
+            padded[(row + 1) * width + col + 1] = self.states[index] != OBSTACLE
+            for d_row in (-1, 0, 1):
+                for d_col in (-1, 0, 1):
+                    if 0 <= row + d_row < rows and 0 <= col + d_col < cols:
+                        affected.add(index + d_row * cols + d_col)
+
+        never = self.cornerCutting == 'never'
+        offsets = self.moveOffsets[self.connectivity]
+        for index in affected:
+            row, col = divmod(index, cols)
+            center = (row + 1) * width + col + 1
+            mask = 0
+            if padded[center]:
+                for bit, (d_row, d_col) in enumerate(offsets):
+                    if not padded[center + d_row * width + d_col]:
+                        continue
+                    if d_row and d_col:
+                        vertical, horizontal = padded[center + d_row * width], padded[center + d_col]
+                        if not ((vertical and horizontal) if never else (vertical or horizontal)):
+                            continue
+                    mask |= 1 << bit
+            masks[index] = mask
+
+    def searchableStates(self):
+        """
+        Returns the states in a buffer with find(), i.e. the states themselves,
+        or a copy of them if they are a memoryview, which has no find().
+
+        The states of a grid loaded from a raw file are a memory map (see load),
+        and those of the grid of a search worker a memoryview of shared memory,
+        so code reading the states must only rely on indexing and bytes(), and
+        search them through this method.
+
+        Returns:
+            bytes: the states, or a buffer with the same bytes.
+        """
+        states = self.states
+        return bytes(states) if isinstance(states, memoryview) else states
+
+    def findStartEnd(self) -> tuple:
+        """
+        Find the start and end cells in the grid.
+
+        Returns:
+            tuple: The row and column indices of the start and end cells.
+        """
+        states = self.searchableStates()
+        start = states.find(bytes((START,)))
+        end = states.find(bytes((END,)))
+        return (self.cell(start) if start >= 0 else None,
+                self.cell(end) if end >= 0 else None)
+
+    def replaceStates(self, oldStates, newState) -> list:
+        """
+        Replace every cell in one of the given states by a new state.
+
+        Args:
+            oldStates (tuple): names of the states to replace.
+            newState (str): name of the new state.
+
+        Returns:
+            list: the flat indices of the cells which were changed.
+        """
+        new = self.stateCodes[newState]
+        states = self.states
+        # Cells of the old states only become the new state, so a copy stays valid for the search
+        searched = self.searchableStates()
+        changed = []
+        # Cells which became or stopped being obstacles
+        toggled = []
+        for state in oldStates:
+            # bytearray.find scans in C, so only the matching cells cost Python time
+            code = self.stateCodes[state]
+            first = len(changed)
+            pattern = bytes((code,))
+            index = searched.find(pattern)
+            while index >= 0:
+                states[index] = new
+                changed.append(index)
+                index = searched.find(pattern, index + 1)
+            if (code == OBSTACLE) != (new == OBSTACLE):
+                toggled.extend(changed[first:])
+        if toggled:
+            self.touch(toggled)
+        return changed
@@ -4,10 +4,14 @@ Module under which the GridWidget class is defined.
 """
 
 from PyQt5.QtWidgets import QGraphicsScene, QGraphicsView
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 from PyQt5.QtGui import QPainter
 
 from src.grid.Cell import Cell
+from src.grid.RasterGridItem import RasterGridItem
+from src.grid.GridModel import GridModel, OBSTACLE, START, END
+from src.grid.CellUpdateBuffer import CellUpdateBuffer
+from src.engine.ComponentIndex import ComponentIndex
 
 from src.eventHandlers.GridEventHandler import GridEventHandler
 
@@ -16,18 +20,47 @@ class GridWidget(QGraphicsView):
     Class for defining a grid widget.
     
     This class represents a grid widget, which is a QGraphicsView object that contains a grid of cell objects.
+    The states of the cells are stored in a GridModel, onto which the cell objects are views.
+    Updates coming from the search algorithms are collected in a CellUpdateBuffer and
+    applied in one batch per frame. A ComponentIndex follows the obstacles of the
+    model, so that solvers can reject unreachable end cells before searching.
+    An existing model, e.g. one loaded from a grid file, can be passed in instead
+    of starting from an empty grid.
+
+    The grid can be drawn by one of two renderers:
+        - items: one Cell item per cell, used for small grids;
+        - raster: a single RasterGridItem drawing the whole grid as one image, used for large grids.
 
     Args:
         QGraphicsView: The QGraphicsView class provides a widget for displaying the contents of a QGraphicsScene.
     """
-    def __init__(self, rows, cols, cell_size) -> None:
+    # Interval between two redraws of buffered cell updates, in milliseconds
+    frameInterval = 16
+
+    # Maximum number of buffered cell updates applied per frame
+    maxUpdatesPerFrame = 20000
+
+    # Largest number of cells drawn with one Cell item per cell when no renderer is given
+    maxItemCells = 40000
+
+    def __init__(self, rows, cols, cell_size, renderer=None, model=None) -> None:
         self.scene = QGraphicsScene()
         super().__init__(self.scene)
         
         self.rows = rows
         self.cols = cols
         self.cell_size = cell_size
+        self.model = model if model is not None else GridModel(rows, cols)
+        self.components = ComponentIndex(self.model)
+        self.model.addListener(self.components.update)
+        # The solvers of the grid play one search at a time, so they share one SearchState,
+        # allocated by the first search which needs it (see BaseSearch.sharedState)
+        self.searchState = None
+        if renderer is None:
+            renderer = 'items' if rows * cols <= self.maxItemCells else 'raster'
+        self.renderer = renderer
         self.cells = []
+        self.rasterItem = None
         self.initGrid()
 
         self.setRenderHint(QPainter.Antialiasing)
@@ -35,19 +68,32 @@ class GridWidget(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         
         self.eventHandler = GridEventHandler(self)
+
+        self.updateBuffer = CellUpdateBuffer()
+        self.frameTimer = QTimer(self)
+        self.frameTimer.setInterval(self.frameInterval)
+        self.frameTimer.timeout.connect(self.flushCellStates)
+        self.frameTimer.start()
         
-        self.hasStartNode = False
-        self.hasEndNode = False
+        start, end = self.model.findStartEnd()
+        self.hasStartNode = start is not None
+        self.hasEndNode = end is not None
     
 
     def initGrid(self) -> None:
         """
-        Initializes the grid of cell objects.
+        Initializes the grid of cell objects, or the single raster item
+        when the raster renderer is used.
         """
+        if self.renderer == 'raster':
+            self.rasterItem = RasterGridItem(self.model, self.cell_size)
+            self.scene.addItem(self.rasterItem)
+            return
+
         for row in range(self.rows):
             cell_row = []
             for col in range(self.cols):
-                cell = Cell(col, row, self.cell_size)
+                cell = Cell(self.model, row, col, self.cell_size)
                 self.scene.addItem(cell)
                 cell_row.append(cell)
             self.cells.append(cell_row)
@@ -63,7 +109,92 @@ class GridWidget(QGraphicsView):
             state: state of cell.
         """
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.cells[row][col].setState(state)
+            self.model.setState(row, col, state)
+            self.refreshCells([self.model.index(row, col)])
+
+    def setCellCost(self, row, col, cost) -> None:
+        """
+        Sets the movement cost of a cell in the grid.
+
+        Args:
+            row: row of cell.
+            col: col of cell.
+            cost (float): the cost of moving into the cell.
+        """
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            self.model.setCost(row, col, cost)
+            self.refreshCells([self.model.index(row, col)])
+
+    def cellAt(self, scenePos) -> tuple:
+        """
+        Returns the cell at a position of the scene.
+
+        Args:
+            scenePos (QPointF): position in scene coordinates.
+
+        Returns:
+            tuple: the row and column of the cell, or None if the position is outside the grid.
+        """
+        row = int(scenePos.y() // self.cell_size)
+        col = int(scenePos.x() // self.cell_size)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    @pyqtSlot(object, object)
+    def queueCellStates(self, indices, codes) -> None:
+        """
+        Queues a batch of cell updates, to be drawn on the next frame.
+
+        Can be called from any thread. Later updates of a cell replace the
+        earlier ones which have not been drawn yet.
+
+        Args:
+            indices: flat indices of the cells.
+            codes: new state code of every cell.
+        """
+        self.updateBuffer.push(indices, codes)
+
+    @pyqtSlot()
+    def flushCellStates(self) -> None:
+        """
+        Applies the buffered cell updates, at most maxUpdatesPerFrame per frame.
+        """
+        if self.updateBuffer.pending():
+            self.applyCellStates(*self.updateBuffer.drain(self.maxUpdatesPerFrame))
+
+    def applyCellStates(self, indices, codes) -> None:
+        """
+        Writes a batch of cell states into the model and redraws the cells.
+
+        The search ran on a snapshot of the grid, and the grid can be edited
+        while its result is played back, so the obstacles, start and end nodes
+        painted since are left as they are. Only the checked and path states
+        are written, which are not seen by the listeners of the model.
+
+        Args:
+            indices: flat indices of the cells.
+            codes: new state code of every cell.
+        """
+        states = self.model.states
+        for index, code in zip(indices, codes):
+            if states[index] not in (OBSTACLE, START, END):
+                states[index] = code
+        self.refreshCells(indices)
+
+    def refreshCells(self, indices) -> None:
+        """
+        Redraws the cells whose state was changed directly in the model.
+
+        Args:
+            indices: flat indices of the changed cells.
+        """
+        if self.rasterItem is not None:
+            self.rasterItem.updateCells(indices)
+            return
+        for index in indices:
+            row, col = self.model.cell(index)
+            self.cells[row][col].updateColor()
             
     def getStartNodeState(self) -> bool:
         """
@@ -96,47 +227,49 @@ class GridWidget(QGraphicsView):
     def resetGrid(self, option) -> None:
         """
         Resets the grid by calling a helper function based on the specified option.
+        Pending cell updates are dropped first.
 
         Args:
             option (str): option for resetting the grid.
         """
+        self.updateBuffer.clear()
         if option == 'all':
             self.resetAll()
         elif option == 'checked_path':
             self.resetCheckedPath()
         elif option == 'obstacle':
             self.resetObstacles()
+        elif option == 'terrain':
+            self.resetTerrain()
                     
     def resetAll(self) -> None:
         """
-        Resets all cells in the grid.
+        Resets all cells in the grid, and their movement costs.
         """
-        for row in range(self.rows):
-            for col in range(self.cols):
-                cell = self.cells[row][col]
-                cell.setState('empty')
-                self.hasStartNode = False
-                self.hasEndNode = False
+        self.refreshCells(self.model.replaceStates(('obstacle', 'checked', 'start', 'end', 'path', 'abstract'), 'empty'))
+        self.resetTerrain()
+        self.hasStartNode = False
+        self.hasEndNode = False
                 
     def resetCheckedPath(self) -> None:
         """
         Resets all checked and path cells in the grid.
         """
-        for row in range(self.rows):
-            for col in range(self.cols):
-                cell = self.cells[row][col]
-                if cell.getState() in ('checked', 'path'):
-                    cell.setState('empty')
+        self.refreshCells(self.model.replaceStates(('checked', 'path', 'abstract'), 'empty'))
                     
     def resetObstacles(self) -> None:
         """
         Resets all obstacle cells in the grid.
         """
-        for row in range(self.rows):
-            for col in range(self.cols):
-                cell = self.cells[row][col]
-                if cell.getState() == 'obstacle':
-                    cell.setState('empty')
+        self.refreshCells(self.model.replaceStates(('obstacle',), 'empty'))
+
+    def resetTerrain(self) -> None:
+        """
+        Resets the movement costs of all cells in the grid to 1.
+        """
+        if self.model.costs is not None:
+            self.model.clearCosts()
+            self.refreshCells(range(self.rows * self.cols))
     
     def mousePressEvent(self, event) -> None:
         """
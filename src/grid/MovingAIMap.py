@@ -0,0 +1,72 @@
+"""
+This module contains the MovingAIMap class, which imports maps of the Moving AI grid benchmarks.
+"""
+
+from src.grid.GridModel import GridModel, EMPTY, OBSTACLE
+
+# Characters of the passable terrain
+PASSABLE = b'.GS'
+
+class MovingAIMap:
+    """
+    Reader of the .map files of the Moving AI grid benchmarks.
+
+    A map file has a short header followed by one line of characters per row:
+        type octile
+        height <rows>
+        width <cols>
+        map
+        <rows lines of cols characters>
+
+    Passable terrain ('.', 'G' and swamp 'S') becomes empty cells, and every
+    other character (out of bounds '@' and 'O', trees 'T', water 'W') becomes
+    an obstacle.
+
+    Attributes:
+        path (str): The path of the file.
+    """
+
+    # Translation table from map characters to state codes
+    codes = bytes(EMPTY if character in PASSABLE else OBSTACLE for character in range(256))
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def read(self) -> GridModel:
+        """
+        Read the map into a grid model.
+
+        Returns:
+            GridModel: the grid model of the map, without start and end cells.
+
+        Raises:
+            ValueError: if the file is not a valid map file.
+        """
+        header = {}
+        with open(self.path, 'rb') as file:
+            for line in file:
+                fields = line.split()
+                if not fields:
+                    continue
+                if fields[0] == b'map':
+                    break
+                if len(fields) != 2:
+                    raise ValueError(f"{self.path} has an invalid header line: {line!r}")
+                header[fields[0].decode('ascii', 'replace')] = fields[1]
+            else:
+                raise ValueError(f"{self.path} is not a map file")
+
+            try:
+                rows, cols = int(header['height']), int(header['width'])
+            except (KeyError, ValueError):
+                raise ValueError(f"{self.path} has no valid height and width") from None
+            if header.get('type', b'octile') != b'octile':
+                raise ValueError(f"{self.path} has an unsupported map type")
+
+            states = bytearray()
+            for row in range(rows):
+                line = file.readline().rstrip(b'\r\n')
+                if len(line) != cols:
+                    raise ValueError(f"Row {row} of {self.path} has {len(line)} cells instead of {cols}")
+                states += line.translate(self.codes)
+        return GridModel(rows, cols, states)
@@ -0,0 +1,148 @@
+"""
+Module under which the RasterGridItem class is defined.
+"""
+
+from PyQt5.QtWidgets import QGraphicsItem
+from PyQt5.QtCore import QRectF, QLineF
+from PyQt5.QtGui import QImage, QPen, QPainter
+
+from src.grid.Cell import Cell
+from src.grid.GridModel import GridModel, EMPTY
+
+class RasterGridItem(QGraphicsItem):
+    """
+    Class for drawing a whole grid as a single image.
+
+    This class is an alternative to one Cell item per cell for large grids. The
+    states array of the GridModel is copied into an 8-bit indexed QImage, one
+    pixel per cell, whose color table maps every state code to the color of that
+    state. The image is scaled to the cell size when painted, and updated cells
+    only repaint the rectangle around them. Scene setup takes constant time and
+    memory is one byte per cell instead of one Python object per cell.
+
+    Empty cells with a movement cost above 1 use the pixel values following the
+    state codes instead, one per shade of terrain (see Cell.terrainShade).
+
+    Attributes:
+        model (GridModel): The grid model to draw.
+        cell_size (int): The size of a cell in scene coordinates.
+        image (QImage): The image holding one pixel per cell.
+
+    Args:
+        QGraphicsItem: The QGraphicsItem class is the base class for all graphical items in a QGraphicsScene.
+    """
+
+    # Smallest size of a cell on screen, in pixels, for which cell borders are drawn
+    minBorderSize = 6
+
+    # Pixel value of the first shade of terrain minus 1, the shades follow the state codes
+    terrainBase = len(GridModel.stateNames) - 1
+
+    def __init__(self, model: GridModel, cell_size: int) -> None:
+        super().__init__()
+        self.model = model
+        self.cell_size = cell_size
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        self.colorTable = [Cell.stateColorMap[name].rgb() for name in GridModel.stateNames]
+        self.colorTable += [Cell.shadeColor(shade).rgb() for shade in range(1, Cell.terrainShades + 1)]
+        self.borderPen = QPen(Cell.borderColor)
+        self.borderPen.setCosmetic(True)
+        self.refreshAll()
+
+    def boundingRect(self) -> QRectF:
+        """
+        Returns the rectangle covered by the grid, in scene coordinates.
+        """
+        return QRectF(0, 0, self.model.cols * self.cell_size, self.model.rows * self.cell_size)
+
+    def refreshAll(self) -> None:
+        """
+        Rebuilds the image from the states and movement costs of the model.
+        """
+        rows, cols = self.model.rows, self.model.cols
+        pixels = bytes(self.model.states)
+        if self.model.costs is not None:
+            pixels = bytearray(pixels)
+            shade, base = Cell.terrainShade, self.terrainBase
+            for index, cost in enumerate(self.model.costs):
+                if cost > 1 and pixels[index] == EMPTY:
+                    pixels[index] = base + shade(cost)
+            pixels = bytes(pixels)
+        image = QImage(pixels, cols, rows, cols, QImage.Format_Indexed8)
+        image.setColorTable(self.colorTable)
+        # Copy the image, so that it does not point to the temporary bytes object
+        self.image = image.copy()
+        self.update()
+
+    def updateCells(self, indices) -> None:
+        """
+        Copies the states of some cells into the image and repaints them.
+
+        Only the bounding rectangle of the updated cells is repainted. When a
+        large part of the grid changed, the whole image is rebuilt instead.
+
+        Args:
+            indices: flat indices of the updated cells.
+        """
+        if not len(indices):
+            return
+        if len(indices) > len(self.model.states) // 8:
+            self.refreshAll()
+            return
+        states = self.model.states
+        costs = self.model.costs
+        shade, base = Cell.terrainShade, self.terrainBase
+        cols = self.model.cols
+        setPixel = self.image.setPixel
+        min_row = min_col = None
+        max_row = max_col = 0
+        for index in indices:
+            row, col = divmod(index, cols)
+            pixel = states[index]
+            if costs is not None and pixel == EMPTY and costs[index] > 1:
+                pixel = base + shade(costs[index])
+            setPixel(col, row, pixel)
+            if min_row is None:
+                min_row = max_row = row
+                min_col = max_col = col
+            else:
+                min_row = min(min_row, row)
+                max_row = max(max_row, row)
+                min_col = min(min_col, col)
+                max_col = max(max_col, col)
+        size = self.cell_size
+        self.update(QRectF(min_col * size, min_row * size,
+                           (max_col - min_col + 1) * size, (max_row - min_row + 1) * size))
+
+    def paint(self, painter, option, widget=None) -> None:
+        """
+        Paints the exposed part of the grid.
+
+        Args:
+            painter (QPainter): The painter to paint with.
+            option (QStyleOptionGraphicsItem): The style options, holding the exposed rectangle.
+            widget (QWidget): The widget being painted on.
+        """
+        size = self.cell_size
+        exposed = option.exposedRect.intersected(self.boundingRect())
+        if exposed.isEmpty():
+            return
+
+        # Source rectangle of the image, in cells
+        left = int(exposed.left() // size)
+        top = int(exposed.top() // size)
+        right = min(int(exposed.right() // size) + 1, self.model.cols)
+        bottom = min(int(exposed.bottom() // size) + 1, self.model.rows)
+        source = QRectF(left, top, right - left, bottom - top)
+        target = QRectF(left * size, top * size, (right - left) * size, (bottom - top) * size)
+
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        painter.drawImage(target, self.image, source)
+
+        # Draw the cell borders only when cells are large enough on screen
+        scale = painter.worldTransform().m11()
+        if size * scale >= self.minBorderSize:
+            painter.setPen(self.borderPen)
+            lines = [QLineF(col * size, target.top(), col * size, target.bottom()) for col in range(left, right + 1)]
+            lines += [QLineF(target.left(), row * size, target.right(), row * size) for row in range(top, bottom + 1)]
+            painter.drawLines(lines)
@@ -0,0 +1,49 @@
+"""
+This module contains the ScenarioFile class, which streams the scenarios of the Moving AI grid benchmarks.
+"""
+
+from collections import namedtuple
+
+# One start/goal query of a scenario file, with cells given as (row, col)
+Scenario = namedtuple('Scenario', ['bucket', 'map', 'rows', 'cols', 'start', 'end', 'optimalLength'])
+
+class ScenarioFile:
+    """
+    Reader of the .scen files of the Moving AI grid benchmarks.
+
+    A scenario file starts with a 'version 1' line, followed by one tab-separated
+    line per query:
+        bucket  map  width  height  start-x  start-y  goal-x  goal-y  optimal-length
+
+    x is the column and y the row of a cell. The optimal length is the one of
+    octile movement (diagonal steps cost sqrt(2), no corner cutting). Scenario
+    files hold thousands of queries, so they are read lazily, one line at a time.
+
+    Attributes:
+        path (str): The path of the file.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __iter__(self):
+        """
+        Iterate over the scenarios of the file, reading it line by line.
+
+        Yields:
+            Scenario: the next scenario.
+
+        Raises:
+            ValueError: if a line is not a valid scenario.
+        """
+        with open(self.path, 'r') as file:
+            for number, line in enumerate(file, 1):
+                fields = line.rstrip('\r\n').split('\t')
+                if number == 1 and line.startswith('version'):
+                    continue
+                if not line.strip():
+                    continue
+                if len(fields) != 9:
+                    raise ValueError(f"Line {number} of {self.path} is not a valid scenario")
+                bucket, map_name, width, height, start_x, start_y, goal_x, goal_y, length = fields
+                yield Scenario(int(bucket), map_name, int(height), int(width), (int(start_y), int(start_x)),
+                               (int(goal_y), int(goal_x)), float(length))
@@ -4,10 +4,11 @@ Module for defining the main window of the application.
 """
 import os
 
-from PyQt5.QtWidgets import QMainWindow, QPushButton, QDialog, QMessageBox, QSlider
+from PyQt5.QtWidgets import QMainWindow, QPushButton, QDialog, QMessageBox, QSlider, QCheckBox, QComboBox
 from PyQt5.QtCore import pyqtSlot, Qt
 
 from src.grid.GridWidget import GridWidget
+from src.grid.GridModel import GridModel
 
 from src.eventHandlers.WindowEventHandler import WindowEventHandler
 
@@ -18,6 +19,14 @@ from src.solvers.AStarSearch import AStarSearch
 from src.solvers.GBFSearch import GBFSearch
 from src.solvers.JumpPointSearch import JumpPointSearch
 from src.solvers.BidirectionalSearch import BidirectionalSearch
+from src.solvers.DistanceFieldSearch import DistanceFieldSearch
+from src.solvers.DStarLiteSearch import DStarLiteSearch
+from src.solvers.HPAStarSearch import HPAStarSearch
+from src.solvers.ALTSearch import ALTSearch
+from src.solvers.BidirectionalAStarSearch import BidirectionalAStarSearch
+from src.solvers.IDAStarSearch import IDAStarSearch
+from src.solvers.FringeSearch import FringeSearch
+from src.solvers.SMAStarSearch import SMAStarSearch
 
 from src.dialogs.AlgorithmSelectionDialog import AlgorithmSelectionDialog
 from src.dialogs.ResetDialog import ResetDialog
@@ -34,6 +43,22 @@ class GridWindow(QMainWindow):
     Args:
         QMainWindow: The QMainWindow class provides a framework for building an application's user interface.
     """
+
+    # Brushes of the right mouse button: label and movement cost painted, None placing obstacles
+    brushes = [
+        ('Obstacles', None),
+        ('Terrain 1 (clear)', 1),
+        ('Terrain 2', 2),
+        ('Terrain 5', 5),
+        ('Terrain 10', 10)
+    ]
+
+    # Movements of the searches: label and (connectivity, corner-cutting policy) of the grid
+    movements = [
+        ('4 directions', (4, 'never')),
+        ('8 directions', (8, 'never')),
+        ('8, cutting corners', (8, 'one'))
+    ]
     
     def __init__(self) -> None:
         super().__init__()
@@ -53,6 +78,12 @@ class GridWindow(QMainWindow):
             - Solve button for starting the selected algorithm.
             - Reset button for resetting the grid.
             - Speed control slider for controlling the speed of the algorithm.
+            - Instant check box for showing the result of the algorithm at once.
+            - Save and open buttons for writing the grid to and reading it from a grid file.
+            - Pause and step buttons for pausing, resuming and stepping through the current search.
+            - Worker check box for running the searches in a separate process.
+            - Brush combo box for painting obstacles or terrain costs with the right mouse button.
+            - Movement combo box for letting the searches move diagonally.
         """
         # Initialize grid widget
         self.gridWidget = GridWidget(rows=30, cols=40, cell_size=45)
@@ -77,6 +108,56 @@ class GridWindow(QMainWindow):
         self.speedSlider.setValue(50)  # Default value
         self.speedSlider.setGeometry(230, 10, 150, 30)
         self.speedSlider.valueChanged.connect(self.eventHandler.changeSpeed)
+
+        # Initialize instant check box
+        self.instantCheckBox = QCheckBox('Instant', self)
+        self.instantCheckBox.setObjectName('instantCheckBox')
+        self.instantCheckBox.setGeometry(390, 10, 100, 30)
+        self.instantCheckBox.stateChanged.connect(self.eventHandler.changeSpeed)
+
+        # Initialize save and open buttons
+        saveButton = QPushButton('Save', self)
+        saveButton.setObjectName('saveButton')
+        saveButton.clicked.connect(self.eventHandler.saveClicked)
+        saveButton.setGeometry(500, 10, 100, 30)
+
+        openButton = QPushButton('Open', self)
+        openButton.setObjectName('openButton')
+        openButton.clicked.connect(self.eventHandler.openClicked)
+        openButton.setGeometry(610, 10, 100, 30)
+
+        # Initialize pause and step buttons
+        self.pauseButton = QPushButton('Pause', self)
+        self.pauseButton.setObjectName('pauseButton')
+        self.pauseButton.clicked.connect(self.eventHandler.pauseClicked)
+        self.pauseButton.setGeometry(720, 10, 100, 30)
+
+        stepButton = QPushButton('Step', self)
+        stepButton.setObjectName('stepButton')
+        stepButton.clicked.connect(self.eventHandler.stepClicked)
+        stepButton.setGeometry(830, 10, 100, 30)
+
+        # Initialize worker process check box
+        self.workerCheckBox = QCheckBox('Worker process', self)
+        self.workerCheckBox.setObjectName('workerCheckBox')
+        self.workerCheckBox.setGeometry(940, 10, 130, 30)
+        self.workerCheckBox.stateChanged.connect(self.eventHandler.changeWorker)
+
+        # Initialize brush combo box
+        self.brushComboBox = QComboBox(self)
+        self.brushComboBox.setObjectName('brushComboBox')
+        for label, cost in self.brushes:
+            self.brushComboBox.addItem(label, cost)
+        self.brushComboBox.setGeometry(1080, 10, 140, 30)
+        self.brushComboBox.currentIndexChanged.connect(self.eventHandler.changeBrush)
+
+        # Initialize movement combo box
+        self.movementComboBox = QComboBox(self)
+        self.movementComboBox.setObjectName('movementComboBox')
+        for label, movement in self.movements:
+            self.movementComboBox.addItem(label, movement)
+        self.movementComboBox.setGeometry(1230, 10, 170, 30)
+        self.movementComboBox.currentIndexChanged.connect(self.eventHandler.changeMovement)
         
         self.applyStylesheet(solveButton, 'src/styles.qss')
         
@@ -93,26 +174,55 @@ class GridWindow(QMainWindow):
             'astar': AStarSearch,
             'gbfs': GBFSearch,
             'jps': JumpPointSearch,
-            'bisearch': BidirectionalSearch
+            'bisearch': BidirectionalSearch,
+            'field': DistanceFieldSearch,
+            'dstar': DStarLiteSearch,
+            'hpa': HPAStarSearch,
+            'alt': ALTSearch,
+            'biastar': BidirectionalAStarSearch,
+            'ida': IDAStarSearch,
+            'fringe': FringeSearch,
+            'sma': SMAStarSearch
         }
         
         self.algorithmToInstanceMap = {}
         for name, cls in algorithmToClassMap.items():
             instance = cls(self.gridWidget)
-            instance.updateCellState.connect(self.gridWidget.setCellState)
+            instance.updateCells.connect(self.gridWidget.queueCellStates)
             instance.noPathFound.connect(self.eventHandler.noPathFoundHandler)
             self.algorithmToInstanceMap[name] = instance
         
         self.currentSearch = None # keeps track of current algorithm
+        self.eventHandler.changeSpeed()
+        self.eventHandler.changeWorker()
         
+    def loadGrid(self, model: GridModel) -> None:
+        """
+        Replace the grid by a grid model, e.g. one loaded from a grid file.
+
+        A new grid widget is built around the model, with cells small enough for
+        large grids to fit on screen, and the path finders are created again for it.
+
+        Args:
+            model (GridModel): The grid model to show.
+        """
+        self.stopCurrentSearch()
+        cell_size = max(1, min(45, 1800 // max(model.rows, model.cols, 1)))
+        self.gridWidget = GridWidget(model.rows, model.cols, cell_size, model=model)
+        self.setCentralWidget(self.gridWidget)
+        # Keep the buttons above the new grid widget
+        self.gridWidget.lower()
+        self.eventHandler.changeBrush()
+        self.eventHandler.changeMovement()
+        self.initAlgorithms()
+
     @pyqtSlot()
     def closeEvent(self, event) -> None:
         """
         Handle the close event for the window.
         
         This method is called when the window recieves a close event. It stops 
-        the thread on which the current search algorithm is running and accepts the
-        event to close the window.
+        the current search algorithm and accepts the event to close the window.
 
         Args:
             event: The close event to be handled.
@@ -127,6 +237,7 @@ class GridWindow(QMainWindow):
         if self.currentSearch and self.currentSearch.isRunning():
             self.currentSearch.stopSearch()
         self.currentSearch = None
+        self.pauseButton.setText('Pause')
         
     def applyStylesheet(self, widget, stylesheet_path) -> None:
         """
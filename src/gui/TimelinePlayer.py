@@ -0,0 +1,181 @@
+"""
+This module contains the TimelinePlayer class, which animates the timeline of a search on the grid.
+"""
+
+import time
+from array import array
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+class TimelinePlayer(QObject):
+    """
+    Class that animates a timeline of cell updates.
+
+    The expanded cells and the path of a search are turned into a timeline of
+    (index, state code) events, which the player reads from an iterator of
+    batches while it plays them. The iterator is usually a generator stepping
+    through the search, so the search advances from the QTimer of the player,
+    in the GUI thread, only as far as the animation needs: a number of cells per
+    frame, or as many as fit in a time slice per frame when playing instantly.
+    The cells of a frame are emitted as a single batch.
+
+    Since nothing runs between two frames, playing can be paused, resumed, or
+    advanced one cell at a time, and always shows the same sequence of cells.
+    An empty batch means that no events are ready yet, e.g. while a worker
+    process is searching, and ends the reading for the current frame.
+
+    Attributes:
+        timer (QTimer): The timer which drives the animation, once per frame.
+        source (Iterator): The batches of (indices, codes) still to be read, None once exhausted.
+        indices (array): The flat indices of the cells read but not played yet.
+        codes (bytearray): The state code of every event read but not played yet.
+        cellsPerFrame (float): The number of events played per frame, 0 meaning instant.
+        isBackedUp (Callable): Optional callable which returns True while the grid is
+            still drawing earlier frames, in which case the player waits.
+
+    Args:
+        QObject: The QObject class is the base class of all Qt objects.
+    """
+
+    # Emitted once per frame with an array('i') of cell indices and a bytearray of state codes
+    updateCells = pyqtSignal(object, object)
+    finished = pyqtSignal()
+
+    # Interval between two frames of the animation, in milliseconds
+    frameInterval = 16
+
+    # Time spent reading the timeline per frame when playing instantly, in seconds
+    instantSlice = 0.010
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.frameInterval)
+        self.timer.timeout.connect(self.advance)
+        self.source = None
+        self.indices = array('i')
+        self.codes = bytearray()
+        self.cellsPerFrame = 1.0
+        self.isBackedUp = None
+        self._budget = 0.0
+
+    def setCellsPerFrame(self, cellsPerFrame: float) -> None:
+        """
+        Set the number of cells updated per frame.
+
+        Args:
+            cellsPerFrame (float): cells per frame, can be fractional. 0 plays
+                the timeline as fast as it can be read.
+        """
+        self.cellsPerFrame = cellsPerFrame
+
+    def play(self, batches) -> None:
+        """
+        Start playing a timeline.
+
+        Args:
+            batches (Iterable): The (indices, codes) batches of the timeline, an array('i')
+                of flat cell indices and a bytearray of their state codes each.
+        """
+        self.source = iter(batches)
+        self.indices = array('i')
+        self.codes = bytearray()
+        self._budget = 0.0
+        self.timer.start()
+
+    def stop(self) -> None:
+        """
+        Stop playing the current timeline, dropping the events not played yet.
+        """
+        self.timer.stop()
+        self.source = None
+        self.indices = array('i')
+        self.codes = bytearray()
+
+    def pause(self) -> None:
+        """
+        Pause the current timeline, keeping its position.
+        """
+        self.timer.stop()
+
+    def resume(self) -> None:
+        """
+        Resume a paused timeline.
+        """
+        if self.isActive():
+            self.timer.start()
+
+    def step(self) -> None:
+        """
+        Play the next event of a paused timeline.
+        """
+        if self.isActive() and not self.timer.isActive():
+            self.playEvents(1)
+
+    def isActive(self) -> bool:
+        """
+        Check whether a timeline is being played, even if it is paused.
+
+        Returns:
+            bool: True if events remain to be played, otherwise False.
+        """
+        return self.source is not None or len(self.indices) > 0
+
+    def isPaused(self) -> bool:
+        """
+        Check whether the current timeline is paused.
+
+        Returns:
+            bool: True if events remain to be played but the timer is stopped, otherwise False.
+        """
+        return self.isActive() and not self.timer.isActive()
+
+    def advance(self) -> None:
+        """
+        Play the events of one frame.
+
+        Called on every timeout of the timer. Fractional speeds are accumulated
+        between frames, so that e.g. 0.5 cells per frame updates a cell every
+        second frame. Nothing is played while the grid is backed up.
+        """
+        if self.isBackedUp is not None and self.isBackedUp():
+            return
+
+        if self.cellsPerFrame <= 0:
+            self.playEvents(None)
+        else:
+            self._budget += self.cellsPerFrame
+            count = int(self._budget)
+            self._budget -= count
+            self.playEvents(count)
+
+    def playEvents(self, count: int) -> None:
+        """
+        Read the timeline as far as needed and play up to count events.
+
+        Args:
+            count (int): The number of events to play, None for as many as can be
+                read within instantSlice.
+        """
+        deadline = time.perf_counter() + self.instantSlice
+        while self.source is not None and (len(self.indices) < count if count is not None
+                                           else time.perf_counter() < deadline):
+            try:
+                indices, codes = next(self.source)
+            except StopIteration:
+                self.source = None
+                break
+            if not indices:
+                break
+            self.indices.extend(indices)
+            self.codes.extend(codes)
+
+        end = len(self.indices) if count is None else min(count, len(self.indices))
+        if end > 0:
+            self.updateCells.emit(self.indices[:end], self.codes[:end])
+            del self.indices[:end]
+            del self.codes[:end]
+
+        if not self.isActive():
+            self.timer.stop()
+            self.finished.emit()
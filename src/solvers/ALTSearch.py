@@ -0,0 +1,20 @@
+"""
+This module contains the implementation of the A* search algorithm with the landmark (ALT) heuristic.
+"""
+
+from src.solvers.AStarSearch import AStarSearch
+from src.engine.LandmarkTable import LandmarkTable
+
+class ALTSearch(AStarSearch):
+    """
+    A* search algorithm guided by landmarks (ALT).
+
+    The distances from a few landmark cells to every cell are computed once per
+    version of the obstacles, and bound the distance between any two cells from
+    below much more tightly than the Manhattan distance on mazes and maps with
+    long walls, so A* expands far fewer cells there.
+
+    Args:
+        AStarSearch: The A* search algorithm.
+    """
+    heuristicClass = LandmarkTable
@@ -3,47 +3,101 @@ This module contains the BaseSearch class which is the base class for all search
 """
 
 import time
-import threading
-from PyQt5.QtCore import pyqtSignal, QObject
+from array import array
+from typing import Iterator
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QObject
+
+from src.grid.GridModel import GridModel, START, END, CHECKED, PATH, ABSTRACT
+from src.engine.SearchResult import SearchResult
+from src.engine.SearchState import SearchState
+from src.engine.SearchWorker import SearchWorker
+from src.gui.TimelinePlayer import TimelinePlayer
 
 class BaseSearch(QObject):
     """
     Base class for all search algorithms.
-    
-    The BaseSearch class contains all methods which are shared by all
-    search algorithms. The class is inherited by all search algorithms
-    and provides a common interface for starting, stopping and checking
-    the status of the search algorithms.
+
+    The BaseSearch class is an adapter between the headless search engines
+    in src.engine and the grid widget. It takes a snapshot of the grid and
+    steps through the search of the engine of the algorithm with a generator,
+    which turns the cells expanded every few steps into a timeline of cell
+    updates. A TimelinePlayer reads that timeline from its QTimer, so the search
+    only advances as fast as it is animated onto the grid, through the batched
+    updateCells signal, and everything runs in the GUI thread. The class is
+    inherited by all search algorithms, which only need to set their engine
+    class, and provides a common interface for starting, stopping, pausing,
+    stepping and checking the status of the search algorithms.
+
+    Searches can also run in a SearchWorker process instead, which keeps heavy
+    searches on big grids from holding the GIL of the GUI. The player then
+    receives the cells of the search from the worker as they come.
 
     Attributes:
         gridWidget (GridWidget): The grid widget object.
         rows (int): The number of rows in the grid.
         cols (int): The number of columns in the grid.
-        cells (list): The 2D list of cells in the grid.
-        _stop_event (threading.Event): The event object to stop the search.
-        delay (float): The delay between cell updates.
+        model (GridModel): The grid model of the grid widget.
+        components (ComponentIndex): The live component index of the grid model.
+        engineClass (type): The search engine class which implements the algorithm.
+        openListClass (type): Optional open list class overriding the one of the engine.
+        heuristicClass (type): Optional heuristic provider overriding the Manhattan distance,
+            built for each grid snapshot with its forGrid class method, or over the first
+            steps of the timeline with its stepsForGrid class method, e.g. LandmarkTable.
+        player (TimelinePlayer): The player which steps through and animates a search.
+        result (SearchResult): The result of the current or last search, None before it starts.
+        useWorker (bool): Whether to run the searches in a worker process, when the solver supports it.
     """
-    
-    updateCellState = pyqtSignal(int, int, str)
+
+    # Emitted with an array('i') of cell indices and a bytearray of their new state codes
+    updateCells = pyqtSignal(object, object)
     noPathFound = pyqtSignal()
 
+    # Number of engine steps run between two batches of cell updates
+    stepsPerBatch = 64
+
+    # Longest time spent running the steps of one batch, in seconds, so that steps
+    # which expand no cells, e.g. those building a JumpTable, are spread over frames
+    batchSlice = 0.010
+
+    engineClass = None
+    openListClass = None
+    heuristicClass = None
+
+    # Solvers which keep engine state between searches in this process turn this off
+    supportsWorker = True
+
     def __init__(self, gridWidget) -> None:
         super().__init__()
         self.gridWidget = gridWidget
         self.rows = gridWidget.rows
         self.cols = gridWidget.cols
-        self.cells = gridWidget.cells
-        self._stop_event = threading.Event()
-        self.delay = 0.05
+        self.model = gridWidget.model
+        self.components = gridWidget.components
+        self.result = None
+        self.useWorker = False
 
-    def setDelay(self, speed) -> None:
+        self.player = TimelinePlayer(self)
+        self.player.isBackedUp = gridWidget.updateBuffer.isFull
+        self.player.updateCells.connect(self.updateCells)
+        self.player.finished.connect(self.onPlaybackFinished)
+
+    def setCellsPerFrame(self, cellsPerFrame: float) -> None:
         """
-        Set the delay between cell updates.
+        Set the speed at which the result of a search is animated.
 
         Args:
-            speed: The speed of the search algorithm.
+            cellsPerFrame (float): The number of cells updated per frame, 0 meaning instant.
+        """
+        self.player.setCellsPerFrame(cellsPerFrame)
+
+    def snapshotGrid(self) -> GridModel:
         """
-        self.delay = 1 / speed
+        Take a snapshot of the states of the cells in the grid.
+
+        Returns:
+            GridModel: a copy of the grid model.
+        """
+        return self.model.copy()
 
     def findStartEnd(self) -> tuple:
         """
@@ -52,58 +106,240 @@ class BaseSearch(QObject):
         Returns:
             tuple: The row and column indices of the start and end cells.
         """
-        start = end = None
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.cells[row][col].getState() == 'start':
-                    start = (row, col)
-                elif self.cells[row][col].getState() == 'end':
-                    end = (row, col)
-        return start, end
+        return self.model.findStartEnd()
+
+    def createEngine(self, grid: GridModel):
+        """
+        Create the search engine for a grid snapshot.
+
+        Args:
+            grid (GridModel): The snapshot of the grid to search on.
+
+        Returns:
+            BaseEngine: the engine which runs the search.
+        """
+        state = self.sharedState() if self.engineClass.usesState else None
+        return self.engineClass(grid, openListClass=self.openListClass, state=state,
+                                heuristic=self.createHeuristic(grid))
+
+    def sharedState(self) -> SearchState:
+        """
+        Get the per-cell arrays of the engines, shared by the solvers of the grid
+        widget, since only one search plays at a time. They are allocated by the
+        first search which needs them, so that solvers which never run, and those
+        whose engines keep no SearchState, cost no memory.
+
+        Returns:
+            SearchState: the search state of the grid widget.
+        """
+        widget = self.gridWidget
+        if widget.searchState is None or widget.searchState.size != self.rows * self.cols:
+            widget.searchState = SearchState(self.rows * self.cols)
+        return widget.searchState
+
+    def createHeuristic(self, grid: GridModel):
+        """
+        Get the heuristic of the engine for a grid snapshot.
+
+        Args:
+            grid (GridModel): The snapshot of the grid to search on.
+
+        Returns:
+            Callable: the heuristic provided by heuristicClass, or None for the default one.
+        """
+        if self.heuristicClass is None:
+            return None
+        return self.heuristicClass.forGrid(grid).heuristic
+
+    def prepareHeuristic(self, grid: GridModel) -> Iterator:
+        """
+        Build the heuristic of the engine for a grid snapshot one step at a time,
+        so that createHeuristic finds it in the cache of heuristicClass.
+
+        Args:
+            grid (GridModel): The snapshot of the grid to search on.
+
+        Yields:
+            the steps of the build, nothing if there is no heuristicClass or its
+                provider for the grid is cached.
+        """
+        if self.heuristicClass is not None:
+            yield from self.heuristicClass.stepsForGrid(grid)
+
+    def searchSteps(self, grid: GridModel, result: SearchResult) -> Iterator:
+        """
+        Step through the preprocessing of the heuristic, then the search itself.
+
+        Args:
+            grid (GridModel): The snapshot of the grid to search on.
+            result (SearchResult): The result to fill in.
+
+        Yields:
+            the steps of the heuristic build, then those of the engine.
+        """
+        yield from self.prepareHeuristic(grid)
+        engine = self.createEngine(grid)
+        # startSearch already checked reachability against the live component index
+        engine.checkReachability = False
+        yield from engine.steps(result)
 
-    def tracePath(self, parent, end, start) -> None:
+    def timeline(self, grid: GridModel, start: tuple, end: tuple) -> Iterator[tuple]:
         """
-        Trace the path from the end cell to the start cell
+        Step through a search on a grid snapshot, as a timeline of cell updates.
+
+        The heuristic and the engine are only built by the steps of the timeline
+        (see searchSteps), so that their preprocessing, e.g. the landmarks of the
+        ALT heuristic, runs from the player over many frames rather than in
+        startSearch.
 
         Args:
-            parent (dict): A dictionary mapping each cell to its predecessor 
-                       in the path, used to reconstruct the path.
+            grid (GridModel): The snapshot of the grid to search on.
+            start (tuple): Coordinates of the start cell (row, col).
             end (tuple): Coordinates of the end cell (row, col).
+
+        Yields:
+            tuple: batches of an array('i') of cell indices and a bytearray of state codes,
+                the abstract nodes and cells expanded every stepsPerBatch steps, or every
+                batchSlice seconds, then the path. A batch of steps which expanded no
+                cells yields an empty batch, which ends the frame of the player.
+        """
+        result = self.result = SearchResult(start, end)
+        steps = self.searchSteps(grid, result)
+        abstract = expanded = 0
+        finished = False
+        while not finished:
+            finished = True
+            deadline = time.perf_counter() + self.batchSlice
+            for count, _ in enumerate(steps, 1):
+                if count == self.stepsPerBatch or time.perf_counter() > deadline:
+                    finished = False
+                    break
+            if len(result.abstractExpanded) > abstract:
+                yield self.cellUpdates(result.abstractExpanded[abstract:], ABSTRACT)
+                abstract = len(result.abstractExpanded)
+            if len(result.expanded) > expanded:
+                yield self.cellUpdates(result.expanded[expanded:], CHECKED)
+                expanded = len(result.expanded)
+            elif not finished:
+                yield array('i'), bytearray()
+        yield self.cellUpdates(result.path, PATH)
+
+    def workerTimeline(self, start: tuple, end: tuple) -> Iterator[tuple]:
+        """
+        Run a search in a worker process, as a timeline of cell updates.
+
+        The worker is started on the first step, with the current states of the grid,
+        and is terminated when the timeline is exhausted or dropped, e.g. by stopSearch.
+
+        Args:
             start (tuple): Coordinates of the start cell (row, col).
+            end (tuple): Coordinates of the end cell (row, col).
+
+        Yields:
+            tuple: batches of an array('i') of cell indices and a bytearray of state codes,
+                empty while the worker has not sent new cells.
         """
-        current = end
-        while current and not self._stop_event.is_set():
-            row, col = current
-            if current != end and current != start:
-                self.updateCellState.emit(row, col, 'path')
-            current = parent[current]
-            time.sleep(0.1)
+        model = self.model
+        worker = SearchWorker(self.rows, self.cols, model.states, start, end, self.engineClass,
+                              self.openListClass, self.heuristicClass, model.costs,
+                              (model.connectivity, model.cornerCutting, model.diagonalCost))
+        self.result = worker.result
+        try:
+            while not worker.finished:
+                batches = worker.receive()
+                if not batches:
+                    yield array('i'), bytearray()
+                for code, cells in batches:
+                    yield self.cellUpdates(cells, code)
+        finally:
+            worker.stop()
 
-    def startSearch(self, algorithm) -> None:
+    def cellUpdates(self, cells, code: int) -> tuple:
         """
-        Start the search algorithm in a separate thread.
+        Turn cells of a search into a batch of cell updates.
+
+        The start and end cells are left out, so that they keep their state.
 
         Args:
-            algorithm (Callable): The search function to be executed in a new thread.
+            cells (list): The indices of the cells.
+            code (int): The state code the cells are given.
+
+        Returns:
+            tuple: an array('i') of cell indices and a bytearray of state codes.
+        """
+        states = self.model.states
+        indices = array('i', (index for index in cells if states[index] not in (START, END)))
+        return indices, bytearray([code]) * len(indices)
+
+    @pyqtSlot()
+    def onPlaybackFinished(self) -> None:
+        """
+        Report a missing path once the animation of the search is over.
+        """
+        if self.result is not None and not self.result.found:
+            self.noPathFound.emit()
+
+    def startSearch(self) -> None:
+        """
+        Start the search algorithm.
+
+        The snapshot of the grid is taken when the search starts, so that editing
+        the grid while the search is animated does not affect it. With useWorker,
+        the snapshot is the shared memory of the worker process. When the start
+        and end cells are in different components of the grid, no search is
+        started and the missing path is reported at once.
         """
-        self._stop_event.clear()
-        self.search_thread = threading.Thread(target=algorithm)
-        self.search_thread.start()
+        self.player.stop()
+        self.result = None
+        start, end = self.findStartEnd()
+        if not start or not end:
+            return
+        if not self.components.connected(self.model.index(*start), self.model.index(*end)):
+            self.noPathFound.emit()
+            return
+        if self.useWorker and self.supportsWorker:
+            self.player.play(self.workerTimeline(start, end))
+        else:
+            self.player.play(self.timeline(self.snapshotGrid(), start, end))
 
     def stopSearch(self) -> None:
         """
-        Stop the search algorithm by setting the stop event
-            and joining the search thread if it is alive.
+        Stop the search algorithm and its animation.
+        """
+        self.player.stop()
+
+    def pauseSearch(self) -> None:
+        """
+        Pause the search algorithm, which stays where it is until resumed or stepped.
+        """
+        self.player.pause()
+
+    def resumeSearch(self) -> None:
+        """
+        Resume a paused search algorithm.
+        """
+        self.player.resume()
+
+    def stepSearch(self) -> None:
+        """
+        Show the next cell of a paused search algorithm.
         """
-        self._stop_event.set()
-        if self.search_thread and self.search_thread.is_alive():
-            self.search_thread.join()
+        self.player.step()
 
     def isRunning(self) -> bool:
         """
         Check if the search algorithm is currently running.
 
         Returns:
-            bool: True if the search thread is alive, otherwise False.
+            bool: True if the search is being stepped through and animated, even if paused, otherwise False.
+        """
+        return self.player.isActive()
+
+    def isPaused(self) -> bool:
+        """
+        Check if the search algorithm is paused.
+
+        Returns:
+            bool: True if the search is paused, otherwise False.
         """
-        return self.search_thread and self.search_thread.is_alive()
+        return self.player.isPaused()
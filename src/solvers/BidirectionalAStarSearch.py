@@ -0,0 +1,19 @@
+"""
+This module contains the implementation of the bidirectional A* search algorithm.
+"""
+
+from src.solvers.BaseSearch import BaseSearch
+from src.engine.BidirectionalAStarEngine import BidirectionalAStarEngine
+
+class BidirectionalAStarSearch(BaseSearch):
+    """
+    Bidirectional A* search algorithm.
+
+    Runs an A* search from the source node towards the destination node and
+    another one from the destination node towards the source node, and stops as
+    soon as the path through their meeting point is proven to be the cheapest.
+
+    Args:
+        BaseSearch: Base class for all search algorithms.
+    """
+    engineClass = BidirectionalAStarEngine
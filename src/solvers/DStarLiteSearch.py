@@ -0,0 +1,46 @@
+"""
+This module contains the implementation of the D* Lite incremental search algorithm.
+"""
+
+from src.solvers.IncrementalSearch import IncrementalSearch
+from src.engine.DStarLiteEngine import DStarLiteEngine
+
+class DStarLiteSearch(IncrementalSearch):
+    """
+    D* Lite search algorithm.
+
+    Unlike the other solvers, which search every snapshot of the grid from
+    scratch, this solver keeps a single D* Lite engine alive. The grid model
+    notifies it of every cell which becomes or stops being an obstacle, and
+    the next search hands these cells to the engine, which only repairs the
+    part of its search tree they affect. Only the repaired cells are shown
+    as checked.
+
+    Attributes:
+        engine (DStarLiteEngine): The engine kept between searches, None before the first one.
+
+    Args:
+        IncrementalSearch: base class for the search algorithms which keep state between searches.
+    """
+    engineClass = DStarLiteEngine
+
+    def __init__(self, gridWidget) -> None:
+        super().__init__(gridWidget)
+        self.engine = None
+
+    def updateEngine(self, grid, changedCells: list):
+        """
+        Returns the engine kept between searches, updated to a new grid snapshot.
+
+        Args:
+            grid (GridModel): The snapshot of the grid to search on.
+            changedCells (list): The cells whose obstacles changed since the last search.
+
+        Returns:
+            DStarLiteEngine: the engine which runs the search.
+        """
+        if self.engine is None:
+            self.engine = self.engineClass(grid)
+        else:
+            self.engine.updateGrid(grid, changedCells)
+        return self.engine
@@ -0,0 +1,19 @@
+"""
+This module contains the implementation of the distance field search.
+"""
+
+from src.solvers.BaseSearch import BaseSearch
+from src.engine.FieldEngine import FieldEngine
+
+class DistanceFieldSearch(BaseSearch):
+    """
+    Distance field search algorithm.
+
+    The distance from every cell to the end cell is computed once with a reverse
+    BFS and cached, so moving the start cell and solving again only follows the
+    distances down to the end cell, until the obstacles or the end cell change.
+
+    Args:
+        BaseSearch: base class for all search algorithms.
+    """
+    engineClass = FieldEngine
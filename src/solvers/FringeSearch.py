@@ -0,0 +1,19 @@
+"""
+This module contains the implementation of the Fringe Search algorithm.
+"""
+
+from src.solvers.BaseSearch import BaseSearch
+from src.engine.FringeSearchEngine import FringeSearchEngine
+
+class FringeSearch(BaseSearch):
+    """
+    Fringe Search algorithm.
+
+    Fringe Search expands the cells below an f_cost threshold like IDA*, but
+    keeps its fringe between two thresholds in two plain lists, instead of the
+    priority queue of A*.
+
+    Args:
+        BaseSearch: The base class for all search algorithms.
+    """
+    engineClass = FringeSearchEngine
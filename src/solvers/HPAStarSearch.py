@@ -0,0 +1,49 @@
+"""
+This module contains the implementation of hierarchical path finding (HPA*).
+"""
+
+from src.solvers.IncrementalSearch import IncrementalSearch
+from src.engine.HPAStarEngine import HPAStarEngine
+from src.engine.ClusterGraph import ClusterGraph
+
+class HPAStarSearch(IncrementalSearch):
+    """
+    Hierarchical A* (HPA*) search algorithm.
+
+    The solver keeps the abstract graph of the grid between searches. The grid
+    model notifies it of every cell which becomes or stops being an obstacle,
+    and the next search rebuilds only the clusters around these cells before
+    running. The abstract nodes expanded are shown in their own color, before
+    the cells expanded while refining the path.
+
+    Attributes:
+        graph (ClusterGraph): The abstract graph kept between searches, None before the first one.
+
+    Args:
+        IncrementalSearch: base class for the search algorithms which keep state between searches.
+    """
+    engineClass = HPAStarEngine
+
+    def __init__(self, gridWidget) -> None:
+        super().__init__(gridWidget)
+        self.graph = None
+
+    def updateEngine(self, grid, changedCells: list):
+        """
+        Create the engine for a grid snapshot, with the abstract graph updated to it.
+        The first graph is built by the engine, over the first steps of the search.
+
+        Args:
+            grid (GridModel): The snapshot of the grid to search on.
+            changedCells (list): The cells whose obstacles changed since the last search.
+
+        Returns:
+            HPAStarEngine: the engine which runs the search.
+        """
+        # A graph whose build was stopped is built again, for the new snapshot
+        if self.graph is None or not self.graph.complete:
+            self.graph = ClusterGraph(grid, build=False)
+        else:
+            self.graph.update(grid, changedCells)
+        return self.engineClass(grid, openListClass=self.openListClass, state=self.sharedState(),
+                                heuristic=self.createHeuristic(grid), graph=self.graph)
@@ -0,0 +1,19 @@
+"""
+This module contains the implementation of the IDA* search algorithm.
+"""
+
+from src.solvers.BaseSearch import BaseSearch
+from src.engine.IDAStarEngine import IDAStarEngine
+
+class IDAStarSearch(BaseSearch):
+    """
+    IDA* (Iterative Deepening A*) search algorithm.
+
+    IDA* repeats a depth-first search bounded by an f_cost threshold, raising
+    the threshold after every search, so it only keeps the current path and a
+    bounded table of the cells it reached, whatever the size of the grid.
+
+    Args:
+        BaseSearch: The base class for all search algorithms.
+    """
+    engineClass = IDAStarEngine
@@ -0,0 +1,78 @@
+"""
+This module contains the IncrementalSearch class, the base class of the solvers which keep state between searches.
+"""
+
+from src.solvers.BaseSearch import BaseSearch
+
+class IncrementalSearch(BaseSearch):
+    """
+    Base class for the search algorithms which keep state between searches.
+
+    Instead of searching every snapshot of the grid from scratch, these solvers
+    keep what they learned about the grid, e.g. a search tree or an abstract
+    graph, and only repair the part of it which the edits of the grid affect.
+    The grid model notifies the solver of every cell which becomes or stops
+    being an obstacle, and the next search hands these cells over to
+    updateEngine, the only method the subclasses implement, when it creates
+    its engine on its first step.
+
+    Attributes:
+        changedCells (list): The cells whose obstacles changed since the last search.
+
+    Args:
+        BaseSearch: base class for all search algorithms.
+    """
+
+    # The state kept between searches lives in this process
+    supportsWorker = False
+
+    def __init__(self, gridWidget) -> None:
+        super().__init__(gridWidget)
+        self.changedCells = []
+        self._pending = []
+        self.model.addListener(self.onObstaclesChanged)
+
+    def onObstaclesChanged(self, indices) -> None:
+        """
+        Record the cells which became or stopped being obstacles.
+
+        Args:
+            indices: flat indices of the changed cells.
+        """
+        self.changedCells.extend(indices)
+
+    def startSearch(self) -> None:
+        """
+        Start the search, handing the changed cells over to the engine it creates on its first step.
+        """
+        self._pending.extend(self.changedCells)
+        self.changedCells = []
+        super().startSearch()
+
+    def createEngine(self, grid):
+        """
+        Create the engine for a grid snapshot, with the state kept between searches updated to it.
+
+        Args:
+            grid (GridModel): The snapshot of the grid to search on.
+
+        Returns:
+            BaseEngine: the engine which runs the search.
+        """
+        engine = self.updateEngine(grid, self._pending)
+        self._pending = []
+        return engine
+
+    def updateEngine(self, grid, changedCells: list):
+        """
+        Update the state kept between searches with the cells changed since the
+        last search, creating it on the first search, and return the engine to run.
+
+        Args:
+            grid (GridModel): The snapshot of the grid to search on.
+            changedCells (list): The cells whose obstacles changed since the last search.
+
+        Returns:
+            BaseEngine: the engine which runs the search.
+        """
+        raise NotImplementedError
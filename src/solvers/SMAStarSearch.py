@@ -0,0 +1,18 @@
+"""
+This module contains the implementation of the SMA* search algorithm.
+"""
+
+from src.solvers.BaseSearch import BaseSearch
+from src.engine.SMAStarEngine import SMAStarEngine
+
+class SMAStarSearch(BaseSearch):
+    """
+    SMA* (Simplified Memory-bounded A*) search algorithm.
+
+    SMA* expands cells like A*, but holds a bounded number of nodes, and forgets
+    the least promising ones when it runs out, to generate them again if needed.
+
+    Args:
+        BaseSearch: The base class for all search algorithms.
+    """
+    engineClass = SMAStarEngine